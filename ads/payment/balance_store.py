@@ -4,57 +4,38 @@ RU: Персистентное хранилище баланса рекламы.
 
 from __future__ import annotations
 
-import json
-import os
-from pathlib import Path
-from typing import Any
-
-from kivy.app import App
+from data.store.user_store import BALANCE, user_store
 
 
 class BalanceStore:
-    """EN: JSON-backed balance store with atomic writes.
-    RU: JSON-хранилище баланса с атомарной записью.
+    """EN: Balance store backed by the consolidated user store.
+    RU: Хранилище баланса на основе единого пользовательского хранилища.
     """
 
-    def __init__(self) -> None:
-        """EN: Initialize path `<user_data_dir>/ads/payment/balance.json`.
-        RU: Инициализировать путь `<user_data_dir>/ads/payment/balance.json`.
-        """
-        app = App.get_running_app()
-        user_dir = Path(getattr(app, "user_data_dir", ".")) if app else Path(".")
-        self._base_dir = user_dir / "ads" / "payment"
-        self._balance_file = self._base_dir / "balance.json"
-
     def get_balance(self) -> float:
-        """EN: Return stored balance, 0.0 for missing/invalid file.
-        RU: Вернуть сохранённый баланс, 0.0 при отсутствии/ошибке файла.
+        """EN: Return stored balance, 0.0 for missing/invalid value.
+        RU: Вернуть сохранённый баланс, 0.0 при отсутствии/ошибке значения.
         """
-        if not self._balance_file.exists():
-            return 0.0
         try:
-            with self._balance_file.open("r", encoding="utf-8") as fh:
-                data: Any = json.load(fh)
-            return float(data.get("balance", 0.0))
-        except Exception:
+            return float(user_store.get(BALANCE, "balance", 0.0))
+        except (TypeError, ValueError):
             return 0.0
 
     def set_balance(self, value: float) -> None:
-        """EN: Set balance value with atomic JSON write.
-        RU: Установить значение баланса с атомарной JSON-записью.
+        """EN: Set balance value; written to disk in the background.
+        RU: Установить значение баланса; запись на диск идёт в фоне.
         """
-        self._base_dir.mkdir(parents=True, exist_ok=True)
-        tmp_file = self._balance_file.with_suffix(".tmp")
-        payload = {"balance": float(value)}
-        with tmp_file.open("w", encoding="utf-8") as fh:
-            json.dump(payload, fh, ensure_ascii=False)
-        os.replace(tmp_file, self._balance_file)
+        user_store.set(BALANCE, "balance", float(value))
 
     def add(self, delta: float) -> float:
-        """EN: Add delta to balance and return new value.
-        RU: Прибавить delta к балансу и вернуть новое значение.
+        """EN: Add delta to balance atomically and return new value.
+        RU: Атомарно прибавить delta к балансу и вернуть новое значение.
         """
-        new_value = self.get_balance() + float(delta)
-        self.set_balance(new_value)
-        return new_value
+        return user_store.mutate(BALANCE, "balance", lambda old: _as_float(old) + float(delta), 0.0)
+
 
+def _as_float(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
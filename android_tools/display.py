@@ -0,0 +1,27 @@
+"""EN: Display refresh rate helper for Android.
+RU: Вспомогательная функция частоты обновления дисплея для Android.
+"""
+
+from kivy.utils import platform as kivy_platform
+
+
+def display_refresh_rate():
+    """EN: Return the refresh rate of the activity display in Hz, or None.
+    RU: Вернуть частоту обновления дисплея активности в Гц или None.
+
+    EN: Returns None off Android or when the rate cannot be read, without
+    raising errors.
+    RU: Возвращает None вне Android или если частоту прочитать не удалось,
+    без выброса ошибок.
+    """
+    if kivy_platform != "android":
+        return None
+
+    try:
+        from jnius import autoclass
+
+        PythonActivity = autoclass("org.kivy.android.PythonActivity")
+        activity = PythonActivity.mActivity
+        return float(activity.getWindowManager().getDefaultDisplay().getRefreshRate())
+    except Exception:
+        return None
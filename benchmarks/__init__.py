@@ -0,0 +1,3 @@
+"""EN: Offline benchmark suite for engine hot paths (no GL context needed).
+RU: Офлайн-набор бенчмарков для горячих путей движка (без GL-контекста).
+"""
@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark cases for engine hot paths at several grid scales.
+
+EN: Each case is built from a scaled GameConfig and returns a zero-argument
+callable that performs one operation. Only Kivy-free engine modules are
+imported, so the cases run on a headless box without a GL context.
+RU: Каждый кейс строится из масштабированного GameConfig и возвращает
+вызываемый объект без аргументов, выполняющий одну операцию. Импортируются
+только модули движка без Kivy, поэтому кейсы работают на headless-машине
+без GL-контекста.
+"""
+
+from __future__ import annotations
+
+from engine.core.config import GameConfig
+from engine.core.game_state import GameState
+from engine.core.simulation_core import COLLISION_ROWS, SimulationCore
+from engine.core.tiles_model import TilesModel
+
+# EN: (NB_TILES, H_NB_LINES) pairs; the first one matches the shipped config.
+# RU: Пары (NB_TILES, H_NB_LINES); первая совпадает с конфигом релиза.
+SCALES = ((16, 15), (64, 30), (256, 60))
+
+VIEWPORT = (1280, 720)
+SEED = 1234
+
+
+def make_config(nb_tiles: int, h_nb_lines: int) -> GameConfig:
+    """
+    Return a GameConfig with overridden tile and line counts.
+
+    RU: Возвращает GameConfig с переопределённым числом тайлов и линий.
+    """
+    config = GameConfig()
+    config.NB_TILES = nb_tiles
+    config.H_NB_LINES = h_nb_lines
+    return config
+
+
+def make_simulation(config: GameConfig) -> SimulationCore:
+    """
+    Create a started, seeded simulation with the benchmark viewport.
+
+    RU: Создаёт запущенную симуляцию с фиксированным seed и размером окна.
+    """
+    sim = SimulationCore(config=config)
+    sim.set_viewport(*VIEWPORT)
+    sim.start(seed=SEED)
+    return sim
+
+
+def _frame_world_points(sim: SimulationCore) -> list:
+    """
+    Build the flat world points a renderer projects in one frame.
+
+    EN: Grid line endpoints plus four corners per tile.
+    RU: Строит плоский список мировых точек, проецируемых за кадр: концы
+    линий сетки и четыре угла каждого тайла.
+    """
+    config = sim.config
+    state = sim.state
+    width, height = VIEWPORT
+    ppx = sim.perspective.perspective_point_x
+    ppy = sim.perspective.perspective_point_y
+    points = []
+    start_index, end_index = sim.geometry.vertical_line_range(config)
+    for index in range(start_index, end_index + 1):
+        x = sim.geometry.get_line_x_from_index(index, width, ppx, state.current_offset_x, config)
+        points += (x, 0, x, height)
+    xmin = sim.geometry.get_line_x_from_index(start_index, width, ppx, state.current_offset_x, config)
+    xmax = sim.geometry.get_line_x_from_index(end_index, width, ppx, state.current_offset_x, config)
+    for index in range(config.H_NB_LINES):
+        y = sim.geometry.get_line_y_from_index(index, height, ppy, state.current_offset_y, config)
+        points += (xmin, y, xmax, y)
+    for i in range(config.NB_TILES):
+        tile_x, tile_y = sim.tiles.tiles_coordinates[i]
+        xmin, ymin, xmax, ymax = sim.geometry.get_tile_rect_world(
+            tile_x, tile_y, state, width, height, ppx, ppy, config
+        )
+        points += (xmin, ymin, xmin, ymax, xmax, ymax, xmax, ymin)
+    return points
+
+
+def case_transform_perspective(config: GameConfig):
+    """
+    Project one frame of vertices with per-vertex transform_perspective.
+
+    RU: Проецирует вершины одного кадра через transform_perspective по одной.
+    """
+    sim = make_simulation(config)
+    points = _frame_world_points(sim)
+    perspective = sim.perspective
+    height = VIEWPORT[1]
+    pairs = list(zip(points[0::2], points[1::2]))
+
+    def run():
+        for x, y in pairs:
+            perspective.transform_perspective(x, y, height)
+
+    return run
+
+
+def case_transform_batch(config: GameConfig):
+    """
+    Project one frame of vertices with a single transform_batch call.
+
+    RU: Проецирует вершины одного кадра одним вызовом transform_batch.
+    """
+    sim = make_simulation(config)
+    points = _frame_world_points(sim)
+    perspective = sim.perspective
+    height = VIEWPORT[1]
+
+    def run():
+        perspective.transform_batch(points, height)
+
+    return run
+
+
+def case_tile_rects(config: GameConfig):
+    """
+    Compute get_tile_rect_world for every visible tile.
+
+    RU: Вычисляет get_tile_rect_world для каждого видимого тайла.
+    """
+    sim = make_simulation(config)
+    geometry = sim.geometry
+    state = sim.state
+    width, height = VIEWPORT
+    ppx = sim.perspective.perspective_point_x
+    ppy = sim.perspective.perspective_point_y
+    tiles = list(sim.tiles.tiles_coordinates)[: config.NB_TILES]
+
+    def run():
+        for tile_x, tile_y in tiles:
+            geometry.get_tile_rect_world(tile_x, tile_y, state, width, height, ppx, ppy, config)
+
+    return run
+
+
+def case_tile_tables(config: GameConfig):
+    """
+    Rebuild the line tables and read every visible tile's corners from them.
+
+    RU: Перестраивает таблицы линий и берёт из них углы каждого видимого тайла.
+    """
+    sim = make_simulation(config)
+    geometry = sim.geometry
+    state = sim.state
+    width, height = VIEWPORT
+    ppx = sim.perspective.perspective_point_x
+    tiles = list(sim.tiles.tiles_coordinates)[: config.NB_TILES]
+    rows = tiles[-1][1] - state.current_y_loop + 1
+    offsets = (state.current_offset_y, state.current_offset_y + 1.0)
+    frame = [0]
+
+    def run():
+        frame[0] ^= 1
+        geometry.update_tables(width, height, ppx, state.current_offset_x, offsets[frame[0]], config, rows)
+        geometry.tile_world_points(tiles, len(tiles), state.current_y_loop)
+
+    return run
+
+
+def case_tiles_reset(config: GameConfig):
+    """
+    Rebuild the path from scratch via reset (prefill + extend_to_limit).
+
+    RU: Перестраивает путь с нуля через reset (prefill + extend_to_limit).
+    """
+    model = TilesModel(seed=SEED)
+    state = GameState()
+
+    def run():
+        model.reset(state, config)
+
+    return run
+
+
+def case_tiles_advance_row(config: GameConfig):
+    """
+    Advance one row: prune_passed_tiles followed by extend_to_limit.
+
+    RU: Продвигает один ряд: prune_passed_tiles и затем extend_to_limit.
+    """
+    model = TilesModel(seed=SEED)
+    state = GameState()
+    model.reset(state, config)
+
+    def run():
+        state.current_y_loop += 1
+        model.prune_passed_tiles(state)
+        model.extend_to_limit(config)
+
+    return run
+
+
+def case_collision(config: GameConfig):
+    """
+    Run get_ship_points_on_tiles for the current ship triangle.
+
+    RU: Выполняет get_ship_points_on_tiles для текущего треугольника корабля.
+    """
+    sim = make_simulation(config)
+    width, height = VIEWPORT
+    ship_points = sim.ship.compute_world_points(width, height, config)
+    ppx = sim.perspective.perspective_point_x
+    ppy = sim.perspective.perspective_point_y
+    sim.geometry.update_tables(
+        width, height, ppx, sim.state.current_offset_x, sim.state.current_offset_y, config, COLLISION_ROWS
+    )
+
+    def run():
+        sim.collision.get_ship_points_on_tiles(
+            ship_points,
+            sim.tiles.row_index,
+            sim.geometry,
+            sim.state,
+            width,
+            height,
+            config,
+            ppx,
+            ppy,
+        )
+
+    return run
+
+
+def case_motion_step(config: GameConfig):
+    """
+    Run RoadMotionEngine.step for one fixed simulation step.
+
+    RU: Выполняет RoadMotionEngine.step для одного фиксированного шага.
+    """
+    sim = make_simulation(config)
+    state = GameState()
+    state.current_speed_x = config.SPEED_X
+
+    def run():
+        sim.motion.step(sim.step_dt, state, VIEWPORT, config)
+
+    return run
+
+
+def case_simulation_step(config: GameConfig):
+    """
+    Run one full headless SimulationCore step, restarting after game over.
+
+    RU: Выполняет один полный headless-шаг SimulationCore, перезапуская
+    забег после game over.
+    """
+    sim = make_simulation(config)
+
+    def run():
+        if not sim.is_running():
+            sim.start()
+        sim.step(sim.step_dt)
+
+    return run
+
+
+CASES = (
+    ("perspective.transform_perspective", case_transform_perspective),
+    ("perspective.transform_batch", case_transform_batch),
+    ("road_geometry.get_tile_rect_world", case_tile_rects),
+    ("road_geometry.tile_tables", case_tile_tables),
+    ("tiles_model.reset", case_tiles_reset),
+    ("tiles_model.advance_row", case_tiles_advance_row),
+    ("collision.get_ship_points_on_tiles", case_collision),
+    ("road_motion.step", case_motion_step),
+    ("simulation.step", case_simulation_step),
+)
+
+
+def iter_cases(scales=SCALES):
+    """
+    Yield (name, run_callable) pairs for every case at every scale.
+
+    RU: Возвращает пары (имя, вызываемый объект) для каждого кейса и масштаба.
+    """
+    for nb_tiles, h_nb_lines in scales:
+        config = make_config(nb_tiles, h_nb_lines)
+        for case_name, factory in CASES:
+            yield f"{case_name}[tiles={nb_tiles},lines={h_nb_lines}]", factory(config)
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""
+Command-line runner for the engine benchmark suite.
+
+EN: Measures ops/sec for every case, runs a full headless N-frame
+simulation, and compares results with a stored baseline JSON. Exits with
+status 1 when any case regresses beyond the tolerance.
+RU: Измеряет ops/sec для каждого кейса, прогоняет полную headless-симуляцию
+на N кадров и сравнивает результаты с сохранённым baseline JSON.
+Завершается с кодом 1, если какой-либо кейс деградировал сильнее допуска.
+
+Usage:
+    python -m benchmarks.run_benchmarks
+    python -m benchmarks.run_benchmarks --save-baseline
+    python -m benchmarks.run_benchmarks --filter collision --tolerance 0.1
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+from pathlib import Path
+
+from benchmarks.engine_cases import SEED, VIEWPORT, iter_cases, make_config
+from engine.core.simulation_core import SimulationCore
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+
+
+def measure_ops_per_sec(run, min_time: float, repeats: int) -> float:
+    """
+    Return the best ops/sec of several timed batches of run().
+
+    EN: The batch size doubles until one batch takes at least min_time.
+    RU: Возвращает лучший ops/sec из нескольких замеренных пачек run().
+    Размер пачки удваивается, пока одна пачка не займёт не меньше min_time.
+    """
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            run()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time:
+            break
+        number *= 2
+
+    best = number / elapsed
+    for _ in range(repeats - 1):
+        started = time.perf_counter()
+        for _ in range(number):
+            run()
+        elapsed = time.perf_counter() - started
+        best = max(best, number / elapsed)
+    return best
+
+
+def run_simulation_frames(frames: int) -> float:
+    """
+    Run a full headless simulation for N display frames and return frames/sec.
+
+    EN: Each frame advances the accumulator by 1/60 s, as the Kivy tick does.
+    RU: Прогоняет полную headless-симуляцию на N кадров и возвращает кадры/сек.
+    Каждый кадр продвигает аккумулятор на 1/60 с, как тик Kivy.
+    """
+    random.seed(SEED)
+    sim = SimulationCore(config=make_config(16, 15))
+    sim.set_viewport(*VIEWPORT)
+    sim.start()
+    started = time.perf_counter()
+    for _ in range(frames):
+        if not sim.is_running():
+            sim.start()
+        sim.advance(1.0 / 60)
+    return frames / (time.perf_counter() - started)
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Return (name, current, baseline, ratio) for cases slower than tolerance.
+
+    RU: Возвращает (имя, текущее, baseline, отношение) для кейсов, которые
+    медленнее baseline больше чем на tolerance.
+    """
+    regressions = []
+    for name, ops in results.items():
+        base_ops = baseline.get(name)
+        if not base_ops:
+            continue
+        ratio = ops / base_ops
+        if ratio < 1.0 - tolerance:
+            regressions.append((name, ops, base_ops, ratio))
+    return regressions
+
+
+def load_baseline(path: Path) -> dict:
+    """
+    Load baseline ops/sec by case name, or an empty dict if missing.
+
+    RU: Загружает baseline ops/sec по именам кейсов или пустой словарь.
+    """
+    if not path.exists():
+        return {}
+    with path.open("r", encoding="utf-8") as fh:
+        data = json.load(fh)
+    return data.get("results", {})
+
+
+def save_results(path: Path, results: dict) -> None:
+    """
+    Write results with host metadata to path atomically.
+
+    RU: Атомарно записывает результаты с метаданными хоста в path.
+    """
+    payload = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = path.with_suffix(".tmp")
+    with tmp_file.open("w", encoding="utf-8") as fh:
+        json.dump(payload, fh, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp_file, path)
+
+
+def parse_args(argv=None):
+    """
+    Parse command-line options.
+
+    RU: Разбирает параметры командной строки.
+    """
+    parser = argparse.ArgumentParser(description="Engine hot-path benchmarks.")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--filter", default="")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--frames", type=int, default=20000)
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """
+    Run the suite, print a report, and return the process exit status.
+
+    RU: Запускает набор, печатает отчёт и возвращает код завершения.
+    """
+    args = parse_args(argv)
+    baseline = {} if args.save_baseline else load_baseline(args.baseline)
+    results = {}
+
+    for name, run in iter_cases():
+        if args.filter and args.filter not in name:
+            continue
+        results[name] = measure_ops_per_sec(run, args.min_time, args.repeats)
+        _print_row(name, results[name], baseline.get(name))
+
+    frames_name = f"simulation.frames[n={args.frames}]"
+    if not args.filter or args.filter in frames_name:
+        results[frames_name] = run_simulation_frames(args.frames)
+        _print_row(frames_name, results[frames_name], baseline.get(frames_name))
+
+    if args.output:
+        save_results(args.output, results)
+    if args.save_baseline:
+        save_results(args.baseline, results)
+        print(f"[Bench] baseline saved to {args.baseline}", flush=True)
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    for name, ops, base_ops, ratio in regressions:
+        print(
+            f"[Bench] REGRESSION {name}: {ops:,.0f} ops/s vs {base_ops:,.0f} ({ratio:.0%})",
+            flush=True,
+        )
+    return 1 if regressions else 0
+
+
+def _print_row(name: str, ops: float, base_ops) -> None:
+    """
+    Print one result line with the change against baseline, if known.
+
+    RU: Печатает строку результата с изменением относительно baseline.
+    """
+    delta = f"{ops / base_ops - 1.0:+.1%}" if base_ops else "n/a"
+    print(f"{name:<60} {ops:>14,.0f} ops/s  {delta:>8}", flush=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
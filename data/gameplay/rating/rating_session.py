@@ -4,6 +4,10 @@ RU: Состояние рейтинговой сессии экрана игры
 
 from __future__ import annotations
 
+import time
+
+from engine.core.game_state import GAME_OVER, SCORE_CHANGED
+
 
 class RatingSession:
     """EN: Collect per-session statistics for rating calculation.
@@ -44,6 +48,15 @@ class RatingSession:
         self.current_life_score = max(self.current_life_score, score)
         self.best_game_score = max(self.best_game_score, score)
 
+    def on_state_event(self, event: str, value: int) -> None:
+        """EN: GameState listener: track score changes and game over.
+        RU: Слушатель GameState: учитывать изменения счета и проигрыш.
+        """
+        if event == SCORE_CHANGED:
+            self.on_score_changed(value)
+        elif event == GAME_OVER:
+            self.on_game_over(time.time())
+
     def on_life_lost(self) -> None:
         """EN: Update best life score when a life is lost.
         RU: Обновить лучший счет за жизнь при потере жизни.
@@ -1,69 +1,47 @@
 # -*- coding: utf-8 -*-
 """
-Best score storage backed by JSON file.
+Best score storage backed by the user store.
 
-EN: Reads/writes best score to a JSON file with atomic writes.
-RU: Читает/пишет рекорд в JSON-файл с атомарной записью.
+EN: Reads/writes best score through the consolidated user store.
+RU: Читает/пишет рекорд через единое пользовательское хранилище.
 """
 
 from __future__ import annotations
 
-import json
-import os
-from pathlib import Path
-from typing import Any
+from data.gameplay.record_store import RecordStore
 
 
 class RecordStorage:
     """
-    File-backed storage for the best score.
+    Storage for the best score used by RecordManager.
 
-    EN: Uses record.json in data/gameplay by default.
-    RU: По умолчанию использует record.json в data/gameplay.
+    EN: Shares the same value as RecordStore.
+    RU: Использует то же значение, что и RecordStore.
     """
 
-    def __init__(self, base_dir: Path | None = None) -> None:
+    def __init__(self) -> None:
         """
-        Initialize storage with base directory.
+        Initialize storage.
 
-        EN: base_dir defaults to the data/gameplay folder.
-        RU: base_dir по умолчанию — папка data/gameplay.
+        RU: Инициализирует хранилище.
         """
-        self._base_dir = base_dir or Path(__file__).resolve().parent
-        self._record_path = self._base_dir / "record.json"
+        self._store = RecordStore()
 
     def get_best_score(self) -> int:
         """
-        Read best score from disk.
+        Read best score.
 
-        EN: Returns 0 when file is missing or corrupted.
-        RU: Возвращает 0, если файла нет или он повреждён.
+        EN: Returns 0 when nothing is stored.
+        RU: Возвращает 0, если ничего не сохранено.
         """
-        if not self._record_path.exists():
-            return 0
-        try:
-            with self._record_path.open("r", encoding="utf-8") as fh:
-                data: Any = json.load(fh)
-            return int(data.get("best_score", 0))
-        except Exception:
-            return 0
+        return self._store.get_best_score()
 
     def try_update_best_score(self, current_score: int) -> bool:
         """
         Update best score if current score is higher.
 
-        EN: Writes atomically and returns True if updated.
-        RU: Записывает атомарно и возвращает True при обновлении.
+        EN: Returns True if updated.
+        RU: Возвращает True при обновлении.
         """
-        best = self.get_best_score()
-        current = int(current_score)
-        if current <= best:
-            return False
-
-        self._base_dir.mkdir(parents=True, exist_ok=True)
-        tmp_path = self._record_path.with_suffix(".json.tmp")
-        payload = {"best_score": current}
-        with tmp_path.open("w", encoding="utf-8") as fh:
-            json.dump(payload, fh, ensure_ascii=False)
-        os.replace(tmp_path, self._record_path)
-        return True
+        best = self._store.get_best_score()
+        return self._store.commit_if_higher(current_score) > best
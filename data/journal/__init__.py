@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""
+Session event journal package.
+
+EN: Append-only JSONL journal of gameplay session events.
+RU: Журнал событий игровых сессий в формате JSONL (только дозапись).
+"""
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+Offline aggregates for the session event journal.
+
+EN: Reads the active and rotated journal files from a directory (for
+example a copy of `<user_data_dir>/journal` pulled from a device) and
+prints event counts, session timings, reward conversion and score stats.
+Malformed lines are counted and skipped.
+RU: Офлайн-агрегаты по журналу событий сессий. Читает текущий и
+ротированные файлы журнала из каталога (например, копии
+`<user_data_dir>/journal`, снятой с устройства) и печатает число событий,
+длительность сессий, конверсию наград и статистику очков. Повреждённые
+строки подсчитываются и пропускаются.
+
+Usage:
+    python -m data.journal.journal_report path/to/journal
+    python -m data.journal.journal_report path/to/journal --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Iterator
+
+from data.journal.session_journal import BACK, GAME_OVER, LOSS, REWARD_CLICK, START, journal_files
+
+
+def iter_events(directory: Path, stats: dict) -> Iterator[dict]:
+    """
+    Yield journal events from oldest to newest.
+
+    EN: Increments stats["bad_lines"] for lines that are not JSON objects.
+    RU: Выдаёт события журнала от старых к новым. Увеличивает
+    stats["bad_lines"] для строк, которые не являются JSON-объектами.
+    """
+    for path in journal_files(directory):
+        with path.open("r", encoding="utf-8", errors="replace") as fh:
+            for line in fh:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    event = None
+                if isinstance(event, dict) and isinstance(event.get("e"), str):
+                    yield event
+                else:
+                    stats["bad_lines"] += 1
+
+
+def aggregate(directory: Path) -> dict:
+    """
+    Compute aggregate statistics for all events in directory.
+
+    RU: Считает агрегированную статистику по всем событиям в каталоге.
+    """
+    stats = {"bad_lines": 0}
+    counts = {name: 0 for name in (START, LOSS, GAME_OVER, REWARD_CLICK, BACK)}
+    runs = set()
+    session_sec = []
+    gameplay_sec = []
+    best_score = 0
+    rating_points = None
+    balance_delta = 0.0
+    first_t = last_t = None
+
+    for event in iter_events(directory, stats):
+        name = event["e"]
+        counts[name] = counts.get(name, 0) + 1
+        runs.add(event.get("run"))
+        t = event.get("t")
+        if isinstance(t, (int, float)):
+            first_t = t if first_t is None else min(first_t, t)
+            last_t = t if last_t is None else max(last_t, t)
+        if name != BACK:
+            continue
+        if isinstance(event.get("session_sec"), (int, float)):
+            session_sec.append(float(event["session_sec"]))
+        if isinstance(event.get("gameplay_sec"), (int, float)):
+            gameplay_sec.append(float(event["gameplay_sec"]))
+        if isinstance(event.get("best_score"), int):
+            best_score = max(best_score, event["best_score"])
+        if isinstance(event.get("rating_points"), int):
+            rating_points = event["rating_points"]
+        if isinstance(event.get("balance_delta"), (int, float)):
+            balance_delta += float(event["balance_delta"])
+
+    game_overs = counts[GAME_OVER]
+    return {
+        "runs": len(runs),
+        "events": counts,
+        "bad_lines": stats["bad_lines"],
+        "first_t": first_t,
+        "last_t": last_t,
+        "session_sec_total": round(sum(session_sec), 2),
+        "session_sec_mean": round(sum(session_sec) / len(session_sec), 2) if session_sec else 0.0,
+        "gameplay_sec_total": round(sum(gameplay_sec), 2),
+        "gameplay_sec_mean": round(sum(gameplay_sec) / len(gameplay_sec), 2) if gameplay_sec else 0.0,
+        "losses_per_start": round(counts[LOSS] / counts[START], 3) if counts[START] else 0.0,
+        "reward_clicks_per_game_over": round(counts[REWARD_CLICK] / game_overs, 3) if game_overs else 0.0,
+        "best_score": best_score,
+        "last_rating_points": rating_points,
+        "balance_delta_total": round(balance_delta, 4),
+    }
+
+
+def parse_args(argv=None):
+    """
+    Parse command-line options.
+
+    RU: Разбирает параметры командной строки.
+    """
+    parser = argparse.ArgumentParser(description="Session event journal aggregates.")
+    parser.add_argument("directory", type=Path)
+    parser.add_argument("--json", action="store_true")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """
+    Print the report and return the process exit status.
+
+    RU: Печатает отчёт и возвращает код завершения.
+    """
+    args = parse_args(argv)
+    if not args.directory.is_dir():
+        print(f"[Journal] not a directory: {args.directory}", file=sys.stderr)
+        return 1
+    report = aggregate(args.directory)
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return 0
+    events = report.pop("events")
+    for name, count in events.items():
+        print(f"{'events.' + name:<32} {count:>12}")
+    for name, value in report.items():
+        print(f"{name:<32} {value!s:>12}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+"""
+Append-only journal of gameplay session events.
+
+EN: Records start, loss, game over, reward click and back events as JSON
+lines under `<user_data_dir>/journal/`. Logging an event only appends a
+dict to an in-memory buffer; a worker thread batches buffered events into
+one append per burst and rotates the file by size, so the UI thread never
+does stdout or disk I/O for telemetry. Use `python -m
+data.journal.journal_report` to compute aggregates offline.
+RU: Журнал событий игровых сессий только на дозапись. Записывает события
+старта, потери жизни, GameOver, нажатия «Получить» и выхода назад как JSON
+строки в `<user_data_dir>/journal/`. Запись события лишь добавляет словарь
+в буфер в памяти; рабочий поток пакетно дописывает накопленные события
+одной операцией и ротирует файл по размеру, поэтому UI-поток не выполняет
+ввод-вывод в stdout или на диск ради телеметрии. Агрегаты считаются офлайн
+через `python -m data.journal.journal_report`.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Optional
+
+# EN: Journal directory inside user_data_dir.
+# RU: Каталог журнала в user_data_dir.
+JOURNAL_DIRNAME = "journal"
+
+# EN: Active journal file; rotated files get a numeric suffix (.1 is newest).
+# RU: Текущий файл журнала; у ротированных файлов числовой суффикс (.1 — новейший).
+JOURNAL_FILENAME = "session_events.jsonl"
+
+# EN: Size after which the active file is rotated.
+# RU: Размер, после которого текущий файл ротируется.
+MAX_FILE_BYTES = 256 * 1024
+
+# EN: Number of rotated files kept next to the active one.
+# RU: Число ротированных файлов, хранимых рядом с текущим.
+MAX_ROTATED_FILES = 3
+
+# EN: Delay that lets a burst of events share one append.
+# RU: Задержка, позволяющая серии событий уложиться в одну дозапись.
+FLUSH_DELAY_SEC = 2.0
+
+# EN: Buffered events that force a write without waiting for the delay.
+# RU: Число событий в буфере, при котором запись идёт без ожидания задержки.
+MAX_BUFFERED_EVENTS = 64
+
+START = "start"
+LOSS = "loss"
+GAME_OVER = "game_over"
+REWARD_CLICK = "reward_click"
+BACK = "back"
+
+
+def _user_dir() -> Path:
+    """
+    Return the running app's user_data_dir, or the current directory without an app.
+
+    RU: Возвращает user_data_dir запущенного приложения или текущий каталог
+    без приложения.
+    """
+    from kivy.app import App
+
+    app = App.get_running_app()
+    return Path(getattr(app, "user_data_dir", ".")) if app else Path(".")
+
+
+def journal_files(directory: Path) -> list[Path]:
+    """
+    Return existing journal files in directory, oldest first.
+
+    RU: Возвращает существующие файлы журнала в каталоге, от старых к новым.
+    """
+    stem, suffix = os.path.splitext(JOURNAL_FILENAME)
+    paths = [directory / f"{stem}.{index}{suffix}" for index in range(MAX_ROTATED_FILES, 0, -1)]
+    paths.append(directory / JOURNAL_FILENAME)
+    return [path for path in paths if path.is_file()]
+
+
+class SessionJournal:
+    """
+    Buffered JSONL event writer with size-based rotation.
+
+    EN: log() is safe to call from any thread and never blocks on I/O.
+    Each event carries a wall-clock timestamp `t`, the event name `e` and
+    the run id `run` that groups events of one application run.
+    RU: Буферизованная запись событий в JSONL с ротацией по размеру.
+    log() можно вызывать из любого потока, он не блокируется на вводе-выводе.
+    Каждое событие содержит время `t`, имя события `e` и идентификатор
+    запуска `run`, группирующий события одного запуска приложения.
+    """
+
+    def __init__(self, directory: Optional[Path] = None) -> None:
+        """
+        Prepare an idle journal; the worker starts with the first event.
+
+        EN: directory defaults to `<user_data_dir>/journal`.
+        RU: Готовит журнал; рабочий поток стартует с первым событием.
+        directory по умолчанию — `<user_data_dir>/journal`.
+        """
+        self._directory = directory
+        self._run_id = uuid.uuid4().hex[:12]
+        self._buffer: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+    @property
+    def directory(self) -> Path:
+        """
+        Return the journal directory.
+
+        RU: Возвращает каталог журнала.
+        """
+        if self._directory is None:
+            self._directory = _user_dir() / JOURNAL_DIRNAME
+        return self._directory
+
+    @property
+    def path(self) -> Path:
+        """
+        Return the active journal file path.
+
+        RU: Возвращает путь к текущему файлу журнала.
+        """
+        return self.directory / JOURNAL_FILENAME
+
+    def log(self, event: str, **fields: Any) -> None:
+        """
+        Buffer one event; fields must be JSON-serializable.
+
+        RU: Добавляет одно событие в буфер; поля должны сериализоваться в JSON.
+        """
+        record = {"t": round(time.time(), 3), "e": event, "run": self._run_id}
+        record.update(fields)
+        with self._lock:
+            self._buffer.append(record)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="SessionJournal", daemon=True)
+                self._worker.start()
+        self._wake.set()
+
+    def flush(self) -> None:
+        """
+        Append buffered events synchronously; no-op when empty.
+
+        RU: Синхронно дописывает накопленные события; ничего не делает без них.
+        """
+        with self._write_lock:
+            with self._lock:
+                batch, self._buffer = self._buffer, []
+            if not batch:
+                return
+            payload = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in batch)
+            try:
+                self._append(payload.encode("utf-8"))
+            except OSError:
+                with self._lock:
+                    self._buffer[:0] = batch
+                raise
+
+    def clear(self) -> None:
+        """
+        Drop buffered events and delete all journal files.
+
+        RU: Отбрасывает события в буфере и удаляет все файлы журнала.
+        """
+        with self._write_lock:
+            with self._lock:
+                self._buffer = []
+            for path in journal_files(self.directory):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def _run(self) -> None:
+        """
+        Worker loop: wait for events, let the burst settle, then append.
+
+        RU: Цикл потока: ждёт события, даёт серии завершиться и дописывает.
+        """
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            while len(self._buffer) < MAX_BUFFERED_EVENTS and self._wake.wait(FLUSH_DELAY_SEC):
+                self._wake.clear()
+            try:
+                self.flush()
+            except OSError:
+                pass
+
+    def _append(self, payload: bytes) -> None:
+        """
+        Append payload to the active file, rotating it first if it is full.
+
+        RU: Дописывает payload в текущий файл, предварительно ротируя его,
+        если он заполнен.
+        """
+        path = self.path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            size = path.stat().st_size
+        except OSError:
+            size = 0
+        if size and size + len(payload) > MAX_FILE_BYTES:
+            self._rotate()
+        with path.open("ab") as fh:
+            fh.write(payload)
+
+    def _rotate(self) -> None:
+        """
+        Shift rotated files by one and move the active file to `.1`.
+
+        RU: Сдвигает ротированные файлы на один и переносит текущий в `.1`.
+        """
+        stem, suffix = os.path.splitext(JOURNAL_FILENAME)
+        directory = self.directory
+        for index in range(MAX_ROTATED_FILES, 0, -1):
+            src = directory / (JOURNAL_FILENAME if index == 1 else f"{stem}.{index - 1}{suffix}")
+            if src.is_file():
+                os.replace(src, directory / f"{stem}.{index}{suffix}")
+
+
+session_journal = SessionJournal()
+
+
+def _flush_at_exit() -> None:
+    """
+    Write buffered events when the interpreter exits, ignoring I/O errors.
+
+    RU: Записывает накопленные события при выходе интерпретатора, игнорируя
+    ошибки ввода-вывода.
+    """
+    try:
+        session_journal.flush()
+    except OSError:
+        pass
+
+
+atexit.register(_flush_at_exit)
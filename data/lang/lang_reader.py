@@ -1,15 +1,29 @@
 from __future__ import annotations
 
 import json
+import threading
 from pathlib import Path
 from typing import Any
 
+_cache: dict[str, dict[str, str]] = {}
+_cache_lock = threading.Lock()
+
 
 def _lang_path(code: str) -> Path:
     return Path(__file__).resolve().parent / f"{code}.json"
 
 
 def load_lang_dict(code: str) -> dict[str, str]:
+    with _cache_lock:
+        cached = _cache.get(code)
+    if cached is not None:
+        return cached
+    out = _read_lang_dict(code)
+    with _cache_lock:
+        return _cache.setdefault(code, out)
+
+
+def _read_lang_dict(code: str) -> dict[str, str]:
     path = _lang_path(code)
     if not path.exists():
         return {}
@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""
+Consolidated user data store package.
+
+EN: Single write-behind key-value store shared by all user data modules.
+RU: Единое хранилище ключ-значение с отложенной записью для всех данных пользователя.
+"""
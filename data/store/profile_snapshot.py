@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Cached read model for the profile screen.
+
+EN: Collects record, rating, balance, session email and profile cache
+into one immutable snapshot. The snapshot is built on first use and
+reused until a writer mutates one of the namespaces it depends on.
+RU: Кэшированная модель чтения для экрана профиля. Собирает рекорд,
+рейтинг, баланс, email сессии и кэш профиля в один неизменяемый снимок.
+Снимок строится при первом обращении и переиспользуется, пока запись не
+изменит одно из пространств имён, от которых он зависит.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+from ads.payment.balance_store import BalanceStore
+from data.gameplay.rating_storage import RatingStorage
+from data.gameplay.record_store import RecordStore
+from data.store.user_store import BALANCE, RATING, RECORD, SESSION, USER_CACHE, user_store
+from data.user_cache.user_session import UserSession
+
+_DEPENDS_ON = frozenset((RECORD, RATING, BALANCE, SESSION, USER_CACHE))
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileSnapshot:
+    """
+    Immutable profile card values.
+
+    RU: Неизменяемые значения карточек профиля.
+    """
+
+    best_score: int
+    rating_points: int
+    balance: float
+    email: Optional[str]
+    login: str
+    phone: str
+    tg: str
+
+    @property
+    def is_logged_in(self) -> bool:
+        """
+        Return True when a session email is stored.
+
+        RU: Возвращает True, если сохранён email сессии.
+        """
+        return self.email is not None
+
+
+_snapshot: Optional[ProfileSnapshot] = None
+
+
+def get_profile_snapshot() -> ProfileSnapshot:
+    """
+    Return the cached snapshot, building it if it was invalidated.
+
+    RU: Возвращает кэшированный снимок, строя его заново после сброса.
+    """
+    global _snapshot
+    snapshot = _snapshot
+    if snapshot is None:
+        snapshot = _snapshot = _build_snapshot()
+    return snapshot
+
+
+def invalidate_profile_snapshot() -> None:
+    """
+    Drop the cached snapshot so the next read rebuilds it.
+
+    RU: Сбрасывает кэшированный снимок, чтобы следующее чтение его перестроило.
+    """
+    global _snapshot
+    _snapshot = None
+
+
+def _build_snapshot() -> ProfileSnapshot:
+    cache = user_store.get_namespace(USER_CACHE)
+    login = cache.get("login")
+    return ProfileSnapshot(
+        best_score=RecordStore().get_best_score(),
+        rating_points=RatingStorage().load_points(),
+        balance=BalanceStore().get_balance(),
+        email=UserSession().get_email(),
+        login=login.strip() if isinstance(login, str) else "",
+        phone=cache.get("phone") or "",
+        tg=cache.get("tg") or "",
+    )
+
+
+def _on_store_changed(namespace: str) -> None:
+    if namespace in _DEPENDS_ON:
+        invalidate_profile_snapshot()
+
+
+user_store.add_listener(_on_store_changed)
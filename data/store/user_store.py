@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+"""
+Consolidated write-behind store for all user data.
+
+EN: Keeps every user value (record, rating, balance, session, profile
+cache) in one in-memory dict of namespaces backed by a single JSON file
+under user_data_dir. Reads never touch disk after the first load; writes
+only mark the store dirty and wake a worker thread that coalesces bursts
+of mutations into one atomic write (tmp file, fsync, os.replace).
+RU: Единое хранилище всех пользовательских данных с отложенной записью.
+Держит все значения (рекорд, рейтинг, баланс, сессию, кэш профиля) в одном
+словаре пространств имён в памяти, который хранится в одном JSON-файле в
+user_data_dir. После первой загрузки чтение не обращается к диску; запись
+лишь помечает хранилище изменённым и будит рабочий поток, который сводит
+серию изменений в одну атомарную запись (tmp, fsync, os.replace).
+"""
+
+from __future__ import annotations
+
+import atexit
+import copy
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from kivy.app import App
+
+# EN: Store file name inside user_data_dir.
+# RU: Имя файла хранилища в user_data_dir.
+STORE_FILENAME = "user_store.json"
+
+# EN: Delay that lets a burst of mutations share one disk write.
+# RU: Задержка, позволяющая серии изменений уложиться в одну запись.
+FLUSH_DELAY_SEC = 0.5
+
+RECORD = "record"
+RATING = "rating"
+BALANCE = "balance"
+SESSION = "session"
+USER_CACHE = "user_cache"
+
+
+def _user_dir() -> Path:
+    app = App.get_running_app()
+    return Path(getattr(app, "user_data_dir", ".")) if app else Path(".")
+
+
+def legacy_paths() -> list[Path]:
+    """
+    Return the per-store JSON files used before consolidation.
+
+    RU: Возвращает JSON-файлы отдельных хранилищ до объединения.
+    """
+    user_dir = _user_dir()
+    package_dir = Path(__file__).resolve().parents[1]
+    return [
+        user_dir / "gameplay" / "record.json",
+        user_dir / "ads" / "payment" / "balance.json",
+        user_dir / "user_session.json",
+        package_dir / "gameplay" / "record.json",
+        package_dir / "gameplay" / "rating.json",
+        package_dir / "user_cache" / "user_cache.json",
+    ]
+
+
+def _read_json(path: Path) -> Optional[dict]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8") or "{}")
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+class UserStore:
+    """
+    In-memory namespaced key-value store with asynchronous flushing.
+
+    EN: All methods are safe to call from any thread. Values must be
+    JSON-serializable; callers get copies, never live references.
+    RU: Хранилище ключ-значение по пространствам имён в памяти с
+    асинхронной записью. Все методы можно вызывать из любого потока.
+    Значения должны сериализоваться в JSON; вызывающий код получает копии,
+    а не живые ссылки.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        """
+        Prepare an unloaded store; the file is read on first access.
+
+        EN: path defaults to `<user_data_dir>/user_store.json`.
+        RU: Готовит незагруженное хранилище; файл читается при первом
+        обращении. path по умолчанию — `<user_data_dir>/user_store.json`.
+        """
+        self._path = path
+        self._data: Optional[dict[str, dict[str, Any]]] = None
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._dirty = False
+        self._worker: Optional[threading.Thread] = None
+        self._listeners: list[Callable[[str], None]] = []
+
+    @property
+    def path(self) -> Path:
+        """
+        Return the backing file path.
+
+        RU: Возвращает путь к файлу хранилища.
+        """
+        if self._path is None:
+            self._path = _user_dir() / STORE_FILENAME
+        return self._path
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        """
+        Return a copy of one value, or default if missing.
+
+        RU: Возвращает копию одного значения или default, если его нет.
+        """
+        with self._lock:
+            value = self._loaded().get(namespace, {}).get(key, default)
+            return copy.deepcopy(value)
+
+    def get_namespace(self, namespace: str) -> dict[str, Any]:
+        """
+        Return a copy of all values in a namespace.
+
+        RU: Возвращает копию всех значений пространства имён.
+        """
+        with self._lock:
+            return copy.deepcopy(self._loaded().get(namespace, {}))
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        """
+        Set one value and schedule a flush.
+
+        RU: Устанавливает одно значение и планирует запись.
+        """
+        self.update(namespace, {key: value})
+
+    def update(self, namespace: str, values: dict[str, Any]) -> None:
+        """
+        Merge values into a namespace and schedule a flush.
+
+        RU: Объединяет значения с пространством имён и планирует запись.
+        """
+        with self._lock:
+            self._loaded().setdefault(namespace, {}).update(copy.deepcopy(values))
+            self._mark_dirty()
+        self._notify(namespace)
+
+    def replace(self, namespace: str, values: dict[str, Any]) -> None:
+        """
+        Replace a whole namespace and schedule a flush.
+
+        RU: Заменяет пространство имён целиком и планирует запись.
+        """
+        with self._lock:
+            self._loaded()[namespace] = copy.deepcopy(values)
+            self._mark_dirty()
+        self._notify(namespace)
+
+    def mutate(self, namespace: str, key: str, fn: Callable[[Any], Any], default: Any = None) -> Any:
+        """
+        Atomically replace a value with fn(old) and return the new value.
+
+        EN: Used for read-modify-write updates such as balance increments.
+        RU: Атомарно заменяет значение на fn(старое) и возвращает новое.
+        Используется для изменений вида чтение-изменение-запись, например
+        пополнения баланса.
+        """
+        with self._lock:
+            bucket = self._loaded().setdefault(namespace, {})
+            value = fn(copy.deepcopy(bucket.get(key, default)))
+            bucket[key] = copy.deepcopy(value)
+            self._mark_dirty()
+        self._notify(namespace)
+        return value
+
+    def clear_namespace(self, namespace: str) -> None:
+        """
+        Remove every value of a namespace.
+
+        RU: Удаляет все значения пространства имён.
+        """
+        with self._lock:
+            if self._loaded().pop(namespace, None) is None:
+                return
+            self._mark_dirty()
+        self._notify(namespace)
+
+    def clear(self) -> None:
+        """
+        Remove all user data.
+
+        RU: Удаляет все пользовательские данные.
+        """
+        with self._lock:
+            namespaces = list(self._loaded())
+            self._data = {}
+            self._mark_dirty()
+        for namespace in namespaces:
+            self._notify(namespace)
+
+    def add_listener(self, listener: Callable[[str], None]) -> None:
+        """
+        Call listener(namespace) after every mutation of that namespace.
+
+        EN: Listeners run on the mutating thread, outside the store lock.
+        RU: Вызывает listener(namespace) после каждого изменения пространства
+        имён. Слушатели выполняются в изменяющем потоке вне блокировки.
+        """
+        self._listeners.append(listener)
+
+    def flush(self) -> None:
+        """
+        Write pending changes synchronously; no-op when clean.
+
+        RU: Синхронно записывает накопленные изменения; ничего не делает без них.
+        """
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                payload = json.dumps(self._data, ensure_ascii=False, indent=2)
+                self._dirty = False
+            try:
+                self._write(payload)
+            except OSError:
+                with self._lock:
+                    self._dirty = True
+                raise
+
+    def _loaded(self) -> dict[str, dict[str, Any]]:
+        """
+        Return the data dict, loading or migrating it on first use.
+
+        RU: Возвращает словарь данных, загружая или мигрируя его при первом
+        обращении.
+        """
+        if self._data is None:
+            data = _read_json(self.path)
+            if data is None:
+                data = self._migrate_legacy()
+                self._data = data
+                if data:
+                    self._mark_dirty()
+            else:
+                self._data = {ns: vals for ns, vals in data.items() if isinstance(vals, dict)}
+        return self._data
+
+    @staticmethod
+    def _migrate_legacy() -> dict[str, dict[str, Any]]:
+        """
+        Import values from the old per-store JSON files.
+
+        EN: The best score is the maximum of both legacy record files.
+        RU: Импортирует значения из старых JSON-файлов отдельных хранилищ.
+        Рекорд берётся как максимум из двух старых файлов рекорда.
+        """
+        (user_record, balance, session, package_record, rating, user_cache) = [
+            _read_json(path) or {} for path in legacy_paths()
+        ]
+        data: dict[str, dict[str, Any]] = {}
+        best_scores = []
+        for record in (user_record, package_record):
+            try:
+                best_scores.append(int(record.get("best_score", 0)))
+            except (TypeError, ValueError):
+                pass
+        if any(best_scores):
+            data[RECORD] = {"best_score": max(best_scores)}
+        if isinstance(rating.get("points"), int):
+            data[RATING] = {"points": rating["points"]}
+        try:
+            if "balance" in balance:
+                data[BALANCE] = {"balance": float(balance["balance"])}
+        except (TypeError, ValueError):
+            pass
+        email = (session.get("email") or "").strip() if isinstance(session.get("email"), str) else ""
+        if email:
+            data[SESSION] = {"email": email}
+        if user_cache:
+            data[USER_CACHE] = dict(user_cache)
+        return data
+
+    def _notify(self, namespace: str) -> None:
+        for listener in list(self._listeners):
+            listener(namespace)
+
+    def _mark_dirty(self) -> None:
+        self._dirty = True
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._run, name="UserStoreFlush", daemon=True)
+            self._worker.start()
+        self._wake.set()
+
+    def _run(self) -> None:
+        """
+        Worker loop: wait for a mutation, let the burst settle, then flush.
+
+        RU: Цикл потока: ждёт изменение, даёт серии завершиться и пишет.
+        """
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            while self._wake.wait(FLUSH_DELAY_SEC):
+                self._wake.clear()
+            try:
+                self.flush()
+            except OSError:
+                pass
+
+    def _write(self, payload: str) -> None:
+        """
+        Atomically replace the store file with payload.
+
+        RU: Атомарно заменяет файл хранилища содержимым payload.
+        """
+        path = self.path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = path.with_suffix(".tmp")
+        with tmp_file.open("w", encoding="utf-8") as fh:
+            fh.write(payload)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp_file, path)
+
+
+user_store = UserStore()
+atexit.register(user_store.flush)
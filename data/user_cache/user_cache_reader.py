@@ -1,43 +1,20 @@
-"""EN: Read and validate user registration cache.
-RU: Чтение и проверка кэша регистрации пользователя.
+"""EN: Read and validate user registration cache from the user store.
+RU: Чтение и проверка кэша регистрации пользователя из хранилища.
 """
 
 from __future__ import annotations
 
-import json
-from pathlib import Path
 from typing import Any
 
-
-def _cache_path() -> Path:
-    """EN: Resolve the user cache JSON file path.
-    RU: Определить путь к JSON-файлу кэша пользователя.
-    """
-    return Path(__file__).resolve().parent / "user_cache.json"
+from data.store.user_store import USER_CACHE, user_store
 
 
 def get_user_cache() -> dict[str, Any] | None:
-    """EN: Load user cache JSON if it exists and is valid.
-    RU: Загрузить JSON кэша пользователя, если он существует и валиден.
+    """EN: Return a copy of the cached user registration data, if any.
+    RU: Вернуть копию кэша регистрации пользователя, если он есть.
     """
-    cache_path = _cache_path()
-    if not cache_path.exists():
-        return None
-
-    try:
-        raw = cache_path.read_text(encoding="utf-8")
-    except OSError:
-        return None
-
-    if not raw.strip():
-        return None
-
-    try:
-        data = json.loads(raw)
-    except json.JSONDecodeError:
-        return None
-
-    return data if isinstance(data, dict) else None
+    data = user_store.get_namespace(USER_CACHE)
+    return data or None
 
 
 def is_credentials_valid(email: str, password: str) -> bool:
@@ -4,17 +4,33 @@ Collision checks between the ship points and tile rectangles.
 RU: Проверки коллизий между точками корабля и прямоугольниками тайлов.
 """
 
+import math
+
+from engine.core.road_geometry import LINE_Y_START
+
+# EN: Fractional distance to a grid line below which both neighbouring cells
+# are checked, so inclusive tile edges behave exactly like rect comparisons.
+# RU: Дробное расстояние до линии сетки, при котором проверяются обе соседние
+# клетки, чтобы включительные границы тайлов работали как сравнение с rect.
+EDGE_EPSILON = 1e-6
+
 
 class CollisionEngine:
     """
     Evaluate whether the ship is still on any valid tile.
 
-    RU: Определяет, находится ли корабль на допустимом тайле.
+    EN: Maps each ship vertex analytically to its grid cell and looks it up
+    in the {row: set(tile_x)} index kept by TilesModel, so the cost depends
+    only on the number of ship points.
+    RU: Определяет, находится ли корабль на допустимом тайле. Аналитически
+    переводит каждую вершину корабля в клетку сетки и ищет её в индексе
+    {row: set(tile_x)} из TilesModel, поэтому стоимость зависит только от
+    числа точек корабля.
     """
     def ship_on_any_tile(
         self,
         ship_world_points,
-        candidate_tiles,
+        row_index,
         geometry,
         state,
         width,
@@ -28,12 +44,11 @@ class CollisionEngine:
 
         RU: Проверяет, попадает ли вершина корабля в прямоугольник любого тайла.
         """
-        tiles_to_check = self._select_candidate_tiles(candidate_tiles, state)
-        for tile_x, tile_y in tiles_to_check:
-            if self._ship_on_tile(
-                ship_world_points,
-                tile_x,
-                tile_y,
+        for px, py in ship_world_points:
+            if self._point_on_tiles(
+                px,
+                py,
+                row_index,
                 geometry,
                 state,
                 width,
@@ -48,7 +63,7 @@ class CollisionEngine:
     def get_ship_points_on_tiles(
         self,
         ship_world_points,
-        candidate_tiles,
+        row_index,
         geometry,
         state,
         width,
@@ -63,43 +78,27 @@ class CollisionEngine:
         EN: Produces a list of booleans aligned with ship_world_points order.
         RU: Возвращает список флагов по порядку ship_world_points.
         """
-        tiles_to_check = self._select_candidate_tiles(candidate_tiles, state)
-        tile_rects = [
-            geometry.get_tile_rect_world(
-                tile_x,
-                tile_y,
+        return [
+            self._point_on_tiles(
+                px,
+                py,
+                row_index,
+                geometry,
                 state,
                 width,
                 height,
+                config,
                 perspective_point_x,
                 perspective_point_y,
-                config,
             )
-            for tile_x, tile_y in tiles_to_check
+            for px, py in ship_world_points
         ]
-        results = []
-        for px, py in ship_world_points:
-            results.append(self._point_on_any_rect(px, py, tile_rects))
-        return results
 
-    def _select_candidate_tiles(self, tiles_coordinates, state):
-        """
-        Select tiles near the current loop position for collision checks.
-
-        RU: Отбирает тайлы возле текущей позиции для проверки коллизий.
-        """
-        tiles_to_check = []
-        for tile_x, tile_y in tiles_coordinates:
-            if tile_y > state.current_y_loop + 1:
-                break
-            tiles_to_check.append((tile_x, tile_y))
-        return tiles_to_check
-
-    def _ship_on_tile(
+    def _point_on_tiles(
         self,
-        ship_world_points,
-        tile_x,
-        tile_y,
+        px,
+        py,
+        row_index,
         geometry,
         state,
         width,
@@ -109,33 +108,51 @@ class CollisionEngine:
         perspective_point_y,
     ):
         """
-        Determine if any ship vertex lies inside the given tile rectangle.
+        Check whether a world point lies on an indexed tile near the ship.
 
-        RU: Определяет, находится ли вершина корабля внутри прямоугольника тайла.
+        EN: Only rows up to current_y_loop + 1 are considered. Cells found by
+        the inverse mapping are confirmed against the exact tile rectangle,
+        read from the geometry line tables, which must be updated for state.
+        RU: Учитываются только ряды до current_y_loop + 1. Клетки, найденные
+        обратным отображением, подтверждаются точным прямоугольником тайла
+        из таблиц линий геометрии, обновлённых для state.
         """
-        xmin, ymin, xmax, ymax = geometry.get_tile_rect_world(
-            tile_x,
-            tile_y,
-            state,
-            width,
-            height,
-            perspective_point_x,
-            perspective_point_y,
-            config,
-        )
-        for px, py in ship_world_points:
-            if xmin <= px <= xmax and ymin <= py <= ymax:
-                return True
+        max_row = state.current_y_loop + 1
+        xs = geometry.line_xs
+        ys = geometry.line_ys
+        x0 = geometry.line_x_start
+        y0 = state.current_y_loop + LINE_Y_START
+        index_x = geometry.line_index_at_x(px)
+        index_y = geometry.line_index_at_y(py)
+        for row in self._cells_near(index_y):
+            tile_y = row + state.current_y_loop
+            if tile_y > max_row:
+                continue
+            row_tiles = row_index.get(tile_y)
+            if not row_tiles:
+                continue
+            for tile_x in self._cells_near(index_x):
+                if tile_x not in row_tiles:
+                    continue
+                if (
+                    xs[tile_x - x0] <= px <= xs[tile_x - x0 + 1]
+                    and ys[tile_y - y0] <= py <= ys[tile_y - y0 + 1]
+                ):
+                    return True
         return False
 
-    def _point_on_any_rect(self, px, py, rects):
+    def _cells_near(self, index):
         """
-        Check whether a point falls inside any rectangle in the list.
+        Return the grid cells that may contain a fractional line index.
 
-        EN: Uses axis-aligned rectangle bounds to evaluate containment.
-        RU: Использует границы прямоугольников для проверки попадания.
+        EN: Near a grid line both adjacent cells are returned.
+        RU: Возвращает клетки сетки, которые могут содержать дробный индекс.
+        Рядом с линией сетки возвращаются обе соседние клетки.
         """
-        for xmin, ymin, xmax, ymax in rects:
-            if xmin <= px <= xmax and ymin <= py <= ymax:
-                return True
-        return False
+        cell = math.floor(index)
+        frac = index - cell
+        if frac < EDGE_EPSILON:
+            return (cell - 1, cell)
+        if frac > 1 - EDGE_EPSILON:
+            return (cell, cell + 1)
+        return (cell,)
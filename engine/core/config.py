@@ -28,3 +28,8 @@ class GameConfig:
     SHIP_WIDTH = 0.1
     SHIP_HEIGHT = 0.035
     SHIP_BASE_Y = 0.04
+
+    SIM_STEP_HZ = 120
+    SIM_MAX_FRAME_DT = 0.25
+
+    RENDER_BACKEND = "mesh"
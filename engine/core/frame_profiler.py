@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""
+Opt-in per-frame phase profiler with rolling frame-time histograms.
+
+EN: Collects durations of named frame phases into fixed-bucket rolling
+histograms and reports p50/p95/p99 and dropped-frame counts. Pure Python,
+no Kivy dependencies.
+RU: Опциональный профайлер фаз кадра со скользящими гистограммами времени.
+Собирает длительности именованных фаз в скользящие гистограммы с
+фиксированными корзинами и отдаёт p50/p95/p99 и число пропущенных кадров.
+Чистый Python без зависимостей от Kivy.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections import deque
+from pathlib import Path
+
+# EN: Histogram bucket width in seconds (0.1 ms).
+# RU: Ширина корзины гистограммы в секундах (0.1 мс).
+BUCKET_SEC = 0.0001
+
+# EN: Number of buckets; the last one collects everything slower.
+# RU: Число корзин; последняя собирает всё, что медленнее.
+BUCKET_COUNT = 1000
+
+# EN: A frame is dropped when dt exceeds the frame budget by this ratio.
+# RU: Кадр считается пропущенным, если dt превышает бюджет в это число раз.
+DROPPED_RATIO = 1.5
+
+PHASES = (
+    "frame",
+    "perspective",
+    "motion",
+    "tiles",
+    "collision",
+    "render_grid",
+    "render_tiles",
+    "render_ship",
+)
+
+
+class RollingHistogram:
+    """
+    Fixed-bucket histogram over the most recent samples.
+
+    EN: Keeps the bucket index of each sample in a bounded deque and
+    decrements the evicted bucket, so updates are O(1).
+    RU: Гистограмма с фиксированными корзинами по последним отсчётам.
+    Хранит индекс корзины каждого отсчёта в ограниченной deque и уменьшает
+    вытесненную корзину, поэтому обновление O(1).
+    """
+
+    def __init__(self, window: int) -> None:
+        """
+        Create empty buckets for a window of samples.
+
+        RU: Создаёт пустые корзины для окна отсчётов.
+        """
+        self._samples = deque(maxlen=window)
+        self._counts = [0] * BUCKET_COUNT
+        self._max_sec = 0.0
+
+    def add(self, seconds: float) -> None:
+        """
+        Record one duration in seconds.
+
+        RU: Записывает одну длительность в секундах.
+        """
+        bucket = int(seconds / BUCKET_SEC)
+        if bucket >= BUCKET_COUNT:
+            bucket = BUCKET_COUNT - 1
+        samples = self._samples
+        if len(samples) == samples.maxlen:
+            self._counts[samples[0]] -= 1
+        samples.append(bucket)
+        self._counts[bucket] += 1
+        if seconds > self._max_sec:
+            self._max_sec = seconds
+
+    def count(self) -> int:
+        """
+        Return the number of samples in the window.
+
+        RU: Возвращает число отсчётов в окне.
+        """
+        return len(self._samples)
+
+    def percentile(self, q: float) -> float:
+        """
+        Return the upper bucket edge for quantile q in seconds.
+
+        EN: Returns 0.0 for an empty histogram.
+        RU: Возвращает верхнюю границу корзины для квантиля q в секундах.
+        Для пустой гистограммы возвращает 0.0.
+        """
+        total = len(self._samples)
+        if not total:
+            return 0.0
+        rank = q * total
+        seen = 0
+        for bucket, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                return (bucket + 1) * BUCKET_SEC
+        return BUCKET_COUNT * BUCKET_SEC
+
+    def summary(self) -> dict:
+        """
+        Return count, p50/p95/p99, and max in milliseconds.
+
+        EN: max is tracked since creation, not only over the window.
+        RU: Возвращает count, p50/p95/p99 и max в миллисекундах. max
+        отслеживается с момента создания, а не только по окну.
+        """
+        return {
+            "count": self.count(),
+            "p50_ms": round(self.percentile(0.50) * 1000, 2),
+            "p95_ms": round(self.percentile(0.95) * 1000, 2),
+            "p99_ms": round(self.percentile(0.99) * 1000, 2),
+            "max_ms": round(self._max_sec * 1000, 2),
+        }
+
+
+class RollingStats:
+    """
+    Base of the debug statistics collectors built on rolling histograms.
+
+    EN: Subclasses create their state in _clear() and describe it in
+    summary(); the base provides reset() and an atomic JSON dump.
+    RU: Основа отладочных сборщиков статистики на скользящих гистограммах.
+    Подклассы создают состояние в _clear() и описывают его в summary();
+    основа даёт reset() и атомарную запись JSON.
+    """
+
+    def __init__(self, window: int) -> None:
+        """
+        Remember the histogram window and create empty state.
+
+        RU: Запоминает окно гистограмм и создаёт пустое состояние.
+        """
+        self._window = window
+        self._clear()
+
+    def _clear(self) -> None:
+        raise NotImplementedError
+
+    def summary(self) -> dict:
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        """
+        Drop all collected samples and counters.
+
+        RU: Удаляет все собранные отсчёты и счётчики.
+        """
+        self._clear()
+
+    def dump_json(self, path: Path) -> None:
+        """
+        Write the summary to path atomically.
+
+        RU: Атомарно записывает сводку в path.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = path.with_suffix(".tmp")
+        with tmp_file.open("w", encoding="utf-8") as fh:
+            json.dump(self.summary(), fh, ensure_ascii=False, indent=2)
+        os.replace(tmp_file, path)
+
+
+class FrameProfiler(RollingStats):
+    """
+    Collect phase timings and frame statistics for the gameplay runtime.
+
+    EN: Callers measure phases with time.perf_counter and report them via
+    add(); end_frame() records the frame dt against the frame interval the
+    loop actually delivers (see GameLoop.frame_interval).
+    RU: Собирает тайминги фаз и статистику кадров для игрового runtime.
+    Вызывающий код измеряет фазы через time.perf_counter и передаёт их в
+    add(); end_frame() учитывает dt кадра относительно интервала кадра,
+    который реально обеспечивает цикл (см. GameLoop.frame_interval).
+    """
+
+    def __init__(self, window: int = 600) -> None:
+        """
+        Create a rolling histogram per phase.
+
+        RU: Создаёт скользящую гистограмму для каждой фазы.
+        """
+        super().__init__(window)
+
+    def _clear(self) -> None:
+        window = self._window
+        self._histograms = {phase: RollingHistogram(window) for phase in PHASES}
+        self._frame_dt = RollingHistogram(window)
+        self.frames = 0
+        self.dropped_frames = 0
+
+    def add(self, phase: str, seconds: float) -> None:
+        """
+        Record a duration for a phase, creating its histogram on demand.
+
+        RU: Записывает длительность фазы, создавая гистограмму по требованию.
+        """
+        histogram = self._histograms.get(phase)
+        if histogram is None:
+            histogram = self._histograms[phase] = RollingHistogram(self._window)
+        histogram.add(seconds)
+
+    def end_frame(self, dt: float, budget_sec: float) -> None:
+        """
+        Count a finished frame and flag it as dropped if dt overran.
+
+        RU: Учитывает завершённый кадр и помечает его пропущенным при перерасходе.
+        """
+        self.frames += 1
+        self._frame_dt.add(dt)
+        if dt > budget_sec * DROPPED_RATIO:
+            self.dropped_frames += 1
+
+    def summary(self) -> dict:
+        """
+        Return a JSON-serializable snapshot of all statistics.
+
+        RU: Возвращает JSON-сериализуемый снимок всей статистики.
+        """
+        return {
+            "frames": self.frames,
+            "dropped_frames": self.dropped_frames,
+            "frame_dt": self._frame_dt.summary(),
+            "phases": {
+                phase: histogram.summary()
+                for phase, histogram in self._histograms.items()
+                if histogram.count()
+            },
+        }
+
+    def overlay_text(self) -> str:
+        """
+        Format a compact multi-line summary for an on-screen overlay.
+
+        RU: Форматирует компактную многострочную сводку для экранного оверлея.
+        """
+        summary = self.summary()
+        frame_dt = summary["frame_dt"]
+        lines = [
+            f"dt p50={frame_dt['p50_ms']} p95={frame_dt['p95_ms']} "
+            f"p99={frame_dt['p99_ms']} drop={summary['dropped_frames']}/{summary['frames']}"
+        ]
+        for phase, stats in summary["phases"].items():
+            lines.append(f"{phase} p50={stats['p50_ms']} p95={stats['p95_ms']} p99={stats['p99_ms']}")
+        return "\n".join(lines)
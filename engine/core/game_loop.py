@@ -1,10 +1,96 @@
 """
 Clock-based scheduler for the main game tick.
 
-RU: Планировщик игрового тика на базе Kivy Clock.
+EN: Supports switching the target rate at runtime, an idle mode that
+suspends ticking until woken, and a frame-budget monitor that lowers the
+tick rate when frames keep overrunning. Kivy's Clock never runs faster than
+`graphics.maxfps`, so rates above it are scheduled and budgeted at maxfps;
+main.py raises maxfps to the top of FPS_LADDER before Kivy starts.
+RU: Планировщик игрового тика на базе Kivy Clock. Поддерживает смену
+целевой частоты на лету, режим простоя, который приостанавливает тик до
+пробуждения, и монитор бюджета кадра, снижающий частоту при постоянных
+перерасходах. Clock в Kivy не работает быстрее `graphics.maxfps`, поэтому
+частоты выше неё планируются и оцениваются по maxfps; main.py поднимает
+maxfps до верха FPS_LADDER до запуска Kivy.
 """
 
+from time import perf_counter
+
 from kivy.clock import Clock
+from kivy.config import Config
+
+# EN: Tick rates the budget monitor may step through, highest first.
+# RU: Частоты тика, по которым может шагать монитор бюджета, от большей.
+FPS_LADDER = (120, 90, 60, 45, 30)
+
+# EN: A frame overruns when dt exceeds the budget by this ratio.
+# RU: Кадр считается перерасходом, если dt превышает бюджет в это число раз.
+OVERRUN_RATIO = 1.5
+
+# EN: A higher rate is restored only if the slowest tick used at most this
+# share of its budget.
+# RU: Более высокая частота возвращается, только если самый медленный тик
+# занял не больше этой доли её бюджета.
+HEADROOM_RATIO = 0.5
+
+# EN: Number of frames evaluated before the rate is changed.
+# RU: Число кадров, оцениваемых перед сменой частоты.
+BUDGET_WINDOW = 60
+
+# EN: Tolerance for displays reporting slightly less than a ladder rate
+# (e.g. 59.94 Hz).
+# RU: Допуск для дисплеев, сообщающих чуть меньшую частоту, чем на лестнице
+# (например, 59.94 Гц).
+REFRESH_TOLERANCE_HZ = 1.0
+
+# EN: A rate the monitor dropped from is retried only once the slowest tick
+# is at most this share of the slowest tick that caused the drop.
+# RU: Частота, с которой монитор опустился, пробуется снова, только когда
+# самый медленный тик не больше этой доли самого медленного тика, из-за
+# которого было снижение.
+RETRY_TICK_RATIO = 0.5
+
+
+def clock_max_fps():
+    """
+    Return Kivy's `graphics.maxfps` frame cap, or 0 when it is unlimited.
+
+    RU: Возвращает ограничение кадров Kivy `graphics.maxfps` или 0, если
+    ограничения нет.
+    """
+    try:
+        return max(0, Config.getint("graphics", "maxfps"))
+    except (ValueError, LookupError):
+        return 0
+
+
+def effective_fps(fps):
+    """
+    Return the rate the Clock can actually deliver for a target fps.
+
+    RU: Возвращает частоту, которую Clock реально может обеспечить для
+    целевой fps.
+    """
+    max_fps = clock_max_fps()
+    return min(fps, max_fps) if max_fps else fps
+
+
+def fps_for_refresh_rate(refresh_rate, default=60):
+    """
+    Return the highest FPS_LADDER rate a display refreshing at refresh_rate can show.
+
+    EN: Returns default when the refresh rate is unknown. The result never
+    exceeds the Clock frame cap, since faster ticks would not be delivered.
+    RU: Возвращает наибольшую частоту из FPS_LADDER, которую может показать
+    дисплей с частотой refresh_rate. Возвращает default, если частота
+    неизвестна. Результат не превышает ограничение кадров Clock, так как
+    более частые тики не будут доставлены.
+    """
+    limit = effective_fps(refresh_rate) if refresh_rate and refresh_rate > 0 else effective_fps(default)
+    for rate in FPS_LADDER:
+        if rate <= limit + REFRESH_TOLERANCE_HZ:
+            return rate
+    return FPS_LADDER[-1]
 
 
 class GameLoop:
@@ -20,16 +106,60 @@ class GameLoop:
         RU: Инициализирует объект без запланированного события.
         """
         self._event = None
+        self._tick_fn = None
+        self._target_fps = 60
+        self._fps = 60
+        self._suspended = False
+        self.adaptive = True
+        self._reset_budget()
+        self._clear_retry_block()
+
+    @property
+    def fps(self):
+        """
+        Return the currently scheduled tick rate.
+
+        RU: Возвращает текущую запланированную частоту тика.
+        """
+        return self._fps
+
+    @property
+    def frame_interval(self):
+        """
+        Return the expected seconds between ticks at the current rate.
+
+        EN: Accounts for the Clock frame cap, so it is the budget a frame is
+        actually measured against.
+        RU: Возвращает ожидаемое число секунд между тиками при текущей
+        частоте. Учитывает ограничение кадров Clock, поэтому это бюджет, с
+        которым реально сравнивается кадр.
+        """
+        return 1.0 / effective_fps(self._fps)
+
+    def is_suspended(self):
+        """
+        Return True while the loop is idle and waiting to be resumed.
+
+        RU: Возвращает True, пока цикл простаивает и ждёт возобновления.
+        """
+        return self._suspended
 
     def start(self, tick_fn, fps=60):
         """
         Start scheduling the tick callback at the requested FPS.
 
+        EN: Also resumes a suspended loop with the new callback.
         RU: Запускает планирование тика с указанной частотой кадров.
+        Также возобновляет приостановленный цикл с новым колбэком.
         """
         if self._event:
             return
-        self._event = Clock.schedule_interval(tick_fn, 1.0 / fps)
+        self._tick_fn = tick_fn
+        self._target_fps = fps
+        self._fps = fps
+        self._suspended = False
+        self._clear_retry_block()
+        self._schedule()
 
     def stop(self):
         """
@@ -37,7 +167,148 @@ class GameLoop:
 
         RU: Останавливает запланированный тик, если он запущен.
         """
+        self._suspended = False
+        self._tick_fn = None
+        if not self._event:
+            return
+        self._event.cancel()
+        self._event = None
+
+    def set_target_fps(self, fps):
+        """
+        Switch the target tick rate, rescheduling a running loop.
+
+        RU: Меняет целевую частоту тика и перепланирует запущенный цикл.
+        """
+        self._target_fps = fps
+        self._clear_retry_block()
+        self._set_fps(fps)
+
+    def suspend(self):
+        """
+        Enter idle mode: cancel ticking but keep the callback for resume().
+
+        RU: Переходит в режим простоя: отменяет тик, сохраняя колбэк для resume().
+        """
         if not self._event:
             return
         self._event.cancel()
         self._event = None
+        self._suspended = True
+
+    def resume(self):
+        """
+        Leave idle mode and continue ticking at the current rate.
+
+        RU: Выходит из режима простоя и продолжает тик с текущей частотой.
+        """
+        if not self._suspended or self._tick_fn is None:
+            return
+        self._suspended = False
+        self._schedule()
+
+    def _schedule(self):
+        """
+        Schedule the wrapped tick at the current rate.
+
+        EN: The budget window restarts because the first dt after a
+        (re)schedule is not representative.
+        RU: Планирует обёрнутый тик с текущей частотой. Окно бюджета
+        начинается заново, так как первый dt после планирования нерепрезентативен.
+        """
+        self._reset_budget()
+        self._event = Clock.schedule_interval(self._run, self.frame_interval)
+
+    def _set_fps(self, fps):
+        """
+        Apply a tick rate and reschedule if currently ticking.
+
+        RU: Применяет частоту тика и перепланирует, если цикл активен.
+        """
+        self._fps = fps
+        if self._event:
+            self._event.cancel()
+            self._schedule()
+
+    def _run(self, dt):
+        """
+        Invoke the tick callback and feed its frame time to the monitor.
+
+        RU: Вызывает колбэк тика и передаёт время кадра монитору.
+        """
+        started = perf_counter()
+        self._tick_fn(dt)
+        if self._event and self.adaptive:
+            self._track_budget(dt, perf_counter() - started)
+
+    def _reset_budget(self):
+        """
+        Clear frame-budget counters.
+
+        RU: Сбрасывает счётчики бюджета кадра.
+        """
+        self._skip_next = True
+        self._frames = 0
+        self._overruns = 0
+        self._slowest_tick = 0.0
+
+    def _clear_retry_block(self):
+        """
+        Allow climbing to any rate up to the target again.
+
+        RU: Снова разрешает подъём до любой частоты вплоть до целевой.
+        """
+        self._dropped_from = None
+        self._drop_tick = 0.0
+
+    def _track_budget(self, dt, tick_cost):
+        """
+        Count overrunning frames and step the rate down or back up.
+
+        EN: Drops one ladder rung when at least half of a window overran.
+        Climbs one rung toward the target after a window with no overruns
+        whose slowest tick fits the higher rate with headroom. A rate the
+        monitor dropped from is retried only when ticks got clearly cheaper
+        than in the window that caused the drop (RETRY_TICK_RATIO), so a
+        cause the tick cost does not show (e.g. a display or Clock cap)
+        does not make the rate oscillate.
+        RU: Считает кадры с перерасходом и меняет частоту. Опускается на одну
+        ступень, если перерасходом была хотя бы половина окна. Поднимается на
+        ступень к цели после окна без перерасходов, если самый медленный тик
+        укладывается в более высокую частоту с запасом. Частота, с которой
+        монитор опустился, пробуется снова, только если тики стали заметно
+        дешевле, чем в окне, вызвавшем снижение (RETRY_TICK_RATIO), поэтому
+        причина, не видная по стоимости тика (например, ограничение дисплея
+        или Clock), не вызывает колебаний частоты.
+        """
+        if self._skip_next:
+            self._skip_next = False
+            return
+        self._frames += 1
+        if dt > OVERRUN_RATIO * self.frame_interval:
+            self._overruns += 1
+        if tick_cost > self._slowest_tick:
+            self._slowest_tick = tick_cost
+        if self._frames < BUDGET_WINDOW:
+            return
+        overruns = self._overruns
+        slowest_tick = self._slowest_tick
+        self._frames = 0
+        self._overruns = 0
+        self._slowest_tick = 0.0
+        if overruns * 2 >= BUDGET_WINDOW:
+            lower = [rate for rate in FPS_LADDER if rate < self._fps]
+            if lower:
+                self._dropped_from = self._fps
+                self._drop_tick = slowest_tick
+                self._set_fps(lower[0])
+        elif overruns == 0 and self._fps < self._target_fps:
+            higher = [rate for rate in FPS_LADDER if self._fps < rate <= self._target_fps]
+            next_fps = higher[-1] if higher else self._target_fps
+            if slowest_tick > HEADROOM_RATIO / next_fps:
+                return
+            if self._dropped_from is not None and next_fps >= self._dropped_from:
+                if slowest_tick > RETRY_TICK_RATIO * self._drop_tick:
+                    return
+                self._clear_retry_block()
+            self._set_fps(next_fps)
@@ -4,12 +4,23 @@ Mutable state holder for the current game session.
 RU: Изменяемое хранилище состояния текущей игровой сессии.
 """
 
+# EN: Events published to GameState listeners as listener(event, value).
+# RU: События, передаваемые слушателям GameState как listener(event, value).
+SCORE_CHANGED = "score_changed"
+GAME_OVER = "game_over"
+
 
 class GameState:
     """
     Store runtime flags and offsets used by motion, rendering, and scoring.
 
+    EN: Listeners are notified when the passed row counter changes and when
+    the run is marked as over, so the HUD reacts to changes instead of
+    polling the state every frame.
     RU: Хранит флаги и смещения, используемые движением, рендером и счётом.
+    Слушатели уведомляются при изменении счётчика пройденных рядов и при
+    завершении забега, поэтому HUD реагирует на изменения, а не опрашивает
+    состояние каждый кадр.
     """
     def __init__(self):
         """
@@ -17,14 +28,50 @@ class GameState:
 
         RU: Инициализирует все поля состояния значениями по умолчанию.
         """
+        self._listeners = []
+        self._current_y_loop = 0
         self.state_game_over = False
         self.state_game_has_started = False
         self.current_offset_x = 0
         self.current_offset_y = 0
-        self.current_y_loop = 0
         self.current_speed_x = 0
         self.speed_y_factor = 1.0
 
+    @property
+    def current_y_loop(self):
+        """
+        Return the number of passed rows, which is also the score.
+
+        RU: Возвращает число пройденных рядов, оно же счёт.
+        """
+        return self._current_y_loop
+
+    @current_y_loop.setter
+    def current_y_loop(self, value):
+        if value == self._current_y_loop:
+            return
+        self._current_y_loop = value
+        if self._listeners:
+            self._notify(SCORE_CHANGED, value)
+
+    def add_listener(self, listener):
+        """
+        Call listener(event, value) for SCORE_CHANGED and GAME_OVER.
+
+        RU: Вызывает listener(event, value) для SCORE_CHANGED и GAME_OVER.
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """
+        Stop notifying listener; unknown listeners are ignored.
+
+        RU: Прекращает уведомлять listener; неизвестные слушатели игнорируются.
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
     def reset(self):
         """
         Reset offsets, speed, and flags for a fresh run.
@@ -51,6 +98,16 @@ class GameState:
         """
         Mark the game as over to stop progression.
 
+        EN: Publishes GAME_OVER with the final score once per run.
         RU: Помечает игру как завершённую, чтобы остановить прогресс.
+        Публикует GAME_OVER с итоговым счётом один раз за забег.
         """
+        if self.state_game_over:
+            return
         self.state_game_over = True
+        if self._listeners:
+            self._notify(GAME_OVER, self._current_y_loop)
+
+    def _notify(self, event, value):
+        for listener in list(self._listeners):
+            listener(event, value)
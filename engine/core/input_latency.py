@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""
+Opt-in input-to-render latency tracker for lateral controls.
+
+EN: An input handler stamps the moment it fires (time.perf_counter) and the
+stamp travels with the command to the runtime, which marks it here together
+with the direction the command moves the lateral offset and the time the
+input queue releases it. The first game tick at or after that time applies
+the command and takes the last rendered offset as the baseline; the input
+is resolved by the first later render whose offset moved from that baseline
+in the expected direction, so movement caused by other commands does not
+close it. Each input path (step, linear, HUD buttons) gets rolling
+histograms of the total latency and of its two parts: `wait` (input until
+the game tick that applies it starts, i.e. Clock scheduling) and `render`
+(that tick until the render that shows it). A deliberately delayed input (a
+touch hold) is timed from the end of its delay. The render timestamp is
+taken when the canvas is updated; the buffer swap follows within one vsync.
+Pure Python, no Kivy dependencies.
+RU: Опциональный трекер задержки от ввода до рендера для бокового
+управления. Обработчик ввода фиксирует момент срабатывания
+(time.perf_counter), отметка передаётся с командой в runtime, который
+регистрирует её здесь вместе с направлением, в котором команда сдвигает
+боковое смещение, и временем, когда очередь ввода её выпускает. Первый
+игровой тик в этот момент или позже применяет команду и берёт последнее
+отрисованное смещение как базовое; ввод закрывает первый последующий
+рендер, смещение которого ушло от базового в ожидаемую сторону, поэтому
+движение от других команд его не закрывает. Для каждого пути ввода (шаг,
+линейный, кнопки HUD) ведутся скользящие гистограммы полной задержки и двух
+её частей: `wait` (от ввода до начала игрового тика, который его применяет,
+т.е. планирование Clock) и `render` (от этого тика до рендера, который его
+показывает). Намеренно отложенный ввод (удержание касания) замеряется от
+конца задержки. Время рендера берётся при обновлении canvas; смена буфера
+следует в пределах одного vsync. Чистый Python без зависимостей от Kivy.
+"""
+
+from __future__ import annotations
+
+from engine.core.frame_profiler import RollingHistogram, RollingStats
+
+# EN: Input paths reported separately.
+# RU: Пути ввода, по которым ведётся отдельная статистика.
+PATH_STEP = "step"
+PATH_LINEAR = "linear"
+PATH_HUD = "hud"
+PATHS = (PATH_STEP, PATH_LINEAR, PATH_HUD)
+
+# EN: Inputs not shown on screen within this time are counted as expired
+# (e.g. the ship was already at the road edge or the run was over).
+# RU: Вводы, не показанные на экране за это время, считаются просроченными
+# (например, корабль уже у края дороги или забег окончен).
+PENDING_TIMEOUT_SEC = 1.0
+
+# EN: Upper bound of inputs waiting for a render.
+# RU: Верхняя граница числа вводов, ожидающих рендера.
+MAX_PENDING = 32
+
+
+class InputLatencyTracker(RollingStats):
+    """
+    Match stamped inputs to the first render that moved the ship.
+
+    EN: mark() is called when a command is queued, drop_delayed() when a
+    queued delayed command is superseded, drop_unapplied() when the queue is
+    cleared, on_tick() when the game tick applies queued commands and
+    on_render() after every surface render.
+    RU: Сопоставляет отмеченные вводы с первым рендером, сдвинувшим корабль.
+    mark() вызывается при постановке команды в очередь, drop_delayed() —
+    когда отложенная команда в очереди заменяется, drop_unapplied() — когда
+    очередь очищается, on_tick() — когда игровой тик применяет команды,
+    on_render() — после каждого рендера.
+    """
+
+    def __init__(self, window: int = 200) -> None:
+        """
+        Create empty histograms per input path.
+
+        RU: Создаёт пустые гистограммы для каждого пути ввода.
+        """
+        super().__init__(window)
+
+    def _clear(self) -> None:
+        window = self._window
+        self._histograms = {
+            f"{path}{suffix}": RollingHistogram(window)
+            for path in PATHS
+            for suffix in ("", ".wait", ".render")
+        }
+        # EN: Entries are [path, start, direction, due, baseline, tick_time].
+        # RU: Записи имеют вид [path, start, direction, due, baseline, tick_time].
+        self._pending: list[list] = []
+        self._offset_x = 0.0
+        self.expired = {path: 0 for path in PATHS}
+
+    def mark(self, path: str, input_time: float, direction: int, due: float, delay: float = 0.0) -> None:
+        """
+        Start timing an input that moves the offset towards sign(direction).
+
+        EN: due is the time the input queue releases the command; delay is
+        the deliberate hold delay, excluded from the measured latency.
+        RU: Начинает замер ввода, сдвигающего смещение в сторону
+        sign(direction). due — время, когда очередь ввода выпускает команду;
+        delay — намеренная задержка удержания, не входящая в замер.
+        """
+        pending = self._pending
+        if len(pending) >= MAX_PENDING:
+            self.expired[pending.pop(0)[0]] += 1
+        pending.append([path, input_time + delay, direction, due, None, None])
+
+    def drop_delayed(self, now: float) -> None:
+        """
+        Forget inputs whose delayed command was superseded before it was due.
+
+        RU: Забывает вводы, отложенная команда которых заменена до своего
+        срока.
+        """
+        self._pending = [entry for entry in self._pending if entry[3] <= now]
+
+    def drop_unapplied(self) -> None:
+        """
+        Forget inputs whose command was discarded before any tick applied it.
+
+        RU: Забывает вводы, команда которых отброшена до применения тиком.
+        """
+        self._pending = [entry for entry in self._pending if entry[5] is not None]
+
+    def on_tick(self, now: float) -> None:
+        """
+        Stamp inputs applied by this tick and take their baseline offset.
+
+        RU: Отмечает вводы, применяемые этим тиком, и берёт их базовое
+        смещение.
+        """
+        for entry in self._pending:
+            if entry[5] is None and entry[3] <= now:
+                entry[4] = self._offset_x
+                entry[5] = now
+
+    def on_render(self, offset_x: float, now: float) -> None:
+        """
+        Resolve applied inputs whose direction the rendered offset moved in.
+
+        RU: Закрывает применённые вводы, в направлении которых сдвинулось
+        отрисованное смещение.
+        """
+        self._offset_x = offset_x
+        pending = self._pending
+        if not pending:
+            return
+        histograms = self._histograms
+        keep = []
+        for entry in pending:
+            path, start, direction, _due, baseline, tick_time = entry
+            if tick_time is not None and (offset_x - baseline) * direction > 0:
+                histograms[path].add(now - start)
+                histograms[path + ".wait"].add(tick_time - start)
+                histograms[path + ".render"].add(now - tick_time)
+            elif now - start > PENDING_TIMEOUT_SEC:
+                self.expired[path] += 1
+            else:
+                keep.append(entry)
+        self._pending = keep
+
+    def summary(self) -> dict:
+        """
+        Return a JSON-serializable snapshot per input path.
+
+        RU: Возвращает JSON-сериализуемый снимок по каждому пути ввода.
+        """
+        out = {}
+        for path in PATHS:
+            histogram = self._histograms[path]
+            out[path] = {
+                "total": histogram.summary(),
+                "wait": self._histograms[path + ".wait"].summary(),
+                "render": self._histograms[path + ".render"].summary(),
+                "expired": self.expired[path],
+            }
+        return out
+
+    def overlay_text(self) -> str:
+        """
+        Format one line per input path with samples for an on-screen readout.
+
+        RU: Форматирует по строке на каждый путь ввода с отсчётами для
+        экранного вывода.
+        """
+        lines = []
+        for path, stats in self.summary().items():
+            total = stats["total"]
+            if not total["count"]:
+                continue
+            lines.append(
+                f"in.{path} n={total['count']} p50={total['p50_ms']} p95={total['p95_ms']} "
+                f"wait={stats['wait']['p50_ms']} render={stats['render']['p50_ms']}"
+            )
+        return "\n".join(lines) or "in: no samples"
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Timestamped queue of input commands drained by the game tick.
+
+EN: Input adapters push commands (the names used by run recordings) instead
+of mutating the simulation from their own Clock callbacks. The runtime tick
+drains every due command once per frame, in push order, right before the
+simulation advances, so lateral input, motion and collision happen in one
+callback and in the same order a replay applies them. A command may be
+delayed (a touch hold starts linear motion only after a short delay); a new
+command with supersede=True drops pending delayed commands of the same name,
+so releasing a touch before the delay cancels the pending start. The module
+has no Kivy dependencies.
+RU: Очередь команд ввода с отметками времени, которую разбирает игровой
+тик. Адаптеры ввода кладут команды (имена как в записях забега), а не
+меняют симуляцию из собственных колбэков Clock. Тик runtime раз за кадр
+разбирает все наступившие команды в порядке добавления прямо перед шагом
+симуляции, поэтому боковой ввод, движение и коллизии происходят в одном
+колбэке и в том же порядке, в каком их применяет повтор. Команду можно
+отложить (удержание касания включает линейное движение после короткой
+задержки); новая команда с supersede=True отбрасывает отложенные команды с
+тем же именем, поэтому отпускание касания до задержки отменяет старт.
+Модуль не зависит от Kivy.
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+from typing import Any, Callable
+
+
+class InputQueue:
+    """
+    FIFO of (time, name, arg) commands with optional delayed entries.
+
+    EN: Entries are kept sorted by due time; entries with the same due time
+    keep their push order.
+    RU: Очередь команд (время, имя, аргумент) с необязательными отложенными
+    записями. Записи упорядочены по времени срабатывания; записи с
+    одинаковым временем сохраняют порядок добавления.
+    """
+
+    def __init__(self, clock: Callable[[], float] = perf_counter) -> None:
+        """
+        Create an empty queue using clock() for timestamps.
+
+        RU: Создаёт пустую очередь, беря отметки времени из clock().
+        """
+        self._clock = clock
+        self._entries: list[tuple[float, str, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def push(self, name: str, arg: Any = None, delay: float = 0.0, supersede: bool = False) -> None:
+        """
+        Queue a command due now, or after delay seconds.
+
+        EN: With supersede=True, pending delayed commands with the same name
+        are dropped first.
+        RU: Ставит команду в очередь на сейчас или через delay секунд. При
+        supersede=True сначала отбрасываются отложенные команды с тем же
+        именем.
+        """
+        now = self._clock()
+        entries = self._entries
+        if supersede:
+            entries[:] = [entry for entry in entries if entry[1] != name or entry[0] <= now]
+        due = now + delay if delay > 0 else now
+        index = len(entries)
+        while index and entries[index - 1][0] > due:
+            index -= 1
+        entries.insert(index, (due, name, arg))
+
+    def drain(self, now: float | None = None) -> list[tuple[str, Any]]:
+        """
+        Remove and return (name, arg) for every command due at now.
+
+        RU: Удаляет и возвращает (name, arg) для каждой команды, срок которой
+        наступил к моменту now.
+        """
+        entries = self._entries
+        if not entries:
+            return []
+        if now is None:
+            now = self._clock()
+        count = 0
+        while count < len(entries) and entries[count][0] <= now:
+            count += 1
+        if not count:
+            return []
+        self._entries = entries[count:]
+        return [(name, arg) for _, name, arg in entries[:count]]
+
+    def clear(self) -> None:
+        """
+        Drop all queued commands.
+
+        RU: Отбрасывает все команды в очереди.
+        """
+        self._entries.clear()
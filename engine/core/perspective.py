@@ -5,6 +5,11 @@ RU: Математика перспективной проекции для пр
 в экранные.
 """
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class Perspective:
     """
@@ -65,3 +70,37 @@ class Perspective:
         tr_y = self.perspective_point_y - factor_y * self.perspective_point_y
 
         return int(tr_x), int(tr_y)
+
+    def transform_batch(self, points, height):
+        """
+        Project a flat [x0, y0, x1, y1, ...] sequence in one call.
+
+        EN: Returns a flat list of int screen coordinates matching
+        transform_perspective for every vertex. Uses NumPy when it is
+        installed and a single hoisted loop otherwise.
+        RU: Проецирует плоскую последовательность [x0, y0, x1, y1, ...] за
+        один вызов. Возвращает плоский список целых экранных координат, как
+        transform_perspective для каждой вершины. Использует NumPy, если он
+        установлен, иначе один цикл с вынесенными константами.
+        """
+        ppx = self.perspective_point_x
+        ppy = self.perspective_point_y
+        if np is not None:
+            coords = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+            lin_y = np.minimum(coords[:, 1] * ppy / height, ppy)
+            factor_y = ((ppy - lin_y) / ppy) ** 4
+            out = np.empty_like(coords)
+            out[:, 0] = ppx + (coords[:, 0] - ppx) * factor_y
+            out[:, 1] = ppy - factor_y * ppy
+            return out.astype(np.int64).ravel().tolist()
+
+        out = [0] * len(points)
+        for i in range(0, len(points), 2):
+            lin_y = points[i + 1] * ppy / height
+            if lin_y > ppy:
+                lin_y = ppy
+            factor_y = (ppy - lin_y) / ppy
+            factor_y = factor_y ** 4
+            out[i] = int(ppx + (points[i] - ppx) * factor_y)
+            out[i + 1] = int(ppy - factor_y * ppy)
+        return out
@@ -4,13 +4,140 @@ Pure geometry calculations for road lines and tile rectangles.
 RU: Чистые геометрические вычисления для дорожных линий и прямоугольников тайлов.
 """
 
+# EN: First row index of the horizontal line table; row -1 covers the row
+# just behind the ship that collision may probe near a grid line.
+# RU: Первый индекс ряда в таблице горизонтальных линий; ряд -1 покрывает
+# ряд сразу за кораблём, который коллизия может проверить у линии сетки.
+LINE_Y_START = -1
+
 
 class RoadGeometry:
     """
-    Provide stateless helpers for road and tile coordinates.
+    Provide helpers and per-frame line tables for road and tile coordinates.
 
-    RU: Предоставляет статeless-хелперы для координат дороги и тайлов.
+    EN: update_tables() precomputes the X of every vertical line and the Y
+    of every horizontal line for one frame, so renderers and collision index
+    line_xs/line_ys instead of calling the per-line methods. The methods
+    stay for one-off queries and give identical values.
+    RU: Предоставляет хелперы и покадровые таблицы линий для координат
+    дороги и тайлов. update_tables() заранее вычисляет X каждой вертикальной
+    и Y каждой горизонтальной линии для кадра, поэтому рендеры и коллизии
+    берут значения из line_xs/line_ys вместо вызова методов для каждой
+    линии. Методы остаются для разовых запросов и дают те же значения.
     """
+    def __init__(self):
+        """
+        Start with empty line tables.
+
+        RU: Начинает с пустых таблиц линий.
+        """
+        self.line_x_start = 0
+        self.line_xs = []
+        self.line_ys = []
+        self.spacing_x = 0.0
+        self.spacing_y = 0.0
+        self.perspective_point_x = 0.0
+        self.offset_x = 0.0
+        self.offset_y = 0.0
+        self._x_key = None
+        self._y_key = None
+
+    def update_tables(
+        self,
+        width,
+        height,
+        perspective_point_x,
+        current_offset_x,
+        current_offset_y,
+        config,
+        rows=None,
+    ):
+        """
+        Rebuild the line tables for the current frame where inputs changed.
+
+        EN: line_xs[i] is the X of vertical line line_x_start + i;
+        line_ys[i] is the Y of horizontal line LINE_Y_START + i, for rows up
+        to rows (H_NB_LINES when None). Each axis is rebuilt only when its
+        inputs changed, so lateral-only or forward-only motion costs one axis.
+        RU: Перестраивает таблицы линий для кадра там, где изменились входные
+        данные. line_xs[i] — X вертикальной линии line_x_start + i;
+        line_ys[i] — Y горизонтальной линии LINE_Y_START + i для рядов до
+        rows (H_NB_LINES при None). Каждая ось перестраивается, только если
+        изменились её входные данные.
+        """
+        x_key = (width, perspective_point_x, current_offset_x, config.V_NB_LINES, config.V_LINES_SPACING)
+        if x_key != self._x_key:
+            start_index, end_index = self.vertical_line_range(config)
+            spacing_x = config.V_LINES_SPACING * width
+            self.spacing_x = spacing_x
+            self.perspective_point_x = perspective_point_x
+            self.offset_x = current_offset_x
+            self.line_x_start = start_index
+            self.line_xs = [
+                perspective_point_x + (index - 0.5) * spacing_x + current_offset_x
+                for index in range(start_index, end_index + 1)
+            ]
+            self._x_key = x_key
+        if rows is None:
+            rows = config.H_NB_LINES
+        y_key = (height, current_offset_y, config.H_LINES_SPACING, rows)
+        if y_key != self._y_key:
+            spacing_y = config.H_LINES_SPACING * height
+            self.spacing_y = spacing_y
+            self.offset_y = current_offset_y
+            self.line_ys = [index * spacing_y - current_offset_y for index in range(LINE_Y_START, rows + 1)]
+            self._y_key = y_key
+
+    def line_index_at_x(self, x):
+        """
+        Return the fractional vertical line index at world X from the tables.
+
+        EN: Inverse of the line_xs formula; floor() of the result is the
+        tile_x whose column contains x.
+        RU: Возвращает дробный индекс вертикальной линии для мировой X по
+        таблицам. Обратная формула к line_xs; floor() результата даёт tile_x
+        колонки, содержащей x.
+        """
+        return (x - self.perspective_point_x - self.offset_x) / self.spacing_x + 0.5
+
+    def line_index_at_y(self, y):
+        """
+        Return the fractional horizontal line index at world Y from the tables.
+
+        EN: Inverse of the line_ys formula; floor() of the result is the row
+        relative to current_y_loop.
+        RU: Возвращает дробный индекс горизонтальной линии для мировой Y по
+        таблицам. Обратная формула к line_ys; floor() результата даёт ряд
+        относительно current_y_loop.
+        """
+        return (y + self.offset_y) / self.spacing_y
+
+    def tile_world_points(self, tiles_coordinates, count, current_y_loop):
+        """
+        Return flat world corners of the first count tiles from the tables.
+
+        EN: Corners are (xmin, ymin), (xmin, ymax), (xmax, ymax), (xmax, ymin)
+        per tile. The tables must cover every tile row; pass the highest
+        relative row + 1 as rows to update_tables().
+        RU: Возвращает плоский список мировых углов первых count тайлов по
+        таблицам: (xmin, ymin), (xmin, ymax), (xmax, ymax), (xmax, ymin) на
+        тайл. Таблицы должны покрывать все ряды тайлов; передайте в
+        update_tables() наибольший относительный ряд + 1 как rows.
+        """
+        xs = self.line_xs
+        ys = self.line_ys
+        x0 = self.line_x_start
+        y0 = current_y_loop + LINE_Y_START
+        points = []
+        for i in range(count):
+            tile_x, tile_y = tiles_coordinates[i]
+            xmin = xs[tile_x - x0]
+            xmax = xs[tile_x - x0 + 1]
+            ymin = ys[tile_y - y0]
+            ymax = ys[tile_y - y0 + 1]
+            points += (xmin, ymin, xmin, ymax, xmax, ymax, xmax, ymin)
+        return points
+
     def vertical_line_range(self, config):
         """
         Compute the inclusive index range for vertical grid lines.
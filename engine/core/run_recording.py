@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""
+Compact recording of one gameplay run for deterministic replay.
+
+EN: A run is fully described by the tile generator seed, the config and
+viewport it started with, the frame time of every advance() call, and the
+input commands applied between frames. Frame times are stored as packed
+float64 (zlib + base64) so a ten-minute run stays a few hundred KB; commands
+are `[frame, name, arg]` triples where `frame` is the number of frames
+advanced before the command, so the timestamp of a command is the sum of
+the preceding frame times. The module has no Kivy dependencies.
+RU: Компактная запись одного забега для детерминированного повтора. Забег
+полностью описывается seed генератора тайлов, конфигом и размером окна на
+старте, временем кадра каждого вызова advance() и командами ввода между
+кадрами. Время кадров хранится упакованными float64 (zlib + base64), поэтому
+десятиминутный забег занимает несколько сотен КБ; команды — тройки
+`[frame, name, arg]`, где `frame` — число кадров до команды, то есть время
+команды равно сумме предшествующих времён кадров. Модуль не зависит от Kivy.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import os
+import sys
+import zlib
+from array import array
+from pathlib import Path
+from typing import Any, Optional
+
+from engine.core.config import GameConfig
+
+# EN: Bumped whenever the same seed stops producing the same path, so old
+# recordings are rejected instead of replaying into false mismatches.
+# RU: Увеличивается, когда тот же seed перестаёт давать тот же путь, чтобы
+# старые записи отклонялись, а не давали ложные расхождения при повторе.
+RECORDING_VERSION = 2
+
+# EN: Input command names stored in a recording.
+# RU: Имена команд ввода, сохраняемых в записи.
+CMD_STEP = "step"
+CMD_SPEED_DIR = "dir"
+CMD_LINEAR_X = "lin"
+CMD_STOP_X = "stop"
+CMD_BRAKE = "brake"
+CMD_REWARD = "reward"
+CMD_VIEWPORT = "vp"
+
+
+def config_values(config) -> dict[str, Any]:
+    """
+    Return the upper-case tuning values of a config object.
+
+    RU: Возвращает числовые параметры конфига (атрибуты в верхнем регистре).
+    """
+    return {name: getattr(config, name) for name in dir(config) if name.isupper()}
+
+
+class RunRecorder:
+    """
+    Append-only recording of frames and input commands for one run.
+
+    EN: frame() is called once per SimulationCore.advance(); command() is
+    called for every input that mutates the simulation.
+    RU: Запись кадров и команд ввода одного забега только на добавление.
+    frame() вызывается на каждый SimulationCore.advance(); command() — на
+    каждый ввод, изменяющий симуляцию.
+    """
+
+    def __init__(
+        self,
+        seed: int,
+        config=None,
+        max_attempts: int = 3,
+        viewport: tuple[float, float] = (0, 0),
+    ) -> None:
+        """
+        Start an empty recording for a run with the given seed.
+
+        RU: Начинает пустую запись забега с указанным seed.
+        """
+        self.seed = seed
+        self.config = config_values(config or GameConfig())
+        self.max_attempts = max_attempts
+        self.viewport = tuple(viewport)
+        self.frames = array("d")
+        self.commands: list[list] = []
+        self.final: Optional[dict[str, Any]] = None
+
+    def frame(self, dt: float) -> None:
+        """
+        Record the frame time passed to one advance() call.
+
+        RU: Записывает время кадра, переданное в один вызов advance().
+        """
+        self.frames.append(dt)
+
+    def command(self, name: str, arg: Any = None) -> None:
+        """
+        Record an input command applied before the next frame.
+
+        RU: Записывает команду ввода, применённую перед следующим кадром.
+        """
+        self.commands.append([len(self.frames), name, arg])
+
+    def make_config(self) -> GameConfig:
+        """
+        Return a GameConfig carrying the recorded tuning values.
+
+        RU: Возвращает GameConfig с записанными параметрами.
+        """
+        config = GameConfig()
+        for name, value in self.config.items():
+            setattr(config, name, value)
+        return config
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Return the JSON-serializable form of the recording.
+
+        RU: Возвращает представление записи, сериализуемое в JSON.
+        """
+        frames = self.frames
+        if sys.byteorder != "little":
+            frames = array("d", frames)
+            frames.byteswap()
+        packed = base64.b64encode(zlib.compress(frames.tobytes(), 6)).decode("ascii")
+        return {
+            "version": RECORDING_VERSION,
+            "seed": self.seed,
+            "config": self.config,
+            "max_attempts": self.max_attempts,
+            "viewport": list(self.viewport),
+            "frame_count": len(self.frames),
+            "frames": packed,
+            "commands": self.commands,
+            "final": self.final,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "RunRecorder":
+        """
+        Rebuild a recording from to_dict() output.
+
+        EN: Raises ValueError for an unknown version or a corrupt frame blob.
+        RU: Восстанавливает запись из результата to_dict(). Бросает
+        ValueError при неизвестной версии или повреждённых кадрах.
+        """
+        if data.get("version") != RECORDING_VERSION:
+            raise ValueError(f"Unsupported recording version: {data.get('version')!r}")
+        recording = cls(
+            int(data["seed"]),
+            max_attempts=int(data.get("max_attempts", 3)),
+            viewport=tuple(data.get("viewport", (0, 0))),
+        )
+        recording.config = dict(data.get("config", {}))
+        try:
+            raw = zlib.decompress(base64.b64decode(data["frames"]))
+        except (zlib.error, ValueError) as exc:
+            raise ValueError("Corrupt frame data") from exc
+        frames = array("d")
+        frames.frombytes(raw)
+        if sys.byteorder != "little":
+            frames.byteswap()
+        if len(frames) != int(data.get("frame_count", len(frames))):
+            raise ValueError("Frame count mismatch")
+        recording.frames = frames
+        recording.commands = [list(command) for command in data.get("commands", [])]
+        recording.final = data.get("final")
+        return recording
+
+    def save(self, path: Path) -> None:
+        """
+        Write the recording to path atomically.
+
+        RU: Атомарно записывает запись в path.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = path.with_suffix(".tmp")
+        with tmp_file.open("w", encoding="utf-8") as fh:
+            json.dump(self.to_dict(), fh, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_file, path)
+
+    @classmethod
+    def load(cls, path: Path) -> "RunRecorder":
+        """
+        Read a recording saved by save().
+
+        RU: Читает запись, сохранённую через save().
+        """
+        with Path(path).open("r", encoding="utf-8") as fh:
+            return cls.from_dict(json.load(fh))
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+Headless replayer for recorded gameplay runs.
+
+EN: Rebuilds a SimulationCore from a RunRecorder (seed, config, viewport),
+then feeds the recorded input commands and frame times in their original
+order, so every fixed step, tile turn and collision happens exactly as in
+the recorded run. Used to reproduce collision bugs from a user's
+`last_run.json` and to benchmark the same workload across builds.
+RU: Headless-повтор записанных забегов. Восстанавливает SimulationCore из
+RunRecorder (seed, конфиг, размер окна) и подаёт записанные команды ввода и
+времена кадров в исходном порядке, поэтому каждый фиксированный шаг,
+поворот пути и коллизия происходят так же, как в записи. Используется для
+воспроизведения багов коллизий по `last_run.json` пользователя и для
+сравнения одинаковой нагрузки между сборками.
+
+Usage:
+    python -m engine.core.run_replay path/to/last_run.json
+    python -m engine.core.run_replay path/to/last_run.json --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from engine.core.run_recording import RunRecorder
+from engine.core.simulation_core import SimulationCore
+
+
+def replay(recording: RunRecorder, profiler=None) -> SimulationCore:
+    """
+    Re-simulate a recorded run and return the finished simulation.
+
+    RU: Повторно симулирует записанный забег и возвращает симуляцию.
+    """
+    sim = SimulationCore(config=recording.make_config(), max_attempts=recording.max_attempts)
+    sim.profiler = profiler
+    sim.set_viewport(*recording.viewport)
+    sim.start(seed=recording.seed)
+
+    commands = recording.commands
+    count = len(commands)
+    index = 0
+    for frame, dt in enumerate(recording.frames):
+        while index < count and commands[index][0] <= frame:
+            _, name, arg = commands[index]
+            sim.apply_command(name, arg)
+            index += 1
+        sim.advance(dt)
+    for _, name, arg in commands[index:]:
+        sim.apply_command(name, arg)
+    return sim
+
+
+def mismatches(recording: RunRecorder, sim: SimulationCore) -> dict:
+    """
+    Return {key: (recorded, replayed)} for summary values that differ.
+
+    EN: Empty when the recording has no final summary or the replay matches.
+    RU: Возвращает {ключ: (записано, повторено)} для различающихся значений
+    сводки. Пусто, если в записи нет сводки или повтор совпал.
+    """
+    final = recording.final or {}
+    replayed = sim.run_summary()
+    replayed["frames"] = len(recording.frames)
+    return {
+        key: (value, replayed.get(key))
+        for key, value in final.items()
+        if replayed.get(key) != value
+    }
+
+
+def parse_args(argv=None):
+    """
+    Parse command-line options.
+
+    RU: Разбирает параметры командной строки.
+    """
+    parser = argparse.ArgumentParser(description="Replay a recorded run headlessly.")
+    parser.add_argument("recording", type=Path)
+    parser.add_argument("--repeat", type=int, default=1)
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """
+    Replay the run, print its summary and timing, and return the exit status.
+
+    EN: Exits with status 1 when the replay diverges from the recorded
+    final summary.
+    RU: Повторяет забег, печатает сводку и время и возвращает код
+    завершения. Завершается с кодом 1, если повтор разошёлся с записанной
+    сводкой.
+    """
+    args = parse_args(argv)
+    recording = RunRecorder.load(args.recording)
+    best = None
+    for _ in range(max(args.repeat, 1)):
+        started = time.perf_counter()
+        sim = replay(recording)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+
+    frames = len(recording.frames)
+    print(json.dumps(sim.run_summary() | {"frames": frames, "seed": recording.seed}, sort_keys=True))
+    print(f"[Replay] {frames} frames in {best:.3f}s ({frames / max(best, 1e-9):,.0f} frames/s)")
+    diff = mismatches(recording, sim)
+    for key, (recorded, replayed) in diff.items():
+        print(f"[Replay] MISMATCH {key}: recorded={recorded!r} replayed={replayed!r}")
+    return 1 if diff else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,463 @@
+# -*- coding: utf-8 -*-
+"""
+Headless fixed-timestep simulation core for gameplay logic.
+
+EN: Steps state, tiles, motion, and collision with a fixed timestep driven by
+an accumulator. The module has no Kivy dependencies, so it can run thousands
+of frames per second in tests and benchmarks without a window.
+RU: Шагает состояние, тайлы, движение и коллизии с фиксированным шагом через
+аккумулятор. Модуль не зависит от Kivy, поэтому может прогонять тысячи кадров
+в секунду в тестах и бенчмарках без окна.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from time import perf_counter
+
+from engine.core.collision_engine import CollisionEngine
+from engine.core.config import GameConfig
+from engine.core.game_session_manager import GameSessionManager, LossOutcome
+from engine.core.game_state import GameState
+from engine.core.perspective import Perspective
+from engine.core.respawn_reset import respawn_to_start
+from engine.core.road_geometry import RoadGeometry
+from engine.core.road_motion_engine import RoadMotionEngine
+from engine.core.run_recording import (
+    CMD_BRAKE,
+    CMD_LINEAR_X,
+    CMD_REWARD,
+    CMD_SPEED_DIR,
+    CMD_STEP,
+    CMD_STOP_X,
+    CMD_VIEWPORT,
+    RunRecorder,
+)
+from engine.core.tiles_model import TilesModel
+from engine.ship.ship_model import ShipModel
+
+# EN: Line rows collision reads: the ship row, the next row and its top edge.
+# RU: Ряды линий для коллизий: ряд корабля, следующий ряд и его верхний край.
+COLLISION_ROWS = 2
+
+
+class SimulationCore:
+    """
+    Own gameplay models and advance them in fixed simulation steps.
+
+    EN: Holds state, tiles, session, and engines; advances them at
+    SIM_STEP_HZ and exposes an interpolation factor for rendering. Every
+    input that mutates the run goes through this class, so a run can be
+    recorded and replayed frame-exactly from its seed.
+    RU: Хранит состояние, тайлы, сессию и движки; продвигает их с частотой
+    SIM_STEP_HZ и возвращает коэффициент интерполяции для рендера. Любой ввод,
+    изменяющий забег, проходит через этот класс, поэтому забег можно записать
+    и покадрово воспроизвести по его seed.
+    """
+
+    def __init__(self, config=None, max_attempts: int = 3) -> None:
+        """
+        Create the gameplay models and reset the accumulator.
+
+        EN: Uses GameConfig when no config is provided.
+        RU: Использует GameConfig, если конфиг не передан.
+        """
+        self.config = config or GameConfig()
+        self.state = GameState()
+        self.session = GameSessionManager(max_attempts=max_attempts)
+        self.perspective = Perspective()
+        self.geometry = RoadGeometry()
+        self.motion = RoadMotionEngine()
+        self.collision = CollisionEngine()
+        self.tiles = TilesModel()
+        self.ship = ShipModel()
+
+        self.step_dt = 1.0 / self.config.SIM_STEP_HZ
+        self.width = 0
+        self.height = 0
+        self.linear_active = False
+        self.on_loss = None
+        self.on_game_over = None
+        self.profiler = None
+        self.seed = None
+        self.recording = None
+        self._linear_speed_x = 0.0
+        self._accumulator = 0.0
+        self._prev_offset_x = 0.0
+        self._prev_offset_y = 0.0
+        self._prev_y_loop = 0
+
+    def set_viewport(self, width: float, height: float) -> bool:
+        """
+        Store the world size and update the perspective point.
+
+        EN: Returns False for a degenerate size so callers can skip the frame.
+        RU: Возвращает False для вырожденного размера, чтобы пропустить кадр.
+        """
+        if width <= 0 or height <= 0:
+            return False
+        if self.recording is not None and (width != self.width or height != self.height):
+            self.recording.command(CMD_VIEWPORT, [width, height])
+        self.width = width
+        self.height = height
+        self.perspective.set_perspective_point(width / 2, height * 0.75)
+        return True
+
+    def is_running(self) -> bool:
+        """
+        Return True while the run has started and is not over.
+
+        RU: Возвращает True, пока забег начат и не завершён.
+        """
+        return self.state.state_game_has_started and not self.state.state_game_over
+
+    def reset(self) -> None:
+        """
+        Reset state, tiles, and ship without starting a run.
+
+        EN: Clears the accumulator and the previous snapshot.
+        RU: Очищает аккумулятор и предыдущий снимок состояния.
+        """
+        self.state.reset()
+        self.tiles.reset(self.state, self.config)
+        self.ship.reset_to_start(self.state)
+        self._accumulator = 0.0
+        self.sync_previous()
+
+    def start(self, seed=None, record: bool = False) -> None:
+        """
+        Reset everything, refill attempts, and mark the run as started.
+
+        EN: The tile path is seeded with seed, or with a value drawn from the
+        global random module when None. With record=True a new RunRecorder
+        is kept in self.recording for the whole run.
+        RU: Сбрасывает всё, восстанавливает попытки и помечает старт забега.
+        Путь тайлов получает seed, а при None — значение из глобального модуля
+        random. При record=True для всего забега создаётся RunRecorder в
+        self.recording.
+        """
+        self.seed = random.getrandbits(32) if seed is None else seed
+        self.tiles.seed(self.seed)
+        self.recording = (
+            RunRecorder(self.seed, self.config, self.session.get_max_attempts(), (self.width, self.height))
+            if record
+            else None
+        )
+        self._linear_speed_x = 0.0
+        self.linear_active = False
+        self.reset()
+        self.session.reset()
+        self.state.mark_started()
+
+    def resume_after_reward(self) -> None:
+        """
+        Refill attempts and respawn without resetting score progress.
+
+        RU: Восстанавливает попытки и респавнит без сброса прогресса очков.
+        """
+        if self.recording is not None:
+            self.recording.command(CMD_REWARD)
+        self.session.reset()
+        respawn_to_start(self.state, self.ship, self.tiles, self.config)
+        self.state.speed_y_factor = 1.0
+        self.state.mark_started()
+        self._accumulator = 0.0
+        self.sync_previous()
+
+    def advance(self, frame_dt: float) -> float:
+        """
+        Consume frame time in fixed steps and return the interpolation alpha.
+
+        EN: Frame time is clamped by SIM_MAX_FRAME_DT to avoid a spiral of
+        death after long stalls. Stepping stops early on game over.
+        RU: Время кадра ограничивается SIM_MAX_FRAME_DT, чтобы избежать
+        лавины шагов после долгих пауз. Шаги прекращаются при game over.
+        """
+        if self.recording is not None:
+            self.recording.frame(frame_dt)
+        if not self.is_running():
+            self._accumulator = 0.0
+            return 1.0
+        self._accumulator += min(frame_dt, self.config.SIM_MAX_FRAME_DT)
+        while self._accumulator >= self.step_dt:
+            self.sync_previous()
+            self._accumulator -= self.step_dt
+            self.step(self.step_dt)
+            if not self.is_running():
+                self._accumulator = 0.0
+                return 1.0
+        return self._accumulator / self.step_dt
+
+    def step(self, dt: float):
+        """
+        Run one simulation step and return the loss outcome, if any.
+
+        EN: Advances motion, prunes passed rows and tops the path up once when
+        rows were advanced, then checks ship points against tiles and applies
+        soft reset or game over.
+        RU: Продвигает движение, при пройденных рядах один раз обрезает их и
+        дополняет путь, затем проверяет точки корабля и применяет мягкий
+        сброс или game over.
+        """
+        if not self.is_running() or self.width <= 0 or self.height <= 0:
+            return None
+        state = self.state
+        profiler = self.profiler
+        if profiler is not None:
+            started = perf_counter()
+        saved_speed_x = state.current_speed_x
+        if self.linear_active:
+            state.current_speed_x = 0
+        motion = self.motion.step(dt, state, (self.width, self.height), self.config)
+        if self.linear_active:
+            state.current_speed_x = saved_speed_x
+        if profiler is not None:
+            now = perf_counter()
+            profiler.add("motion", now - started)
+            started = now
+        if motion.advanced_rows:
+            self.tiles.prune_passed_tiles(state)
+            self.tiles.extend_to_limit(self.config)
+        if profiler is not None:
+            now = perf_counter()
+            profiler.add("tiles", now - started)
+            started = now
+
+        self.geometry.update_tables(
+            self.width,
+            self.height,
+            self.perspective.perspective_point_x,
+            state.current_offset_x,
+            state.current_offset_y,
+            self.config,
+            COLLISION_ROWS,
+        )
+        ship_points = self.ship.compute_world_points(self.width, self.height, self.config)
+        on_tiles = self.collision.get_ship_points_on_tiles(
+            ship_points,
+            self.tiles.row_index,
+            self.geometry,
+            state,
+            self.width,
+            self.height,
+            self.config,
+            self.perspective.perspective_point_x,
+            self.perspective.perspective_point_y,
+        )
+        if profiler is not None:
+            profiler.add("collision", perf_counter() - started)
+        if on_tiles and all(on_tiles):
+            return None
+
+        outcome = self.session.register_loss()
+        if outcome == LossOutcome.SOFT_RESET:
+            respawn_to_start(state, self.ship, self.tiles, self.config)
+            self.sync_previous()
+        else:
+            state.mark_game_over()
+            if self.on_game_over:
+                self.on_game_over()
+        if self.on_loss:
+            self.on_loss()
+        return outcome
+
+    def step_x(self, direction: int) -> None:
+        """
+        Move one lateral step; +1 is left, -1 is right.
+
+        EN: The offset is clamped to the tiles of the current and next rows,
+        so the ship may cross onto a side path.
+        RU: Делает один боковой шаг; +1 — влево, -1 — вправо. Смещение
+        ограничивается тайлами текущего и следующего рядов, чтобы корабль мог
+        перейти на боковой путь.
+        """
+        if self.recording is not None:
+            self.recording.command(CMD_STEP, direction)
+        if self.width <= 0:
+            return
+        state = self.state
+        offset_min, offset_max = self._dynamic_offset_bounds(self.width)
+        offset_x = state.current_offset_x + self._step_size_x(self.width) * direction
+        state.current_offset_x = min(offset_max, max(offset_min, offset_x))
+        state.current_speed_x = 0
+
+    def stop_x(self) -> None:
+        """
+        Stop lateral speed.
+
+        RU: Останавливает боковую скорость.
+        """
+        if self.recording is not None:
+            self.recording.command(CMD_STOP_X)
+        self.state.current_speed_x = 0
+
+    def set_speed_x_dir(self, direction: int) -> None:
+        """
+        Set linear movement direction (-1 right, +1 left, 0 stop).
+
+        RU: Устанавливает направление линейного движения (-1 вправо, +1 влево, 0 стоп).
+        """
+        if self.recording is not None:
+            self.recording.command(CMD_SPEED_DIR, direction)
+        if direction == 0:
+            self._linear_speed_x = 0.0
+            self.linear_active = False
+            self.state.current_speed_x = 0
+            return
+        self.linear_active = True
+        self._linear_speed_x = self.config.SPEED_X * direction
+        self.state.current_speed_x = self._linear_speed_x
+
+    def apply_linear_x(self, dt: float) -> None:
+        """
+        Apply linear horizontal movement for dt using the V3 formula.
+
+        RU: Применяет линейное горизонтальное движение за dt по формуле V3.
+        """
+        if self.recording is not None:
+            self.recording.command(CMD_LINEAR_X, dt)
+        width = self.width
+        if width <= 0:
+            return
+        state = self.state
+        state.current_offset_x += (self._linear_speed_x * width) / 100 * (dt * 60)
+        offset_min, offset_max = self._dynamic_offset_bounds(width)
+        if state.current_offset_x < offset_min:
+            state.current_offset_x = offset_min
+        elif state.current_offset_x > offset_max:
+            state.current_offset_x = offset_max
+
+    def set_brake(self, enabled: bool) -> None:
+        """
+        Apply or release the vertical brake.
+
+        RU: Включает или отключает вертикальный тормоз.
+        """
+        if self.recording is not None:
+            self.recording.command(CMD_BRAKE, 1 if enabled else 0)
+        self.state.speed_y_factor = self.config.SPEED_Y_BRAKE_FACTOR if enabled else 1.0
+
+    def apply_command(self, name: str, arg=None) -> None:
+        """
+        Apply one recorded input command.
+
+        EN: Raises ValueError for an unknown command name.
+        RU: Применяет одну записанную команду ввода. Бросает ValueError для
+        неизвестного имени команды.
+        """
+        if name == CMD_STEP:
+            self.step_x(int(arg))
+        elif name == CMD_SPEED_DIR:
+            self.set_speed_x_dir(int(arg))
+        elif name == CMD_LINEAR_X:
+            self.apply_linear_x(float(arg))
+        elif name == CMD_STOP_X:
+            self.stop_x()
+        elif name == CMD_BRAKE:
+            self.set_brake(bool(arg))
+        elif name == CMD_REWARD:
+            self.resume_after_reward()
+        elif name == CMD_VIEWPORT:
+            self.set_viewport(*arg)
+        else:
+            raise ValueError(f"Unknown input command: {name!r}")
+
+    def run_summary(self) -> dict:
+        """
+        Return the values a replay must reproduce for the current run.
+
+        RU: Возвращает значения, которые повтор должен воспроизвести для
+        текущего забега.
+        """
+        state = self.state
+        return {
+            "frames": len(self.recording.frames) if self.recording is not None else None,
+            "y_loop": state.current_y_loop,
+            "offset_x": state.current_offset_x,
+            "offset_y": state.current_offset_y,
+            "game_over": state.state_game_over,
+            "attempts_left": self.session.get_attempts_left(),
+        }
+
+    def _step_size_x(self, width: float) -> float:
+        """
+        Return the lateral step: max offset divided by INPUT_STEPS_TO_EDGE.
+
+        EN: Max offset is half a road tile minus half the ship width.
+        RU: Возвращает боковой шаг: максимальный сдвиг, делённый на
+        INPUT_STEPS_TO_EDGE. Максимальный сдвиг — половина тайла дороги минус
+        половина ширины корабля.
+        """
+        tile_half = (self.config.V_LINES_SPACING * width) / 2
+        ship_half = (self.config.SHIP_WIDTH * width) / 2
+        steps = max(int(getattr(self.config, "INPUT_STEPS_TO_EDGE", 1)), 1)
+        return (max(tile_half - ship_half, 0) / steps) * 2
+
+    def _dynamic_offset_bounds(self, width: float) -> tuple[float, float]:
+        """
+        Compute offset bounds from the tiles of the current and next rows.
+
+        RU: Вычисляет границы смещения по тайлам текущего и следующего рядов.
+        """
+        spacing_x = self.config.V_LINES_SPACING * width
+        ppx = width / 2
+        ship_half = (self.config.SHIP_WIDTH * width) / 2
+        ship_left = ppx - ship_half
+        ship_right = ppx + ship_half
+
+        y0 = self.state.current_y_loop
+        row_index = self.tiles.row_index
+        tile_xs = row_index.get(y0, set()) | row_index.get(y0 + 1, set())
+        if not tile_xs:
+            tile_xs = [0]
+        min_line_index = min(tile_xs)
+        max_line_index = max(tile_xs) + 1
+
+        offset_min = ship_right - ppx - (max_line_index - 0.5) * spacing_x
+        offset_max = ship_left - ppx - (min_line_index - 0.5) * spacing_x
+        if offset_min > offset_max:
+            offset_min, offset_max = offset_max, offset_min
+        return offset_min, offset_max
+
+    def sync_previous(self) -> None:
+        """
+        Snapshot the current state as the interpolation start point.
+
+        EN: Called before each step and after discontinuities such as respawn.
+        RU: Вызывается перед каждым шагом и после разрывов, например респауна.
+        """
+        self._prev_offset_x = self.state.current_offset_x
+        self._prev_offset_y = self.state.current_offset_y
+        self._prev_y_loop = self.state.current_y_loop
+
+    def interpolate_into(self, target, alpha: float) -> None:
+        """
+        Write a blend of the previous and current state into target.
+
+        EN: Blends the continuous forward distance so row wrap-around stays
+        smooth, then splits it back into loop index and offset.
+        RU: Смешивает непрерывную продольную дистанцию, чтобы переход ряда
+        был плавным, затем раскладывает её обратно на индекс и смещение.
+        """
+        state = self.state
+        target.state_game_over = state.state_game_over
+        target.state_game_has_started = state.state_game_has_started
+        target.current_speed_x = state.current_speed_x
+        target.speed_y_factor = state.speed_y_factor
+        if alpha >= 1.0 or self.height <= 0:
+            target.current_offset_x = state.current_offset_x
+            target.current_offset_y = state.current_offset_y
+            target.current_y_loop = state.current_y_loop
+            return
+
+        target.current_offset_x = (
+            self._prev_offset_x + (state.current_offset_x - self._prev_offset_x) * alpha
+        )
+        spacing_y = self.config.H_LINES_SPACING * self.height
+        prev_y = self._prev_y_loop * spacing_y + self._prev_offset_y
+        cur_y = state.current_y_loop * spacing_y + state.current_offset_y
+        blend_y = prev_y + (cur_y - prev_y) * alpha
+        y_loop = int(math.floor(blend_y / spacing_y))
+        target.current_y_loop = y_loop
+        target.current_offset_y = blend_y - y_loop * spacing_y
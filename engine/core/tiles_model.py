@@ -5,22 +5,122 @@ RU: Модель координат тайлов и логика их генер
 """
 
 import random
+from collections import deque
+
+# EN: Path segments generated per refill of the pending buffer.
+# RU: Число сегментов пути, генерируемых за одно пополнение буфера.
+CHUNK_SEGMENTS = 64
+
+# EN: The buffer is refilled when fewer pending segments than this remain.
+# RU: Буфер пополняется, когда в нём остаётся меньше сегментов, чем это число.
+LOW_WATER_SEGMENTS = 16
+
+# EN: Segment kinds: straight, turn right (+x), turn left (-x).
+# RU: Виды сегментов: прямо, поворот вправо (+x), поворот влево (-x).
+STRAIGHT = 0
+TURN_PLUS = 1
+TURN_MINUS = 2
+SEGMENT_KINDS = (STRAIGHT, TURN_PLUS, TURN_MINUS)
 
 
 class TilesModel:
     """
     Maintain the list of tile grid coordinates and generate more as needed.
 
+    EN: Coordinates are kept in a deque ordered by row, so passed rows are
+    popped from the front in O(1). A row index maps each row to the set of
+    its tile_x values for O(1) membership checks. The revision counter
+    changes on every mutation, so renderers notice a new path. Path turns
+    come from the model's own rng, so the same seed reproduces the same path. Segments are
+    generated ahead in chunks into a pending buffer and moved into the path
+    whole, so the per-row cost is a few appends.
     RU: Хранит список координат тайлов и генерирует новые по необходимости.
+    Координаты хранятся в deque по порядку рядов, поэтому пройденные ряды
+    снимаются с начала за O(1). Индекс рядов отображает ряд в множество
+    его tile_x для проверки принадлежности за O(1). Счётчик ревизий меняется
+    при каждом изменении, чтобы рендеры замечали новый путь. Повороты пути
+    берутся из собственного генератора rng, поэтому при одинаковом seed путь
+    воспроизводится. Сегменты генерируются заранее пачками в буфер ожидания и
+    переносятся в путь целиком, поэтому стоимость ряда — несколько добавлений.
     """
-    def __init__(self):
+    def __init__(self, seed=None):
+        """
+        Initialize with an empty coordinate deque, row index and PRNG.
+
+        EN: The PRNG is private to the model, so a seeded path does not
+        depend on other users of the global random module.
+        RU: Инициализирует пустую deque координат, индекс рядов и генератор.
+        Генератор принадлежит модели, поэтому путь с заданным seed не зависит
+        от других пользователей глобального модуля random.
+        """
+        self.tiles_coordinates = deque()
+        self.row_index = {}
+        self.revision = 0
+        self.rng = random.Random(seed)
+        self._pending = deque()
+        self._cursor = None
+        self._bounds_key = None
+        self._bounds = (0, 0)
+
+    def seed(self, seed) -> None:
+        """
+        Reseed the path generator.
+
+        RU: Задаёт новый seed генератора пути.
+        """
+        self.rng.seed(seed)
+
+    def _clear(self) -> None:
+        """
+        Drop all coordinates and the row index.
+
+        RU: Удаляет все координаты и индекс рядов.
+        """
+        self.tiles_coordinates.clear()
+        self.row_index.clear()
+        self._pending.clear()
+        self._cursor = None
+        self.revision += 1
+
+    def _append_tile(self, tile_x: int, tile_y: int) -> None:
+        """
+        Append a tile at the end of the path and index its row.
+
+        RU: Добавляет тайл в конец пути и индексирует его ряд.
+        """
+        self.tiles_coordinates.append((tile_x, tile_y))
+        self.revision += 1
+        row = self.row_index.get(tile_y)
+        if row is None:
+            row = self.row_index[tile_y] = set()
+        row.add(tile_x)
+
+    def _insert_tile(self, tile_x: int, tile_y: int) -> None:
         """
-        Initialize with an empty coordinate list.
+        Insert a tile keeping coordinates ordered by row.
 
-        RU: Инициализирует пустой список координат.
+        EN: Appends in O(1) when the row is not behind the last tile.
+        RU: Добавляет за O(1), если ряд не позади последнего тайла.
         """
-        self.tiles_coordinates = []
+        tiles = self.tiles_coordinates
+        if not tiles or tiles[-1][1] <= tile_y:
+            self._append_tile(tile_x, tile_y)
+            return
+        pos = len(tiles)
+        while pos > 0 and tiles[pos - 1][1] > tile_y:
+            pos -= 1
+        tiles.insert(pos, (tile_x, tile_y))
+        self.revision += 1
+        self.row_index.setdefault(tile_y, set()).add(tile_x)
 
+    def has_tile(self, tile_x: int, tile_y: int) -> bool:
+        """
+        Return True if a tile exists at the given grid coordinate.
+
+        RU: Возвращает True, если тайл существует в указанной клетке сетки.
+        """
+        row = self.row_index.get(tile_y)
+        return row is not None and tile_x in row
 
     def reset(self, state, config):
         """
@@ -29,7 +129,7 @@ class TilesModel:
         EN: Prefills a straight segment at y=0 and extends to NB_TILES.
         RU: Предзаполняет прямой участок на y=0 и расширяет до NB_TILES.
         """
-        self.tiles_coordinates = []
+        self._clear()
         self._prefill_from_base(0)
         self.extend_to_limit(config)
 
@@ -42,7 +142,7 @@ class TilesModel:
         RU: Предзаполняет прямой участок на base_y и расширяет до NB_TILES
         без сброса текущего прогресса цикла.
         """
-        self.tiles_coordinates = []
+        self._clear()
         self._prefill_from_base(base_y)
         self.extend_to_limit(config)
 
@@ -54,7 +154,7 @@ class TilesModel:
         RU: Добавляет десять тайлов центральной дорожки начиная с base_y.
         """
         for i in range(0, 10):
-            self.tiles_coordinates.append((0, base_y + i))
+            self._append_tile(0, base_y + i)
 
     def _prefill(self):
         """
@@ -65,70 +165,114 @@ class TilesModel:
         """
         self._prefill_from_base(0)
 
-    def _clamp_tile_x(self, tile_x, min_x, max_x):
-        """
-        Clamp tile_x to keep tile rectangles inside the grid bounds.
-
-        RU: Ограничивает tile_x, чтобы прямоугольники тайлов оставались
-        внутри границ сетки.
-        """
-        if tile_x < min_x:
-            return min_x
-        if tile_x > max_x:
-            return max_x
-        return tile_x
-
     def prune_passed_tiles(self, state):
         """
         Remove tiles that are already behind the current loop position.
 
-        RU: Удаляет тайлы, уже оставшиеся позади текущей позиции.
+        EN: Pops whole rows from the front of the ordered deque.
+        RU: Удаляет тайлы, уже оставшиеся позади текущей позиции, снимая
+        целые ряды с начала упорядоченной deque.
         """
-        for i in range(len(self.tiles_coordinates) - 1, -1, -1):
-            if self.tiles_coordinates[i][1] < state.current_y_loop:
-                del self.tiles_coordinates[i]
+        tiles = self.tiles_coordinates
+        row_index = self.row_index
+        current_y_loop = state.current_y_loop
+        while tiles and tiles[0][1] < current_y_loop:
+            row_index.pop(tiles.popleft()[1], None)
+            self.revision += 1
 
 
     def extend_to_limit(self, config) -> None:
         """
         Extend the tile path up to the configured count.
 
-        EN: Continues from the current last tile so respawns preserve height.
-        RU: Продолжает от последнего тайла, чтобы респауны сохраняли высоту.
-        """
-        last_x = 0
-        last_y = 0
-
-        if len(self.tiles_coordinates) > 0:
-            last_coordinates = self.tiles_coordinates[-1]
-            last_x = last_coordinates[0]
-            last_y = last_coordinates[1] + 1
-
-        for _ in range(len(self.tiles_coordinates), config.NB_TILES):
-            r = random.randint(0, 2)
-            start_index = -int(config.V_NB_LINES / 2) + 1
-            end_index = start_index + config.V_NB_LINES - 1
-            min_x = start_index
-            max_x = end_index - 1
-            last_x = self._clamp_tile_x(last_x, min_x, max_x)
-            if last_x <= min_x:
-                r = 1
-            if last_x >= max_x:
-                r = 2
-
-            self.tiles_coordinates.append((last_x, last_y))
-            if r == 1:
-                last_x = self._clamp_tile_x(last_x + 1, min_x, max_x)
-                self.tiles_coordinates.append((last_x, last_y))
-                last_y += 1
-                self.tiles_coordinates.append((last_x, last_y))
-            if r == 2:
-                last_x = self._clamp_tile_x(last_x - 1, min_x, max_x)
-                self.tiles_coordinates.append((last_x, last_y))
-                last_y += 1
-                self.tiles_coordinates.append((last_x, last_y))
-
-            last_y += 1
+        EN: Moves one pending segment per missing tile below NB_TILES, as the
+        per-tile loop did, so the path may overshoot NB_TILES by a turn.
+        Continues from the current last tile so respawns preserve height.
+        RU: Переносит по одному сегменту из буфера на каждый недостающий до
+        NB_TILES тайл, как прежний цикл по тайлам, поэтому путь может
+        превысить NB_TILES на поворот. Продолжает от последнего тайла, чтобы
+        респауны сохраняли высоту.
+        """
+        tiles = self.tiles_coordinates
+        missing = config.NB_TILES - len(tiles)
+        if missing <= 0:
+            return
+        pending = self._pending
+        if self._cursor is None:
+            # EN: Right after a reset only the visible path is generated.
+            # RU: Сразу после сброса генерируется только видимый путь.
+            self._generate_segments(config, missing)
+        elif len(pending) < missing + LOW_WATER_SEGMENTS:
+            self._generate_segments(config, max(missing + LOW_WATER_SEGMENTS - len(pending), CHUNK_SEGMENTS))
+
+        row_index = self.row_index
+        append = tiles.append
+        for _ in range(missing):
+            for tile in pending.popleft():
+                append(tile)
+                row = row_index.get(tile[1])
+                if row is None:
+                    row = row_index[tile[1]] = set()
+                row.add(tile[0])
+        self.revision += 1
+
+    def _lane_bounds(self, config) -> tuple:
+        """
+        Return the (min_x, max_x) tile_x range, cached per V_NB_LINES.
+
+        RU: Возвращает диапазон tile_x (min_x, max_x) с кэшем по V_NB_LINES.
+        """
+        key = config.V_NB_LINES
+        if key != self._bounds_key:
+            start_index = -int(key / 2) + 1
+            end_index = start_index + key - 1
+            self._bounds = (start_index, end_index - 1)
+            self._bounds_key = key
+        return self._bounds
+
+    def _generate_segments(self, config, count: int) -> None:
+        """
+        Append count segments to the pending buffer.
+
+        EN: All segment kinds of the batch are drawn in one rng call; the
+        drawn sequence does not depend on how it is split into batches. A
+        straight segment is one tile; a turn is the tile, its side neighbour
+        and the tile above the neighbour. Lanes at the grid edge force a turn
+        back inward.
+        RU: Добавляет count сегментов в буфер ожидания. Виды всех сегментов
+        пачки берутся одним вызовом rng; последовательность не зависит от
+        разбиения на пачки. Прямой сегмент — один
+        тайл; поворот — тайл, его боковой сосед и тайл над соседом. У края
+        сетки поворот принудительно направлен внутрь.
+        """
+        min_x, max_x = self._lane_bounds(config)
+        cursor = self._cursor
+        if cursor is None:
+            if self.tiles_coordinates:
+                last_x, last_y = self.tiles_coordinates[-1]
+                cursor = (last_x, last_y + 1)
+            else:
+                cursor = (0, 0)
+        x, y = cursor
+        append = self._pending.append
+        for kind in self.rng.choices(SEGMENT_KINDS, k=count):
+            if x < min_x:
+                x = min_x
+            elif x > max_x:
+                x = max_x
+            if x <= min_x:
+                kind = TURN_PLUS
+            if x >= max_x:
+                kind = TURN_MINUS
+            if kind == STRAIGHT:
+                append(((x, y),))
+                y += 1
+                continue
+            next_x = min(x + 1, max_x) if kind == TURN_PLUS else max(x - 1, min_x)
+            append(((x, y), (next_x, y), (next_x, y + 1)))
+            x = next_x
+            y += 2
+        self._cursor = (x, y)
 
     def generate_more(self, state, config):
         """
@@ -151,7 +295,7 @@ class TilesModel:
         respawn_x = 0
         y0 = state.current_y_loop
         y1 = state.current_y_loop + 1
-        for tile in ((respawn_x, y0), (respawn_x, y1)):
-            if tile not in self.tiles_coordinates:
-                self.tiles_coordinates.append(tile)
+        for tile_y in (y0, y1):
+            if not self.has_tile(respawn_x, tile_y):
+                self._insert_tile(respawn_x, tile_y)
 
@@ -7,6 +7,8 @@ RU: Рендерер дорожной сетки на базе Kivy Line.
 from kivy.graphics.context_instructions import Color
 from kivy.graphics.vertex_instructions import Line
 
+from engine.core.road_geometry import LINE_Y_START
+
 
 class RoadGridRenderer:
     """
@@ -42,63 +44,54 @@ class RoadGridRenderer:
         """
         Update all line points based on current state and geometry.
 
-        RU: Обновляет точки всех линий на основе текущего состояния и геометрии.
+        EN: Collects every line endpoint from the geometry tables, which must
+        be updated for this frame, and projects them in one batch call.
+        RU: Собирает концы всех линий из таблиц геометрии, обновлённых для
+        этого кадра, и проецирует их одним пакетным вызовом.
+        """
+        world_points = self._vertical_world_points(state, perspective, geometry, width, height, config)
+        world_points += self._horizontal_world_points(state, perspective, geometry, width, height, config)
+        self._apply_points(perspective.transform_batch(world_points, height))
+
+    def _apply_points(self, screen_points):
         """
-        self._update_vertical_lines(state, perspective, geometry, width, height, config)
-        self._update_horizontal_lines(state, perspective, geometry, width, height, config)
+        Assign projected endpoints to the Line objects, four values per line.
 
-    def _update_vertical_lines(self, state, perspective, geometry, width, height, config):
+        RU: Записывает спроецированные концы в объекты Line, по четыре
+        значения на линию.
         """
-        Update vertical grid lines using geometry and perspective transform.
+        pos = 0
+        for line in self.vertical_lines:
+            line.points = screen_points[pos:pos + 4]
+            pos += 4
+        for line in self.horizontal_lines:
+            line.points = screen_points[pos:pos + 4]
+            pos += 4
 
-        RU: Обновляет вертикальные линии сетки через геометрию и перспективу.
+    def _vertical_world_points(self, state, perspective, geometry, width, height, config):
         """
-        start_index, end_index = geometry.vertical_line_range(config)
-        ppx = perspective.perspective_point_x
-        for idx in range(start_index, end_index + 1):
-            pos = idx - start_index
-            line_x = geometry.get_line_x_from_index(
-                idx,
-                width,
-                ppx,
-                state.current_offset_x,
-                config,
-            )
-            x1, y1 = perspective.transform(line_x, 0, height)
-            x2, y2 = perspective.transform(line_x, height, height)
-            self.vertical_lines[pos].points = [x1, y1, x2, y2]
-
-    def _update_horizontal_lines(self, state, perspective, geometry, width, height, config):
+        Build world endpoints of vertical grid lines as a flat list.
+
+        EN: Reads line X from the geometry tables of the current frame.
+        RU: Строит мировые концы вертикальных линий сетки плоским списком,
+        беря X линий из таблиц геометрии текущего кадра.
+        """
+        points = []
+        for line_x in geometry.line_xs:
+            points += (line_x, 0, line_x, height)
+        return points
+
+    def _horizontal_world_points(self, state, perspective, geometry, width, height, config):
         """
-        Update horizontal grid lines using geometry and perspective transform.
+        Build world endpoints of horizontal grid lines as a flat list.
 
-        RU: Обновляет горизонтальные линии сетки через геометрию и перспективу.
+        EN: Reads line Y from the geometry tables of the current frame.
+        RU: Строит мировые концы горизонтальных линий сетки плоским списком,
+        беря Y линий из таблиц геометрии текущего кадра.
         """
-        start_index, end_index = geometry.vertical_line_range(config)
-        ppx = perspective.perspective_point_x
-        ppy = perspective.perspective_point_y
-        xmin = geometry.get_line_x_from_index(
-            start_index,
-            width,
-            ppx,
-            state.current_offset_x,
-            config,
-        )
-        xmax = geometry.get_line_x_from_index(
-            end_index,
-            width,
-            ppx,
-            state.current_offset_x,
-            config,
-        )
-        for i in range(0, config.H_NB_LINES):
-            line_y = geometry.get_line_y_from_index(
-                i,
-                height,
-                ppy,
-                state.current_offset_y,
-                config,
-            )
-            x1, y1 = perspective.transform(xmin, line_y, height)
-            x2, y2 = perspective.transform(xmax, line_y, height)
-            self.horizontal_lines[i].points = [x1, y1, x2, y2]
+        xmin = geometry.line_xs[0]
+        xmax = geometry.line_xs[-1]
+        points = []
+        for line_y in geometry.line_ys[-LINE_Y_START:config.H_NB_LINES - LINE_Y_START]:
+            points += (xmin, line_y, xmax, line_y)
+        return points
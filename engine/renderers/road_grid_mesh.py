@@ -0,0 +1,50 @@
+"""
+Batched Kivy renderer that draws the whole road grid with a single Mesh.
+
+RU: Пакетный Kivy-рендерер, рисующий всю дорожную сетку одним Mesh.
+"""
+
+from kivy.graphics.context_instructions import Color
+from kivy.graphics.vertex_instructions import Mesh
+
+from engine.renderers.road_grid import RoadGridRenderer
+from engine.renderers.tiles_mesh_renderer import VERTEX_STRIDE
+
+
+class RoadGridMeshRenderer(RoadGridRenderer):
+    """
+    Pack every grid line into one line-mode Mesh updated in place.
+
+    EN: Vertical lines come first, then horizontal lines, matching the order
+    of the world points built by RoadGridRenderer.
+    RU: Упаковывает все линии сетки в один Mesh в режиме линий, обновляемый
+    на месте. Сначала идут вертикальные линии, затем горизонтальные, как в
+    мировых точках RoadGridRenderer.
+    """
+    def _init_lines(self, canvas):
+        """
+        Create the Mesh with preallocated vertices and static indices.
+
+        RU: Создаёт Mesh с заранее выделенными вершинами и статичными индексами.
+        """
+        nb_vertices = (self._config.V_NB_LINES + self._config.H_NB_LINES) * 2
+        self._vertices = [0.0] * (nb_vertices * VERTEX_STRIDE)
+        with canvas:
+            Color(1, 1, 1)
+            self._mesh = Mesh(
+                vertices=self._vertices,
+                indices=list(range(nb_vertices)),
+                mode="lines",
+            )
+
+    def _apply_points(self, screen_points):
+        """
+        Write projected endpoints into the vertex buffer and upload it once.
+
+        RU: Записывает спроецированные концы в буфер вершин и загружает его
+        один раз.
+        """
+        vertices = self._vertices
+        vertices[0::VERTEX_STRIDE] = screen_points[0::2]
+        vertices[1::VERTEX_STRIDE] = screen_points[1::2]
+        self._mesh.vertices = vertices
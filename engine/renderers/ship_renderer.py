@@ -38,8 +38,7 @@ class ShipRenderer:
         RU: Проецирует мировые точки в экранные координаты и обновляет
         точки треугольника.
         """
-        x1, y1 = perspective.transform(*world_points[0], height)
-        x2, y2 = perspective.transform(*world_points[1], height)
-        x3, y3 = perspective.transform(*world_points[2], height)
-
-        self._triangle.points = [x1, y1, x2, y2, x3, y3]
+        flat_points = []
+        for x, y in world_points:
+            flat_points += (x, y)
+        self._triangle.points = perspective.transform_batch(flat_points, height)
@@ -0,0 +1,53 @@
+"""
+Batched Kivy renderer that draws all tiles with a single Mesh.
+
+RU: Пакетный Kivy-рендерер, рисующий все тайлы одним Mesh.
+"""
+
+from kivy.graphics.context_instructions import Color
+from kivy.graphics.vertex_instructions import Mesh
+
+from engine.renderers.tiles_renderer import TilesRenderer
+
+# EN: Floats per vertex in the default Mesh format (x, y, u, v).
+# RU: Число float на вершину в формате Mesh по умолчанию (x, y, u, v).
+VERTEX_STRIDE = 4
+
+
+class TilesMeshRenderer(TilesRenderer):
+    """
+    Pack every tile quad into one triangle Mesh updated in place.
+
+    EN: The vertex buffer is preallocated for NB_TILES quads and the index
+    buffer is built once, so each frame is one vertex upload and one draw.
+    RU: Упаковывает все квады тайлов в один треугольный Mesh, обновляемый на
+    месте. Буфер вершин выделяется заранее на NB_TILES квадов, а буфер
+    индексов строится один раз, поэтому кадр — одна загрузка и одна отрисовка.
+    """
+    def _init_quads(self, canvas):
+        """
+        Create the Mesh with preallocated vertices and static indices.
+
+        RU: Создаёт Mesh с заранее выделенными вершинами и статичными индексами.
+        """
+        nb_tiles = self._config.NB_TILES
+        self._vertices = [0.0] * (nb_tiles * 4 * VERTEX_STRIDE)
+        indices = []
+        for i in range(0, nb_tiles):
+            base = i * 4
+            indices += (base, base + 1, base + 2, base + 2, base + 3, base)
+        with canvas:
+            Color(1, 1, 1)
+            self._mesh = Mesh(vertices=self._vertices, indices=indices, mode="triangles")
+
+    def _apply_points(self, screen_points):
+        """
+        Write projected corners into the vertex buffer and upload it once.
+
+        RU: Записывает спроецированные углы в буфер вершин и загружает его
+        один раз.
+        """
+        vertices = self._vertices
+        vertices[0::VERTEX_STRIDE] = screen_points[0::2]
+        vertices[1::VERTEX_STRIDE] = screen_points[1::2]
+        self._mesh.vertices = vertices
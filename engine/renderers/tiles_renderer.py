@@ -39,27 +39,23 @@ class TilesRenderer:
         """
         Update quad points from model coordinates using geometry and perspective.
 
-        RU: Обновляет точки квадов по координатам модели через геометрию и перспективу.
+        EN: Reads tile corners from the geometry tables, which must be
+        updated for this frame, and projects them in one batch call.
+        RU: Обновляет точки квадов по координатам модели: берёт углы тайлов
+        из таблиц геометрии, обновлённых для этого кадра, и проецирует их
+        одним пакетным вызовом.
         """
-        ppx = perspective.perspective_point_x
-        ppy = perspective.perspective_point_y
-        for i in range(0, config.NB_TILES):
-            tile = self._tiles[i]
-            tile_coordinates = model.tiles_coordinates[i]
-            xmin, ymin, xmax, ymax = geometry.get_tile_rect_world(
-                tile_coordinates[0],
-                tile_coordinates[1],
-                state,
-                width,
-                height,
-                ppx,
-                ppy,
-                config,
-            )
+        world_points = geometry.tile_world_points(model.tiles_coordinates, config.NB_TILES, state.current_y_loop)
+        self._apply_points(perspective.transform_batch(world_points, height))
 
-            x1, y1 = perspective.transform(xmin, ymin, height)
-            x2, y2 = perspective.transform(xmin, ymax, height)
-            x3, y3 = perspective.transform(xmax, ymax, height)
-            x4, y4 = perspective.transform(xmax, ymin, height)
+    def _apply_points(self, screen_points):
+        """
+        Assign projected corners to the Quad objects, eight values per tile.
 
-            tile.points = [x1, y1, x2, y2, x3, y3, x4, y4]
+        RU: Записывает спроецированные углы в объекты Quad, по восемь
+        значений на тайл.
+        """
+        pos = 0
+        for tile in self._tiles:
+            tile.points = screen_points[pos:pos + 8]
+            pos += 8
@@ -10,18 +10,28 @@ RU: Создаёт ключевые компоненты движка, связ
 
 from __future__ import annotations
 
-from engine.core.collision_engine import CollisionEngine
-from engine.core.config import GameConfig
+import threading
+from pathlib import Path
+from time import perf_counter
+
+from engine.core.frame_profiler import FrameProfiler
 from engine.core.game_loop import GameLoop
-from engine.core.game_session_manager import GameSessionManager, LossOutcome
 from engine.core.game_state import GameState
 from engine.core.input_controller import InputController
-from engine.core.perspective import Perspective
-from engine.core.respawn_reset import respawn_to_start
+from engine.core.input_latency import PATH_LINEAR, PATH_STEP, InputLatencyTracker
+from engine.core.input_queue import InputQueue
 from engine.core.road_geometry import RoadGeometry
-from engine.core.road_motion_engine import RoadMotionEngine
-from engine.core.tiles_model import TilesModel
+from engine.core.run_recording import (
+    CMD_BRAKE,
+    CMD_SPEED_DIR,
+    CMD_STEP,
+    CMD_STOP_X,
+    RunRecorder,
+)
+from engine.core.simulation_core import SimulationCore
 from engine.renderers.road_grid import RoadGridRenderer
+from engine.renderers.road_grid_mesh import RoadGridMeshRenderer
+from engine.renderers.tiles_mesh_renderer import TilesMeshRenderer
 from engine.renderers.tiles_renderer import TilesRenderer
 from engine.ship.ship_engine import ShipEngine
 from engine.widgets.gameplay_surface import GameplaySurface
@@ -45,24 +55,35 @@ class GameplayRuntime:
         self._surface = surface
         self._fps = fps
 
-        self._config = GameConfig()
-        self._state = GameState()
-        self._session = GameSessionManager(max_attempts=3)
-        self._perspective = Perspective()
+        self._sim = SimulationCore(max_attempts=3)
+        self._config = self._sim.config
+        self._state = self._sim.state
+        self._render_state = GameState()
+        self._session = self._sim.session
+        self._perspective = self._sim.perspective
+        # EN: Rendering draws the interpolated state, so its line tables are
+        # kept apart from the ones collision builds for the simulation state.
+        # RU: Рендер рисует интерполированное состояние, поэтому его таблицы
+        # линий хранятся отдельно от таблиц коллизий для состояния симуляции.
         self._geometry = RoadGeometry()
-        self._motion = RoadMotionEngine()
-        self._collision = CollisionEngine()
-        self._tiles = TilesModel()
-
-        self._road_grid = RoadGridRenderer(surface.canvas, self._config)
-        self._tiles_renderer = TilesRenderer(surface.canvas, self._config)
+        self._tiles = self._sim.tiles
+
+        if self._config.RENDER_BACKEND == "mesh":
+            self._road_grid = RoadGridMeshRenderer(surface.canvas, self._config)
+            self._tiles_renderer = TilesMeshRenderer(surface.canvas, self._config)
+        else:
+            self._road_grid = RoadGridRenderer(surface.canvas, self._config)
+            self._tiles_renderer = TilesRenderer(surface.canvas, self._config)
         self._ship_engine = ShipEngine(surface.canvas, self._config)
         self._input = InputController(self._state, self._config)
+        self._input_queue = InputQueue()
         self._loop = GameLoop()
         self.on_game_over = None
         self.on_loss = None
-        self._linear_speed_x = 0.0
-        self._linear_active = False
+        self._profiler = None
+        self._latency = None
+        self._sim.on_game_over = self._emit_game_over
+        self._sim.on_loss = self._emit_loss
 
         surface.bind_engines(
             self._road_grid,
@@ -70,7 +91,7 @@ class GameplayRuntime:
             self._tiles,
             self._ship_engine,
             self._perspective,
-            self._state,
+            self._render_state,
             self._geometry,
             self._config,
         )
@@ -82,28 +103,24 @@ class GameplayRuntime:
         EN: Resets state, tiles, and ship, then renders once for visibility.
         RU: Сбрасывает состояние, тайлы и корабль, затем рендерит один раз.
         """
-        self._state.reset()
-        self._tiles.reset(self._state, self._config)
-        self._ship_engine.reset_to_start(self._state)
-        width = self._surface.width
-        height = self._surface.height
-        if width <= 0 or height <= 0:
-            return
-        self._perspective.set_perspective_point(width / 2, height * 0.75)
-        self._surface.render()
+        self._sim.reset()
+        self.request_redraw()
 
     def start(self) -> None:
         """
         Start a new run and schedule the tick loop.
 
         EN: Resets runtime state and begins scheduled updates at the target FPS.
+        The run is recorded for dump_recording(). Input still queued from the
+        previous run is dropped, so it never reaches the finished run's state
+        or its recorder.
         RU: Сбрасывает состояние и запускает обновления с заданной частотой кадров.
+        Забег записывается для dump_recording(). Ввод, оставшийся в очереди
+        от прошлого забега, отбрасывается и не попадает в состояние и запись
+        завершённого забега.
         """
-        self._state.reset()
-        self._tiles.reset(self._state, self._config)
-        self._ship_engine.reset_to_start(self._state)
-        self._session.reset()
-        self._state.mark_started()
+        self._clear_input()
+        self._sim.start(record=True)
         self._loop.start(self._tick, fps=self._fps)
 
     def receive_reward(self) -> None:
@@ -115,225 +132,275 @@ class GameplayRuntime:
         RU: Восстанавливает попытки, безопасно респавнит и возобновляет цикл
         без сброса прогресса current_y_loop.
         """
-        self._session.reset()
-        respawn_to_start(self._state, self._ship_engine, self._tiles, self._config)
-        self._state.speed_y_factor = 1.0
-        self._state.mark_started()
+        self._apply_input()
+        self._sim.resume_after_reward()
         self._loop.start(self._tick, fps=self._fps)
 
     def stop(self) -> None:
         """
         Stop the tick loop and detach input handlers.
 
-        EN: Cancels scheduled updates and detaches input bindings.
-        RU: Останавливает цикл обновлений и отключает обработчики ввода.
+        EN: Cancels scheduled updates, detaches input bindings and drops
+        queued input.
+        RU: Останавливает цикл обновлений, отключает обработчики ввода и
+        отбрасывает ввод в очереди.
         """
         self._loop.stop()
         self._input.detach()
+        self._clear_input()
 
     def _tick(self, dt: float) -> None:
         """
-        Execute a single frame update and handle motion/collisions.
-
-        EN: Updates perspective, renders, advances motion, and applies loss logic.
-        RU: Обновляет перспективу, рендерит, двигает сцену и применяет логику проигрыша.
+        Advance the simulation by frame time and render an interpolated frame.
+
+        EN: Applies queued input and linear movement for the frame, runs
+        fixed simulation steps for the elapsed time, blends the previous and
+        current state into the render state, then renders. Once the run is
+        over the loop goes idle until started or woken.
+        RU: Применяет ввод из очереди и линейное движение за кадр, выполняет
+        фиксированные шаги симуляции за прошедшее время, смешивает предыдущее
+        и текущее состояние в состояние рендера и рисует. После окончания
+        забега цикл простаивает до запуска или пробуждения.
         """
-        width = self._surface.width
-        height = self._surface.height
-        if width <= 0 or height <= 0:
+        profiler = self._profiler
+        if profiler is not None:
+            started = perf_counter()
+        if not self._sim.set_viewport(self._surface.width, self._surface.height):
             return
-
-        self._perspective.set_perspective_point(width / 2, height * 0.75)
+        if profiler is not None:
+            profiler.add("perspective", perf_counter() - started)
+        self._apply_input(dt)
+        alpha = self._sim.advance(dt)
+        self._sim.interpolate_into(self._render_state, alpha)
         self._surface.render()
+        if profiler is not None:
+            profiler.add("frame", perf_counter() - started)
+            profiler.end_frame(dt, self._loop.frame_interval)
+        if not self._sim.is_running():
+            self._loop.suspend()
+
+    def _apply_input(self, dt: float = 0.0) -> None:
+        """EN: Apply due queued commands, then linear movement for dt.
+        RU: Применить наступившие команды из очереди, затем линейное движение за dt.
+        """
+        sim = self._sim
+        commands = self._input_queue.drain()
+        if commands and self._latency is not None:
+            self._latency.on_tick(perf_counter())
+        if commands and self._sync_viewport():
+            for name, arg in commands:
+                sim.apply_command(name, arg)
+        if dt and sim.linear_active and sim.is_running():
+            sim.apply_linear_x(dt)
+
+    def _clear_input(self) -> None:
+        """EN: Drop queued commands and the latency marks waiting for them.
+        RU: Отбросить команды в очереди и ожидающие их отметки задержки.
+        """
+        self._input_queue.clear()
+        if self._latency is not None:
+            self._latency.drop_unapplied()
 
-        if not self._state.state_game_has_started or self._state.state_game_over:
-            return
+    def _emit_game_over(self) -> None:
+        """EN: Forward the simulation game-over event to the runtime hook.
+        RU: Передать событие game over симуляции в хук runtime.
+        """
+        if self.on_game_over:
+            self.on_game_over()
 
-        saved_speed_x = self._state.current_speed_x
-        if self._linear_active:
-            self._state.current_speed_x = 0
-        motion = self._motion.step(dt, self._state, (width, height), self._config)
-        if self._linear_active:
-            self._state.current_speed_x = saved_speed_x
-        for _ in range(motion.advanced_rows):
-            self._tiles.prune_passed_tiles(self._state)
-            self._tiles.generate_more(self._state, self._config)
-
-        ship_points = self._ship_engine.get_ship_points_world()
-        on_tiles = self._collision.get_ship_points_on_tiles(
-            ship_points,
-            self._tiles.tiles_coordinates,
-            self._geometry,
-            self._state,
-            width,
-            height,
-            self._config,
-            self._perspective.perspective_point_x,
-            self._perspective.perspective_point_y,
-        )
-        if not on_tiles or not all(on_tiles):
-            outcome = self._session.register_loss()
-            if outcome == LossOutcome.SOFT_RESET:
-                respawn_to_start(self._state, self._ship_engine, self._tiles, self._config)
-            else:
-                self._state.mark_game_over()
-                if self.on_game_over:
-                    self.on_game_over()
-            if self.on_loss:
-                self.on_loss()
+    def _emit_loss(self) -> None:
+        """EN: Forward the simulation loss event to the runtime hook.
+        RU: Передать событие проигрыша симуляции в хук runtime.
+        """
+        if self.on_loss:
+            self.on_loss()
+
+    @property
+    def profiler(self) -> FrameProfiler | None:
+        """EN: Return the frame profiler, or None when profiling is off.
+        RU: Вернуть профайлер кадров или None, если профилирование выключено.
+        """
+        return self._profiler
+
+    def enable_profiler(self, overlay: bool = True) -> FrameProfiler:
+        """EN: Turn on per-phase frame timing and the optional debug overlay.
+        RU: Включить замер фаз кадра и необязательный отладочный оверлей.
+        """
+        if self._profiler is None:
+            self._profiler = FrameProfiler()
+            self._sim.profiler = self._profiler
+            self._surface.set_profiler(self._profiler, overlay=overlay)
+        return self._profiler
+
+    def dump_profile(self, path: Path) -> bool:
+        """EN: Write the profiler summary as JSON; return False when off.
+        RU: Записать сводку профайлера в JSON; вернуть False, если выключен.
+        """
+        if self._profiler is None:
+            return False
+        self._profiler.dump_json(path)
+        return True
+
+    @property
+    def latency(self) -> InputLatencyTracker | None:
+        """EN: Return the input latency tracker, or None when it is off.
+        RU: Вернуть трекер задержки ввода или None, если он выключен.
+        """
+        return self._latency
+
+    def enable_latency_tracker(self, overlay: bool = True) -> InputLatencyTracker:
+        """EN: Turn on input-to-render latency tracking and its optional readout.
+        RU: Включить замер задержки от ввода до рендера и необязательный вывод.
+        """
+        if self._latency is None:
+            self._latency = InputLatencyTracker()
+            self._surface.set_latency_tracker(self._latency, overlay=overlay)
+        return self._latency
+
+    def dump_latency(self, path: Path) -> bool:
+        """EN: Write the latency summary as JSON; return False when off.
+        RU: Записать сводку задержек в JSON; вернуть False, если выключено.
+        """
+        if self._latency is None:
+            return False
+        self._latency.dump_json(path)
+        return True
+
+    def _mark_input(self, path: str, input_time: float | None, direction: int, delay: float = 0.0) -> None:
+        """EN: Start timing a stamped input moving towards direction when latency tracking is on.
+        RU: Начать замер отмеченного ввода в сторону direction, если замер задержки включён.
+        """
+        if self._latency is not None and input_time is not None:
+            self._latency.mark(path, input_time, direction, perf_counter() + delay, delay)
+
+    def dump_recording(self, path: Path) -> bool:
+        """EN: Save the current run recording in a background thread.
+        RU: Сохранить запись текущего забега в фоновом потоке.
+
+        EN: Returns False when no run was recorded. The recorder is not
+        touched again after the run ends, so the thread can encode it safely.
+        RU: Возвращает False, если забег не записывался. После окончания
+        забега запись больше не меняется, поэтому поток может безопасно её
+        кодировать.
+        """
+        recording = self._sim.recording
+        if recording is None:
+            return False
+        recording.final = self._sim.run_summary()
+        threading.Thread(target=self._save_recording, args=(recording, path), daemon=True).start()
+        return True
+
+    @staticmethod
+    def _save_recording(recording: RunRecorder, path: Path) -> None:
+        """EN: Write a recording, ignoring I/O errors.
+        RU: Записать запись забега, игнорируя ошибки ввода-вывода.
+        """
+        try:
+            recording.save(path)
+        except OSError:
+            pass
+
+    def set_target_fps(self, fps: int) -> None:
+        """EN: Switch the render tick rate, e.g. for 90/120 Hz displays.
+        RU: Сменить частоту тика рендера, например для дисплеев 90/120 Гц.
+        """
+        self._fps = fps
+        self._loop.set_target_fps(fps)
+
+    def wake(self) -> None:
+        """EN: Resume an idle loop if the run can still progress.
+        RU: Возобновить простаивающий цикл, если забег ещё может продолжаться.
+        """
+        if self._sim.is_running():
+            self._loop.resume()
 
     def request_redraw(self) -> None:
         """EN: Update perspective and render once without changing state.
         RU: Обновить перспективу и отрисовать один раз без изменения состояния.
         """
-        width = self._surface.width
-        height = self._surface.height
-        if width <= 0 or height <= 0:
+        self.wake()
+        if not self._sim.set_viewport(self._surface.width, self._surface.height):
             return
-        self._perspective.set_perspective_point(width / 2, height * 0.75)
+        self._sim.interpolate_into(self._render_state, 1.0)
         self._surface.render()
 
+    def _queue_input(self, name: str, arg=None, delay: float = 0.0, supersede: bool = False) -> None:
+        """EN: Queue an input command for the next tick and wake the loop.
+        RU: Поставить команду ввода в очередь следующего тика и разбудить цикл.
+        """
+        self._input_queue.push(name, arg, delay, supersede)
+        self.wake()
+
     def brake_on(self) -> None:
         """EN: Enable vertical brake by applying slowdown factor.
         RU: Включить вертикальный тормоз, применив коэффициент замедления.
         """
-        self._state.speed_y_factor = self._config.SPEED_Y_BRAKE_FACTOR
+        self._queue_input(CMD_BRAKE, 1)
 
     def brake_off(self) -> None:
         """EN: Disable vertical brake and restore default factor.
         RU: Отключить вертикальный тормоз и вернуть коэффициент по умолчанию.
         """
-        self._state.speed_y_factor = 1.0
-
-    def _max_x_offset(self, width: float) -> float:
-        """
-        Compute the maximum lateral offset from the center.
-
-        EN: Uses road tile width minus half ship width in world units.
-        RU: Использует ширину тайла дороги минус половину ширины корабля.
-        """
-        tile_half = (self._config.V_LINES_SPACING * width) / 2
-        ship_half = (self._config.SHIP_WIDTH * width) / 2
-        return max(tile_half - ship_half, 0)
-
-    def _step_x(self, width: float) -> float:
-        """
-        Compute per-input step size toward the edge.
-
-        EN: Divides max offset by INPUT_STEPS_TO_EDGE.
-        RU: Делит максимальный сдвиг на INPUT_STEPS_TO_EDGE.
-        """
-        steps = max(int(getattr(self._config, "INPUT_STEPS_TO_EDGE", 1)), 1)
-        return (self._max_x_offset(width) / steps) * 2
-
-    def _dynamic_offset_bounds(self, width: float) -> tuple[float, float]:
-        """
-        Compute dynamic offset bounds from visible tiles near the ship.
+        self._queue_input(CMD_BRAKE, 0)
 
-        EN: Expands clamp based on current row tiles to allow side paths.
-        RU: Расширяет clamp по текущим тайлам, чтобы переходить на боковые пути.
+    def _sync_viewport(self) -> bool:
+        """EN: Push the surface size to the simulation before an input command.
+        RU: Передать размер поверхности в симуляцию перед командой ввода.
         """
-        spacing_x = self._config.V_LINES_SPACING * width
-        ppx = width / 2
-        ship_half = (self._config.SHIP_WIDTH * width) / 2
-        ship_left = ppx - ship_half
-        ship_right = ppx + ship_half
-
-        y0 = self._state.current_y_loop
-        y1 = self._state.current_y_loop + 1
-        tile_xs = [x for x, y in self._tiles.tiles_coordinates if y == y0 or y == y1]
-        if not tile_xs:
-            tile_xs = [0]
-        min_tile_x = min(tile_xs)
-        max_tile_x = max(tile_xs)
-        min_line_index = min_tile_x
-        max_line_index = max_tile_x + 1
-
-        offset_min = ship_right - ppx - (max_line_index - 0.5) * spacing_x
-        offset_max = ship_left - ppx - (min_line_index - 0.5) * spacing_x
-
-        if offset_min > offset_max:
-            offset_min, offset_max = offset_max, offset_min
-        return offset_min, offset_max
+        return self._sim.set_viewport(self._surface.width, self._surface.height)
 
     def input_left(self) -> None:
-        """EN: Dispatch left input to the engine input controller.
-        RU: Передать команду влево контроллеру ввода движка.
+        """EN: Queue a left step for the simulation.
+        RU: Поставить в очередь шаг влево для симуляции.
         """
-        width = self._surface.width
-        if width <= 0:
-            return
-        step = self._step_x(width)
-        offset_min, offset_max = self._dynamic_offset_bounds(width)
-        self._state.current_offset_x = min(
-            offset_max, self._state.current_offset_x + step
-        )
-        self._state.current_offset_x = max(
-            offset_min, self._state.current_offset_x
-        )
-        self._state.current_speed_x = 0
+        self._queue_input(CMD_STEP, 1)
 
     def input_right(self) -> None:
-        """EN: Dispatch right input to the engine input controller.
-        RU: Передать команду вправо контроллеру ввода движка.
+        """EN: Queue a right step for the simulation.
+        RU: Поставить в очередь шаг вправо для симуляции.
         """
-        width = self._surface.width
-        if width <= 0:
-            return
-        step = self._step_x(width)
-        offset_min, offset_max = self._dynamic_offset_bounds(width)
-        self._state.current_offset_x = max(
-            offset_min, self._state.current_offset_x - step
-        )
-        self._state.current_offset_x = min(
-            offset_max, self._state.current_offset_x
-        )
-        self._state.current_speed_x = 0
+        self._queue_input(CMD_STEP, -1)
 
     def input_stop(self) -> None:
-        """EN: Dispatch stop input to the engine input controller.
-        RU: Передать команду стоп контроллеру ввода движка.
+        """EN: Queue a lateral stop for the simulation.
+        RU: Поставить в очередь остановку бокового движения.
         """
-        self._state.current_speed_x = 0
+        self._queue_input(CMD_STOP_X)
 
-    def input_left_step(self) -> None:
+    def input_left_step(self, input_time: float | None = None) -> None:
         """EN: Step left using the existing step logic.
         RU: Сделать шаг влево, используя текущую шаговую логику.
         """
+        self._mark_input(PATH_STEP, input_time, 1)
         self.input_left()
 
-    def input_right_step(self) -> None:
+    def input_right_step(self, input_time: float | None = None) -> None:
         """EN: Step right using the existing step logic.
         RU: Сделать шаг вправо, используя текущую шаговую логику.
         """
+        self._mark_input(PATH_STEP, input_time, -1)
         self.input_right()
 
-    def set_speed_x_dir(self, direction: int) -> None:
-        """EN: Set linear movement direction (-1 right, +1 left, 0 stop).
-        RU: Установить направление линейного движения (-1 вправо, +1 влево, 0 стоп).
-        """
-        if direction == 0:
-            self._linear_speed_x = 0.0
-            self._linear_active = False
-            self._state.current_speed_x = 0
-            return
-        self._linear_active = True
-        speed = self._config.SPEED_X
-        self._linear_speed_x = speed * direction
-        self._state.current_speed_x = self._linear_speed_x
-
-    def apply_linear_x(self, dt: float) -> None:
-        """EN: Apply linear horizontal movement using V3 formula.
-        RU: Применить линейное горизонтальное движение по формуле V3.
+    def set_speed_x_dir(
+        self,
+        direction: int,
+        delay: float = 0.0,
+        input_time: float | None = None,
+        path: str = PATH_LINEAR,
+    ) -> None:
+        """EN: Queue the linear movement direction (-1 right, +1 left, 0 stop).
+        RU: Поставить в очередь направление линейного движения (-1 вправо, +1 влево, 0 стоп).
+
+        EN: The tick integrates linear movement while a direction is set. A
+        new direction replaces one still waiting for its delay.
+        RU: Тик интегрирует линейное движение, пока направление задано. Новое
+        направление заменяет ещё ожидающее своей задержки.
+
+        EN: input_time stamps a start for latency tracking under path.
+        RU: input_time отмечает старт для замера задержки по пути path.
         """
-        width = self._surface.width
-        if width <= 0:
-            return
-        time_factor = dt * 60
-        speed_x = (self._linear_speed_x * width) / 100
-        self._state.current_offset_x += speed_x * time_factor
-        offset_min, offset_max = self._dynamic_offset_bounds(width)
-        if self._state.current_offset_x < offset_min:
-            self._state.current_offset_x = offset_min
-        elif self._state.current_offset_x > offset_max:
-            self._state.current_offset_x = offset_max
+        if self._latency is not None:
+            self._latency.drop_delayed(perf_counter())
+        if direction:
+            self._mark_input(path, input_time, direction, delay)
+        self._queue_input(CMD_SPEED_DIR, direction, delay, supersede=True)
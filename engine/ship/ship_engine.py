@@ -59,5 +59,4 @@ class ShipEngine:
         чтобы корабль снова оказался по центру, не трогая очки и вертикальный
         прогресс.
         """
-        state.current_offset_x = 0.0
-        state.current_speed_x = 0
+        self._model.reset_to_start(state)
@@ -59,3 +59,13 @@ class ShipModel:
         RU: Возвращает последние вычисленные мировые точки корабля.
         """
         return list(self._last_world_points)
+
+    def reset_to_start(self, state) -> None:
+        """
+        Reset the ship horizontal position to the starting center lane.
+
+        EN: Clears the horizontal offset and speed without touching score.
+        RU: Сбрасывает горизонтальное смещение и скорость, не трогая очки.
+        """
+        state.current_offset_x = 0.0
+        state.current_speed_x = 0
@@ -6,8 +6,16 @@ EN: Hosts the game renderers and exposes a full-screen surface for drawing.
 RU: Хостит рендеры игры и предоставляет полноэкранную поверхность для рисования.
 """
 
+from time import perf_counter
+
+from kivy.metrics import dp
+from kivy.uix.label import Label
 from kivy.uix.widget import Widget
 
+# EN: Minimum seconds between debug overlay text refreshes.
+# RU: Минимальный интервал в секундах между обновлениями текста оверлея.
+OVERLAY_REFRESH_SEC = 0.5
+
 
 class GameplaySurface(Widget):
     """
@@ -34,6 +42,82 @@ class GameplaySurface(Widget):
         self._state = None
         self._geometry = None
         self._config = None
+        self._profiler = None
+        self._latency = None
+        self._overlay = None
+        self._overlay_updated_at = 0.0
+        self.invalidate()
+
+    def invalidate(self):
+        """
+        Forget the last frame fingerprints so the next render redraws all.
+
+        EN: Used after rebinding engines or when canvas content was replaced.
+        RU: Сбрасывает отпечатки последнего кадра, чтобы следующий рендер
+        перерисовал всё. Используется после перепривязки движков или замены
+        содержимого canvas.
+        """
+        self._grid_key = None
+        self._tiles_key = None
+        self._ship_key = None
+
+    def set_profiler(self, profiler, overlay=True):
+        """
+        Attach a frame profiler and optionally show its debug overlay.
+
+        EN: Renderer timings are reported as render_grid/tiles/ship phases.
+        RU: Подключает профайлер кадров и при необходимости показывает его
+        отладочный оверлей. Время рендеров пишется в фазы render_grid/tiles/ship.
+        """
+        self._profiler = profiler
+        if overlay:
+            self._ensure_overlay()
+
+    def set_latency_tracker(self, tracker, overlay=True):
+        """
+        Attach an input latency tracker and optionally show its readout.
+
+        EN: Every render reports the drawn lateral offset to the tracker.
+        RU: Подключает трекер задержки ввода и при необходимости показывает
+        его показания. Каждый рендер передаёт трекеру отрисованное боковое
+        смещение.
+        """
+        self._latency = tracker
+        if overlay:
+            self._ensure_overlay()
+
+    def _ensure_overlay(self):
+        """
+        Create the debug overlay label once.
+
+        RU: Создаёт метку отладочного оверлея один раз.
+        """
+        if self._overlay is None:
+            self._overlay = Label(
+                text="",
+                font_size="10sp",
+                halign="left",
+                valign="top",
+                size_hint=(None, None),
+            )
+            self._overlay.bind(texture_size=self._overlay.setter("size"))
+            self.add_widget(self._overlay)
+
+    def _update_overlay(self):
+        """
+        Refresh the overlay text at a throttled rate and pin it top-left.
+
+        RU: Обновляет текст оверлея с ограниченной частотой и закрепляет его
+        в левом верхнем углу.
+        """
+        now = perf_counter()
+        if now - self._overlay_updated_at < OVERLAY_REFRESH_SEC:
+            return
+        self._overlay_updated_at = now
+        self._overlay.text = "\n".join(
+            source.overlay_text() for source in (self._profiler, self._latency) if source is not None
+        )
+        self._overlay.pos = (self.x + dp(4), self.top - self._overlay.height - dp(4))
 
     def bind_engines(
         self,
@@ -60,13 +144,16 @@ class GameplaySurface(Widget):
         self._state = state
         self._geometry = geometry
         self._config = config
+        self.invalidate()
 
     def render(self):
         """
         Render grid, tiles, and ship in the correct order.
 
-        EN: Updates renderers only when geometry and bindings are valid.
-        RU: Обновляет рендеры только при валидной геометрии и связях.
+        EN: Updates renderers only when geometry and bindings are valid, and
+        skips each renderer whose inputs match the previous frame.
+        RU: Обновляет рендеры только при валидной геометрии и связях и
+        пропускает рендеры, входные данные которых совпадают с прошлым кадром.
         """
         if self.width < 2 or self.height < 2:
             self.opacity = 0
@@ -86,14 +173,60 @@ class GameplaySurface(Widget):
             self.opacity = 1
         width = self.width
         height = self.height
-        self._road_grid.update(self._state, self._perspective, self._geometry, width, height, self._config)
-        self._tiles_renderer.update(
-            self._tiles_model,
-            self._state,
-            self._perspective,
-            self._geometry,
+        state = self._state
+        ship_key = (
             width,
             height,
-            self._config,
+            self._perspective.perspective_point_x,
+            self._perspective.perspective_point_y,
         )
-        self._ship_engine.update(self._perspective, (width, height))
+        grid_key = ship_key + (state.current_offset_x, state.current_offset_y)
+        tiles_key = grid_key + (state.current_y_loop, self._tiles_model.revision)
+
+        profiler = self._profiler
+        if profiler is not None:
+            started = perf_counter()
+
+        if grid_key != self._grid_key or tiles_key != self._tiles_key:
+            tiles = self._tiles_model.tiles_coordinates
+            last_row = tiles[min(len(tiles), self._config.NB_TILES) - 1][1]
+            self._geometry.update_tables(
+                width,
+                height,
+                self._perspective.perspective_point_x,
+                state.current_offset_x,
+                state.current_offset_y,
+                self._config,
+                max(last_row - state.current_y_loop + 1, self._config.H_NB_LINES),
+            )
+        if grid_key != self._grid_key:
+            self._road_grid.update(state, self._perspective, self._geometry, width, height, self._config)
+            self._grid_key = grid_key
+        if profiler is not None:
+            now = perf_counter()
+            profiler.add("render_grid", now - started)
+            started = now
+        if tiles_key != self._tiles_key:
+            self._tiles_renderer.update(
+                self._tiles_model,
+                state,
+                self._perspective,
+                self._geometry,
+                width,
+                height,
+                self._config,
+            )
+            self._tiles_key = tiles_key
+        if profiler is not None:
+            now = perf_counter()
+            profiler.add("render_tiles", now - started)
+            started = now
+        if ship_key != self._ship_key:
+            self._ship_engine.update(self._perspective, (width, height))
+            self._ship_key = ship_key
+        if profiler is not None:
+            profiler.add("render_ship", perf_counter() - started)
+        if self._latency is not None:
+            self._latency.on_render(state.current_offset_x, perf_counter())
+        if self._overlay is not None:
+            self._update_overlay()
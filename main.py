@@ -1,20 +1,31 @@
+# --- startup trace (opt-in, must precede the imports it measures) ---
+from uix.debug.startup_trace import startup_trace
+
+startup_trace.start_if_requested()
+# ---------------------------------------------------------------
+
 # --- logging bootstrap (must be before any kivy/kivymd imports) ---
 from kivy.config import Config
 
 Config.set("kivy", "log_level", "info")
+# EN: Let the Clock tick as fast as the top FPS_LADDER rate
+# (engine/core/game_loop.py) for 90/120 Hz displays; the default cap is 60.
+# RU: Разрешить Clock тикать с верхней частотой FPS_LADDER для дисплеев
+# 90/120 Гц; по умолчанию ограничение 60.
+Config.set("graphics", "maxfps", "120")
 # ---------------------------------------------------------------
 
 import logging
-from pathlib import Path
 
 """EN: Application entry point for the KivyMD app. Starts the app only.
 RU: РўРѕС‡РєР° РІС…РѕРґР° РґР»СЏ РїСЂРёР»РѕР¶РµРЅРёСЏ KivyMD. РўРѕР»СЊРєРѕ Р·Р°РїСѓСЃРє РїСЂРёР»РѕР¶РµРЅРёСЏ.
 """
 
-from kivy.lang import Builder
 from kivy.properties import BooleanProperty, StringProperty
 from kivymd.app import MDApp
 
+from data.journal.session_journal import session_journal
+from data.store.user_store import user_store
 from uix.debug.debug_borders import enable_debug_borders
 from uix.debug.debug_config import DEBUG_UI_BORDERS
 from uix.screens.routes import LOAD_APP
@@ -39,23 +50,26 @@ class CosmicApp(MDApp):
         """EN: Build and return the root view.
         RU: РЎРѕР·РґР°С‚СЊ Рё РІРµСЂРЅСѓС‚СЊ РєРѕСЂРЅРµРІРѕРµ РїСЂРµРґСЃС‚Р°РІР»РµРЅРёРµ.
         """
-        apply_window_config()
-        enable_debug_borders(DEBUG_UI_BORDERS)
-        self.theme_cls.theme_style = "Dark"
-        manager = AppScreenManager()
-        self._manager = manager
-        root = Path(__file__).resolve().parent
-        Builder.load_file(str(root / "ads" / "banner" / "banner_slot.kv"))
-        build_auth_flow(manager)
-        manager.go(LOAD_APP, push_history=False)
-        return RootView(manager)
+        with startup_trace.phase("build"):
+            apply_window_config()
+            enable_debug_borders(DEBUG_UI_BORDERS)
+            self.theme_cls.theme_style = "Dark"
+            manager = AppScreenManager()
+            self._manager = manager
+            with startup_trace.phase("build_auth_flow"):
+                build_auth_flow(manager)
+            manager.go(LOAD_APP, push_history=False)
+            return RootView(manager)
 
     def on_start(self) -> None:
         """EN: Apply Android runtime orientation hint after app start.
         RU: Применить подсказку ориентации для Android после запуска приложения.
         """
+        from kivy.clock import Clock
         from kivy.utils import platform as kivy_platform
 
+        Clock.schedule_once(lambda _dt: startup_trace.mark("first_frame"), 0)
+
         if kivy_platform == "android":
             try:
                 from android_tools.orientation import force_landscape
@@ -64,6 +78,21 @@ class CosmicApp(MDApp):
             except Exception:
                 pass
 
+    def on_pause(self) -> bool:
+        """EN: Flush pending user data and session events before the OS may kill the app.
+        RU: Записать накопленные данные пользователя и события сессий, пока ОС не завершила приложение.
+        """
+        user_store.flush()
+        session_journal.flush()
+        return True
+
+    def on_stop(self) -> None:
+        """EN: Flush pending user data and session events on exit.
+        RU: Записать накопленные данные пользователя и события сессий при выходе.
+        """
+        user_store.flush()
+        session_journal.flush()
+
     def set_logged_in(self, email: str) -> None:
         """EN: Mark user as logged in and store email.
         RU: РћС‚РјРµС‚РёС‚СЊ РїРѕР»СЊР·РѕРІР°С‚РµР»СЏ РєР°Рє Р°РІС‚РѕСЂРёР·РѕРІР°РЅРЅРѕРіРѕ Рё СЃРѕС…СЂР°РЅРёС‚СЊ email.
@@ -91,5 +120,6 @@ class CosmicApp(MDApp):
  
 
 if __name__ == "__main__":
+    startup_trace.mark("imports_done")
     CosmicApp().run()
 
@@ -1,12 +1,3 @@
-from kivy.uix.widget import Widget
-from kivymd.uix.button import MDButton, MDButtonText
-from kivymd.uix.dialog import (
-    MDDialog,
-    MDDialogButtonContainer,
-    MDDialogHeadlineText,
-    MDDialogSupportingText,
-)
-
 from manager.lang.lang_manager import t
 from manager.auth.account_wipe import wipe_all_user_data
 
@@ -18,7 +9,21 @@ def confirm_delete_account(on_deleted, on_cancel) -> None:
     """
     EN: Shows account deletion confirmation dialog and executes callbacks.
     RU: Показывает диалог подтверждения удаления аккаунта и вызывает колбэки.
+
+    EN: KivyMD dialog modules are imported on first use to keep them off
+    the startup path.
+    RU: Модули диалогов KivyMD импортируются при первом вызове, чтобы не
+    замедлять старт.
     """
+    from kivy.uix.widget import Widget
+    from kivymd.uix.button import MDButton, MDButtonText
+    from kivymd.uix.dialog import (
+        MDDialog,
+        MDDialogButtonContainer,
+        MDDialogHeadlineText,
+        MDDialogSupportingText,
+    )
+
     global _dialog
     if _dialog:
         try:
@@ -6,13 +6,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from kivy.app import App
-
-from ads.payment.balance_store import BalanceStore
-from data.gameplay.rating_storage import RatingStorage
-from data.gameplay.record_store import RecordStore
-from data.user_cache.user_cache_reader import _cache_path
-from data.user_cache.user_session import UserSession
+from data.journal.session_journal import session_journal
+from data.store.user_store import legacy_paths, user_store
 from manager.gameover.gameover_counters import counters
 
 
@@ -31,32 +26,22 @@ def _safe_unlink(path: Path | None) -> None:
 
 
 def wipe_all_user_data() -> None:
-    """EN: Remove user session/cache/progress JSON files and reset counters.
-    RU: Удалить JSON сессии/кэша/прогресса и сбросить счётчики в памяти.
-    """
-    UserSession().clear()
-
-    _safe_unlink(_cache_path())
+    """EN: Clear the user store, remove legacy JSON files, the session journal and reset counters.
+    RU: Очистить пользовательское хранилище, удалить старые JSON, журнал сессий и сбросить счётчики.
 
-    record_store = RecordStore()
-    _safe_unlink(getattr(record_store, "_record_file", None))
-
-    rating_store = RatingStorage()
-    _safe_unlink(rating_store._path())
-
-    balance_store = BalanceStore()
-    _safe_unlink(getattr(balance_store, "_balance_file", None))
+    EN: The cleared store is flushed immediately so a crash right after the
+    wipe cannot bring the data back.
+    RU: Очищенное хранилище записывается сразу, чтобы сбой сразу после
+    удаления не вернул данные.
+    """
+    user_store.clear()
+    try:
+        user_store.flush()
+    except OSError:
+        pass
+    for path in legacy_paths():
+        _safe_unlink(path)
+    session_journal.clear()
 
     counters.gameover_count = 0
     counters.receive_click_count = 0
-
-    app = App.get_running_app()
-    user_dir = Path(getattr(app, "user_data_dir", ".")) if app else Path(".")
-    known_paths = [
-        user_dir / "user_session.json",
-        user_dir / "gameplay" / "record.json",
-        user_dir / "ads" / "payment" / "balance.json",
-    ]
-    for path in known_paths:
-        _safe_unlink(path)
-
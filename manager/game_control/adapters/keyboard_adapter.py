@@ -6,9 +6,8 @@ EN: Single press triggers step; hold triggers linear after delay.
 RU: Одиночное нажатие делает шаг; удержание включает линейный режим.
 """
 
-from time import time
+from time import perf_counter
 
-from kivy.clock import Clock
 from kivy.core.window import Window
 
 
@@ -32,10 +31,6 @@ class KeyboardAdapter:
         self._keyboard = None
         self._runtime = runtime
         self._pressed = set()
-        self._hold_event = None
-        self._hold_key = None
-        self._hold_started_at = 0.0
-        self._hold_dir = None
         self._left_pressed = False
         self._right_pressed = False
         self._brake_pressed = False
@@ -61,8 +56,6 @@ class KeyboardAdapter:
             115: "s",
         }
 
-        self._hold_delay = 0.02
-
     def _is_left(self, key_name) -> bool:
         """EN: Check if key represents left movement.
         RU: Проверить, что клавиша означает движение влево.
@@ -101,14 +94,14 @@ class KeyboardAdapter:
         )
 
 
-    def _apply_x(self) -> None:
+    def _apply_x(self, input_time=None) -> None:
         """EN: Apply horizontal movement based on pressed state.
         RU: Применить горизонтальное движение по состоянию нажатий.
         """
         if self._left_pressed and not self._right_pressed:
-            self._linear.start_left()
+            self._linear.start_left(input_time=input_time)
         elif self._right_pressed and not self._left_pressed:
-            self._linear.start_right()
+            self._linear.start_right(input_time=input_time)
         else:
             self._linear.stop()
 
@@ -151,9 +144,11 @@ class KeyboardAdapter:
         """
         Handle key down for left/right.
 
-        EN: Triggers step and starts hold timer.
-        RU: Делает шаг и запускает таймер удержания.
+        EN: Starts linear movement; the press time is kept for latency tracking.
+        RU: Запускает линейное движение; время нажатия сохраняется для замера
+        задержки.
         """
+        input_time = perf_counter()
         key_name = self._resolve_key_name(key, scancode, codepoint)
         if not key_name:
             return True
@@ -162,11 +157,11 @@ class KeyboardAdapter:
         self._pressed.add(key_name)
         if self._is_left(key_name):
             self._left_pressed = True
-            self._apply_x()
+            self._apply_x(input_time)
             return True
         if self._is_right(key_name):
             self._right_pressed = True
-            self._apply_x()
+            self._apply_x(input_time)
             return True
         if self._is_brake(key_name, codepoint):
             self._brake_pressed = True
@@ -198,48 +193,11 @@ class KeyboardAdapter:
             return True
         return False
 
-    def _start_hold(self, direction: str, key: str) -> None:
-        """EN: Start hold delay timer for linear mode.
-        RU: Запустить таймер удержания для линейного режима.
-        """
-        self._hold_key = key
-        self._hold_started_at = time()
-        if self._hold_event:
-            return
-        self._hold_event = Clock.schedule_interval(self._hold_tick, 0)
-        self._hold_dir = direction
-
-    def _stop_hold(self) -> None:
-        """EN: Stop hold delay timer.
-        RU: Остановить таймер удержания.
-        """
-        if self._hold_event:
-            self._hold_event.cancel()
-        self._hold_event = None
-        self._hold_key = None
-        self._hold_dir = None
-
     def _reset_internal_state(self) -> None:
-        """EN: Clear pressed keys and stop hold timers.
-        RU: Очистить состояние клавиш и таймеров удержания.
+        """EN: Clear pressed keys.
+        RU: Очистить состояние клавиш.
         """
-        self._stop_hold()
         self._pressed.clear()
         self._left_pressed = False
         self._right_pressed = False
         self._brake_pressed = False
-
-    def _hold_tick(self, _dt) -> None:
-        """EN: Start linear mode after hold delay.
-        RU: Запустить линейный режим после задержки удержания.
-        """
-        if not self._hold_key:
-            return
-        elapsed = time() - self._hold_started_at
-        if elapsed < self._hold_delay:
-            return
-        if self._hold_dir == "left":
-            self._linear.start_left()
-        elif self._hold_dir == "right":
-            self._linear.start_right()
-        self._stop_hold()
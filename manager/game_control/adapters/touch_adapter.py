@@ -2,13 +2,13 @@
 """
 Touch adapter that maps input to step/linear controllers.
 
-EN: Single tap triggers step; hold triggers linear after delay.
-RU: Одиночный тап делает шаг; удержание включает линейный режим.
+EN: Single tap triggers step; hold triggers linear after delay. The delay
+is handled by the runtime input queue, so the adapter runs no timers.
+RU: Одиночный тап делает шаг; удержание включает линейный режим. Задержку
+обрабатывает очередь ввода runtime, поэтому адаптер не запускает таймеров.
 """
 
-from time import time
-
-from kivy.clock import Clock
+from time import perf_counter
 
 
 class TouchAdapter:
@@ -29,20 +29,16 @@ class TouchAdapter:
         self._stepper = stepper
         self._linear = linear
         self._widget = None
-        self._hold_event = None
         self._hold_uid = None
-        self._hold_dir = None
-        self._hold_started_at = 0.0
         self._down_cb = self._on_touch_down
         self._up_cb = self._on_touch_up
         self._hold_delay = 0.02
 
     def _reset_internal_state(self) -> None:
-        """EN: Clear hold state and timers.
-        RU: Очистить состояние удержания и таймеры.
+        """EN: Clear hold state.
+        RU: Очистить состояние удержания.
         """
         self._stop_hold()
-        self._hold_started_at = 0.0
 
     def attach(self, widget) -> None:
         """
@@ -74,20 +70,21 @@ class TouchAdapter:
 
     def _on_touch_down(self, widget, touch):
         """
-        Handle touch down to trigger step and start hold delay.
+        Handle touch down to trigger step and queue a delayed linear start.
 
         EN: Determines direction by screen half.
         RU: Определяет направление по половине экрана.
         """
+        input_time = perf_counter()
         if not widget.collide_point(touch.x, touch.y):
             return False
         local_x = touch.x - widget.x
         direction = "left" if local_x < widget.width / 2 else "right"
         if direction == "left":
-            self._stepper.left()
+            self._stepper.left(input_time)
         else:
-            self._stepper.right()
-        self._start_hold(direction, touch.uid)
+            self._stepper.right(input_time)
+        self._start_hold(direction, touch.uid, input_time)
         return False
 
     def _on_touch_up(self, _widget, touch):
@@ -103,38 +100,18 @@ class TouchAdapter:
         self._stop_hold()
         return False
 
-    def _start_hold(self, direction: str, uid) -> None:
-        """EN: Start hold delay timer for linear mode.
-        RU: Запустить таймер удержания для линейного режима.
+    def _start_hold(self, direction: str, uid, input_time=None) -> None:
+        """EN: Queue linear mode to start after the hold delay.
+        RU: Поставить в очередь запуск линейного режима после задержки удержания.
         """
         self._hold_uid = uid
-        self._hold_dir = direction
-        self._hold_started_at = time()
-        if self._hold_event:
-            return
-        self._hold_event = Clock.schedule_interval(self._hold_tick, 0)
+        if direction == "left":
+            self._linear.start_left(self._hold_delay, input_time)
+        else:
+            self._linear.start_right(self._hold_delay, input_time)
 
     def _stop_hold(self) -> None:
-        """EN: Stop hold delay timer.
-        RU: Остановить таймер удержания.
+        """EN: Forget the held touch.
+        RU: Забыть удерживаемое касание.
         """
-        if self._hold_event:
-            self._hold_event.cancel()
-        self._hold_event = None
         self._hold_uid = None
-        self._hold_dir = None
-
-    def _hold_tick(self, _dt) -> None:
-        """EN: Start linear mode after hold delay.
-        RU: Запустить линейный режим после задержки удержания.
-        """
-        if not self._hold_uid:
-            return
-        elapsed = time() - self._hold_started_at
-        if elapsed < self._hold_delay:
-            return
-        if self._hold_dir == "left":
-            self._linear.start_left()
-        elif self._hold_dir == "right":
-            self._linear.start_right()
-        self._stop_hold()
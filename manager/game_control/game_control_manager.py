@@ -6,6 +6,9 @@ EN: Wires step and linear controllers to keyboard/touch adapters.
 RU: Подключает шаговый и линейный режимы к адаптерам клавиатуры и тача.
 """
 
+from time import perf_counter
+
+from engine.core.input_latency import PATH_HUD
 from manager.game_control.adapters.keyboard_adapter import KeyboardAdapter
 from manager.game_control.adapters.touch_adapter import TouchAdapter
 from manager.game_control.linear.linear_controller import LinearController
@@ -42,26 +45,27 @@ class GameControlManager:
         """EN: Route on-screen control events to the same logic as keyboard.
         RU: Маршрутизировать события экранных кнопок по логике клавиатуры.
         """
+        input_time = perf_counter()
         if action == "left":
             self._hud_left = pressed
-            self._apply_hud_x()
+            self._apply_hud_x(input_time)
             return
         if action == "right":
             self._hud_right = pressed
-            self._apply_hud_x()
+            self._apply_hud_x(input_time)
             return
         if action == "brake":
             self._set_hud_brake(pressed)
             return
 
-    def _apply_hud_x(self) -> None:
+    def _apply_hud_x(self, input_time=None) -> None:
         """EN: Apply horizontal movement for on-screen controls.
         RU: Применить горизонтальное движение для экранных кнопок.
         """
         if self._hud_left and not self._hud_right:
-            self._linear.start_left()
+            self._linear.start_left(input_time=input_time, path=PATH_HUD)
         elif self._hud_right and not self._hud_left:
-            self._linear.start_right()
+            self._linear.start_right(input_time=input_time, path=PATH_HUD)
         else:
             self._linear.stop()
 
@@ -2,75 +2,50 @@
 """
 Linear controller for continuous lateral movement.
 
-EN: Updates runtime offset continuously while input is held.
-RU: Непрерывно обновляет смещение runtime во время удержания ввода.
+EN: Sets the linear movement direction on the runtime; the runtime tick
+integrates the movement while a direction is set.
+RU: Задаёт направление линейного движения в runtime; тик runtime
+интегрирует движение, пока направление задано.
 """
 
-from kivy.clock import Clock
+from engine.core.input_latency import PATH_LINEAR
 
 
 class LinearController:
     """
     Manage continuous left/right movement via runtime hook.
 
-    EN: Starts/stops a tick that applies linear movement.
-    RU: Запускает/останавливает тик для линейного движения.
+    EN: Queues direction changes; no timers of its own.
+    RU: Ставит в очередь смену направления; собственных таймеров нет.
     """
 
     def __init__(self, runtime) -> None:
         """
         Store runtime reference and init state.
 
-        EN: Keeps runtime and disables ticking by default.
-        RU: Хранит runtime и по умолчанию не тикает.
+        EN: Keeps runtime and starts without a direction.
+        RU: Хранит runtime и начинает без направления.
         """
         self._rt = runtime
-        self._ev = None
         self._dir = 0
 
-    def start_left(self) -> None:
-        """EN: Start linear left movement.
-        RU: Запустить линейное движение влево.
+    def start_left(self, delay: float = 0.0, input_time=None, path: str = PATH_LINEAR) -> None:
+        """EN: Start linear left movement, optionally after delay seconds.
+        RU: Запустить линейное движение влево, при необходимости через delay секунд.
         """
         self._dir = -1
-        self._rt.set_speed_x_dir(1)
-        self._ensure()
+        self._rt.set_speed_x_dir(1, delay, input_time, path)
 
-    def start_right(self) -> None:
-        """EN: Start linear right movement.
-        RU: Запустить линейное движение вправо.
+    def start_right(self, delay: float = 0.0, input_time=None, path: str = PATH_LINEAR) -> None:
+        """EN: Start linear right movement, optionally after delay seconds.
+        RU: Запустить линейное движение вправо, при необходимости через delay секунд.
         """
         self._dir = 1
-        self._rt.set_speed_x_dir(-1)
-        self._ensure()
+        self._rt.set_speed_x_dir(-1, delay, input_time, path)
 
     def stop(self) -> None:
-        """EN: Stop linear movement.
-        RU: Остановить линейное движение.
+        """EN: Stop linear movement and cancel a delayed start.
+        RU: Остановить линейное движение и отменить отложенный старт.
         """
         self._dir = 0
         self._rt.set_speed_x_dir(0)
-        self._stop()
-
-    def _ensure(self) -> None:
-        """EN: Ensure the tick is scheduled.
-        RU: Убедиться, что тик запущен.
-        """
-        if not self._ev:
-            self._ev = Clock.schedule_interval(self._tick, 0)
-
-    def _stop(self) -> None:
-        """EN: Stop the tick.
-        RU: Остановить тик.
-        """
-        if self._ev:
-            self._ev.cancel()
-            self._ev = None
-
-    def _tick(self, dt) -> None:
-        """EN: Apply one linear movement tick.
-        RU: Применить один тик линейного движения.
-        """
-        if self._dir == 0:
-            return
-        self._rt.apply_linear_x(dt)
@@ -24,14 +24,14 @@ class StepController:
         """
         self._rt = runtime
 
-    def left(self) -> None:
-        """EN: Perform one left step.
-        RU: Выполнить один шаг влево.
+    def left(self, input_time: float | None = None) -> None:
+        """EN: Perform one left step; input_time stamps it for latency tracking.
+        RU: Выполнить один шаг влево; input_time отмечает его для замера задержки.
         """
-        self._rt.input_left_step()
+        self._rt.input_left_step(input_time)
 
-    def right(self) -> None:
-        """EN: Perform one right step.
-        RU: Выполнить один шаг вправо.
+    def right(self, input_time: float | None = None) -> None:
+        """EN: Perform one right step; input_time stamps it for latency tracking.
+        RU: Выполнить один шаг вправо; input_time отмечает его для замера задержки.
         """
-        self._rt.input_right_step()
+        self._rt.input_right_step(input_time)
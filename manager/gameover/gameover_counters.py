@@ -27,16 +27,6 @@ class GameOverCounters:
         """
         self.receive_click_count += 1
 
-    def dump_to_print(self) -> None:
-        """EN: Print current counters in one line.
-        RU: Вывести текущие счётчики одной строкой.
-        """
-        print(
-            f"[GameOverCounters] gameover={self.gameover_count} "
-            f"receive_click={self.receive_click_count}",
-            flush=True,
-        )
-
 
 counters = GameOverCounters()
 
@@ -1,7 +1,6 @@
 from kivy.lang import Builder
 from kivy.properties import StringProperty
 
-from kivymd.icon_definitions import md_icons
 from kivymd.uix.screen import MDScreen
 from kivymd.app import MDApp
 from kivymd.uix.list import MDListItem
@@ -64,6 +63,7 @@ class IconItem(MDListItem):
 class PreviousMDIcons(MDScreen):
     def set_list_md_icons(self, text="", search=False):
         '''Builds a list of icons for the screen MDIcons.'''
+        from kivymd.icon_definitions import md_icons
 
         def add_icon_item(name_icon):
             self.ids.rv.data.append(
@@ -96,4 +96,5 @@ class MainApp(MDApp):
         self.screen.set_list_md_icons()
 
 
-MainApp().run()
\ No newline at end of file
+if __name__ == "__main__":
+    MainApp().run()
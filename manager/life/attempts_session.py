@@ -10,6 +10,10 @@ RU: Хранит только счётчик попыток и возвраща
 
 from enum import Enum
 
+# EN: Event published to session listeners as listener(event, attempts_left).
+# RU: Событие, передаваемое слушателям сессии как listener(event, attempts_left).
+ATTEMPTS_CHANGED = "attempts_changed"
+
 
 class LossOutcome(Enum):
     """
@@ -46,6 +50,7 @@ class GameSessionManager:
         """
         self._max_attempts = max_attempts
         self._attempts_left = max_attempts
+        self._listeners = []
 
     def reset(self) -> None:
         """
@@ -56,7 +61,7 @@ class GameSessionManager:
         RU: Использует сохранённое значение max_attempts и полностью
         перезаписывает прошлое количество попыток.
         """
-        self._attempts_left = self._max_attempts
+        self._set_attempts_left(self._max_attempts)
 
     def register_loss(self) -> LossOutcome:
         """
@@ -70,7 +75,7 @@ class GameSessionManager:
         счётчик достиг нуля или ниже.
         """
         if self._attempts_left > 0:
-            self._attempts_left -= 1
+            self._set_attempts_left(self._attempts_left - 1)
         if self._attempts_left > 0:
             return LossOutcome.SOFT_RESET
         return LossOutcome.GAME_OVER
@@ -92,3 +97,30 @@ class GameSessionManager:
         RU: Возвращает фиксированное значение max_attempts без права изменения.
         """
         return self._max_attempts
+
+    def add_listener(self, listener) -> None:
+        """
+        Call listener(ATTEMPTS_CHANGED, attempts_left) after every change.
+
+        EN: reset() on a full session does not notify, since nothing changed.
+        RU: Вызывает listener(ATTEMPTS_CHANGED, attempts_left) после каждого
+        изменения. reset() при полном запасе не уведомляет — ничего не изменилось.
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener) -> None:
+        """
+        Stop notifying listener; unknown listeners are ignored.
+
+        RU: Прекращает уведомлять listener; неизвестные слушатели игнорируются.
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _set_attempts_left(self, value: int) -> None:
+        if value == self._attempts_left:
+            return
+        self._attempts_left = value
+        for listener in list(self._listeners):
+            listener(ATTEMPTS_CHANGED, value)
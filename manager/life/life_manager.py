@@ -3,10 +3,12 @@
 Lives manager that syncs attempts state with the lives indicator.
 
 EN: Delegates storage to a session manager and display to the indicator.
+The indicator is refreshed from session change notifications.
 RU: Делегирует хранение менеджеру сессии, а отображение индикатору.
+Индикатор обновляется по уведомлениям сессии об изменениях.
 """
 
-from manager.life.attempts_session import GameSessionManager, LossOutcome
+from manager.life.attempts_session import ATTEMPTS_CHANGED, GameSessionManager, LossOutcome
 from manager.life.lives_indicator import LivesIndicator
 
 
@@ -14,8 +16,10 @@ class LifeManager:
     """
     Keep attempts state in sync with the HUD indicator.
 
-    EN: Reads attempts from the session and updates the indicator.
-    RU: Читает попытки из сессии и обновляет индикатор.
+    EN: Subscribes to the session and updates the indicator only when the
+    attempts count changes.
+    RU: Подписывается на сессию и обновляет индикатор только при изменении
+    числа попыток.
     """
 
     def __init__(self, session: GameSessionManager, indicator: LivesIndicator) -> None:
@@ -25,8 +29,29 @@ class LifeManager:
         EN: Keeps dependencies required to sync attempts and UI.
         RU: Хранит зависимости для синхронизации попыток и UI.
         """
-        self._session = session
+        self._session = None
         self._indicator = indicator
+        self.bind_session(session)
+
+    def bind_session(self, session: GameSessionManager) -> None:
+        """
+        Follow another session and refresh the indicator from it.
+
+        EN: Unsubscribes from the previous session, if any.
+        RU: Переключается на другую сессию и обновляет индикатор по ней.
+        Отписывается от предыдущей сессии, если она была.
+        """
+        if self._session is session:
+            return
+        if self._session is not None:
+            self._session.remove_listener(self._on_session_event)
+        self._session = session
+        session.add_listener(self._on_session_event)
+        self.sync()
+
+    def _on_session_event(self, event: str, _attempts_left: int) -> None:
+        if event == ATTEMPTS_CHANGED:
+            self.sync()
 
     def sync(self) -> None:
         """
@@ -44,11 +69,10 @@ class LifeManager:
         """
         Reset attempts to max and sync indicator.
 
-        EN: Resets session attempts and refreshes the UI indicator.
-        RU: Сбрасывает попытки сессии и обновляет UI-индикатор.
+        EN: Resets session attempts; the indicator follows the notification.
+        RU: Сбрасывает попытки сессии; индикатор обновляется по уведомлению.
         """
         self._session.reset()
-        self.sync()
 
     def reset_to_full(self) -> None:
         """
@@ -64,9 +88,7 @@ class LifeManager:
         """
         Register a loss, update attempts, and sync indicator.
 
-        EN: Returns the loss outcome after updating attempts and UI.
-        RU: Возвращает исход потери после обновления попыток и UI.
+        EN: Returns the loss outcome; the indicator follows the notification.
+        RU: Возвращает исход потери; индикатор обновляется по уведомлению.
         """
-        outcome = self._session.register_loss()
-        self.sync()
-        return outcome
+        return self._session.register_loss()
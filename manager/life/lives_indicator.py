@@ -2,8 +2,12 @@
 """
 Visual-only lives indicator widget for the HUD.
 
-EN: Renders a row of KivyMD icons based on max_lives and lives_left.
-RU: Рисует ряд иконок KivyMD на основе max_lives и lives_left.
+EN: Renders a row of KivyMD icons based on max_lives and lives_left. Icon
+widgets are created once and reused; a lives change only flips the `icon`
+of the widgets whose state changed.
+RU: Рисует ряд иконок KivyMD на основе max_lives и lives_left. Виджеты
+иконок создаются один раз и переиспользуются; изменение жизней лишь
+переключает `icon` у тех виджетов, чьё состояние изменилось.
 """
 
 from __future__ import annotations
@@ -14,6 +18,11 @@ from kivymd.uix.label import MDIcon
 
 from manager.life import life_style
 
+# EN: Icon names for a remaining and a spent life.
+# RU: Имена иконок для оставшейся и потраченной жизни.
+ICON_FULL = "heart"
+ICON_EMPTY = "heart-outline"
+
 
 class LivesIndicator(BoxLayout):
     """
@@ -33,6 +42,7 @@ class LivesIndicator(BoxLayout):
         EN: Sets fixed size to allow accurate centering inside the host.
         RU: Задаёт фиксированный размер для корректного центрирования внутри контейнера.
         """
+        self._icons: list[MDIcon] = []
         super().__init__(**kwargs)
         self.orientation = "horizontal"
         self.size_hint = (None, None)
@@ -46,64 +56,87 @@ class LivesIndicator(BoxLayout):
         """
         Initialize icons after KV rules are applied.
 
-        EN: Triggers a rebuild once the widget tree is ready.
-        RU: Запускает пересборку после готовности дерева виджетов.
+        EN: Builds the icon row once the widget tree is ready.
+        RU: Строит ряд иконок после готовности дерева виджетов.
         """
-        self.set_lives(self.lives_left, self.max_lives)
+        self._sync_icon_count()
+        self._sync_icon_states()
 
     def set_lives(self, lives_left: int, max_lives: int | None = None) -> None:
         """
         Update lives and optionally the max lives.
 
-        EN: Stores values and rebuilds the icon row.
-        RU: Сохраняет значения и пересобирает ряд иконок.
+        EN: Stores values; property handlers touch only what changed, so
+        repeated calls with the same values do nothing.
+        RU: Сохраняет значения; обработчики свойств трогают только то, что
+        изменилось, поэтому повторные вызовы с теми же значениями ничего не
+        делают.
         """
         if max_lives is not None:
             self.max_lives = int(max_lives)
         self.lives_left = int(lives_left)
-        self._rebuild()
 
     def on_max_lives(self, *_args) -> None:
         """
-        Rebuild icons when max_lives changes.
+        Resize the icon row when max_lives changes.
 
         EN: Keeps the icon count in sync with max_lives.
         RU: Синхронизирует количество иконок с max_lives.
         """
-        self._rebuild()
+        self._sync_icon_count()
+        self._sync_icon_states()
 
     def on_lives_left(self, *_args) -> None:
         """
-        Rebuild icons when lives_left changes.
+        Update filled/empty icons when lives_left changes.
 
-        EN: Updates filled/empty icons as lives change.
-        RU: Обновляет заполненные/пустые иконки при изменении lives_left.
+        EN: Flips only the icons whose state changed.
+        RU: Переключает только иконки, чьё состояние изменилось.
         """
-        self._rebuild()
+        self._sync_icon_states()
 
-    def _rebuild(self) -> None:
+    def _sync_icon_count(self) -> None:
         """
-        Rebuild the icon row for the current lives state.
+        Attach exactly max_lives pooled icons to the row.
 
-        EN: Adds a spacer then filled/empty icons aligned to the right.
-        RU: Добавляет спейсер и заполненные/пустые иконки с выравниванием вправо.
+        EN: Missing icons are created and added to the pool; extra ones are
+        detached but kept for reuse.
+        RU: Подключает к ряду ровно max_lives иконок из пула. Недостающие
+        создаются и добавляются в пул; лишние отключаются, но сохраняются
+        для повторного использования.
         """
-        left = max(0, min(int(self.lives_left), int(self.max_lives)))
         max_l = max(0, int(self.max_lives))
-
-        self.clear_widgets()
-        self.spacing = life_style.HUD_LIVES_ICON_SPACING
-        self.width = (max_l * life_style.HUD_LIVES_FONT) + (max(max_l - 1, 0) * self.spacing)
-
-        for index in range(max_l):
-            is_full = index < left
-            icon = "heart" if is_full else "heart-outline"
-            self.add_widget(
+        icons = self._icons
+        while len(icons) < max_l:
+            icons.append(
                 MDIcon(
-                    icon=icon,
+                    icon=ICON_EMPTY,
                     font_size=life_style.HUD_LIVES_FONT,
                     size_hint=(None, None),
                     width=life_style.HUD_LIVES_FONT,
                     height=life_style.HUD_LIVES_FONT,
                 )
             )
+        for index, icon in enumerate(icons):
+            attached = icon.parent is self
+            if index < max_l and not attached:
+                self.add_widget(icon)
+            elif index >= max_l and attached:
+                self.remove_widget(icon)
+
+        self.spacing = life_style.HUD_LIVES_ICON_SPACING
+        self.width = (max_l * life_style.HUD_LIVES_FONT) + (max(max_l - 1, 0) * self.spacing)
+
+    def _sync_icon_states(self) -> None:
+        """
+        Show filled icons for remaining lives and outlines for spent ones.
+
+        RU: Показывает заполненные иконки для оставшихся жизней и контуры
+        для потраченных.
+        """
+        max_l = max(0, int(self.max_lives))
+        left = max(0, min(int(self.lives_left), max_l))
+        for index, icon in enumerate(self._icons[:max_l]):
+            name = ICON_FULL if index < left else ICON_EMPTY
+            if icon.icon != name:
+                icon.icon = name
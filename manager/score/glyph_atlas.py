@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+Pre-rasterized glyph atlas for the HUD score.
+
+EN: Renders the score prefix and the ten digits once into a single texture
+and keeps the texture coordinates of each chunk, so the score widget can
+draw any number as textured quads without re-rendering text. Atlases are
+cached per font and prefix, so switching language back and forth reuses
+them.
+RU: Заранее растеризованный атлас глифов для счёта HUD. Префикс счёта и
+десять цифр один раз рендерятся в одну текстуру, а для каждого фрагмента
+сохраняются текстурные координаты, поэтому виджет счёта рисует любое число
+текстурированными квадами без повторного рендера текста. Атласы кэшируются
+по шрифту и префиксу, поэтому переключение языка туда и обратно их
+переиспользует.
+"""
+
+from __future__ import annotations
+
+from kivy.core.text import Label as CoreLabel
+
+DIGITS = "0123456789"
+
+# EN: Drawn between atlas chunks so neighbouring glyphs never bleed into
+# each other's regions.
+# RU: Рисуется между фрагментами атласа, чтобы соседние глифы не заходили
+# в области друг друга.
+CHUNK_SEPARATOR = "|"
+
+_atlases: dict[tuple[str, float, str], "GlyphAtlas"] = {}
+
+
+class GlyphAtlas:
+    """
+    One texture holding the prefix and digit glyphs of one font.
+
+    EN: regions maps a chunk to (width, tex_coords); height is shared by all
+    chunks. gap is the advance of a space after the prefix.
+    RU: Одна текстура с глифами префикса и цифр одного шрифта. regions
+    сопоставляет фрагменту (ширина, tex_coords); высота общая для всех
+    фрагментов. gap — ширина пробела после префикса.
+    """
+
+    def __init__(self, prefix: str, font_name: str, font_size: float) -> None:
+        """
+        Rasterize prefix and digits and compute their regions.
+
+        RU: Растеризует префикс и цифры и вычисляет их области.
+        """
+        chunks = [prefix, *DIGITS] if prefix else list(DIGITS)
+        label = CoreLabel(
+            text=CHUNK_SEPARATOR.join(chunks),
+            font_name=font_name,
+            font_size=font_size,
+            color=(1, 1, 1, 1),
+        )
+        label.refresh()
+        self.texture = label.texture
+        self.height = self.texture.height
+        self.prefix = prefix
+        self.regions: dict[str, tuple[float, tuple]] = {}
+
+        text = ""
+        for chunk in chunks:
+            text = f"{text}{CHUNK_SEPARATOR}{chunk}" if text else chunk
+            width = label.get_extents(chunk)[0]
+            x = label.get_extents(text)[0] - width
+            region = self.texture.get_region(x, 0, width, self.height)
+            self.regions[chunk] = (width, tuple(region.tex_coords))
+
+        if prefix:
+            self.gap = label.get_extents(f"{prefix} ")[0] - label.get_extents(prefix)[0]
+        else:
+            self.gap = 0
+
+
+def get_glyph_atlas(prefix: str, font_name: str, font_size: float) -> GlyphAtlas:
+    """
+    Return the cached atlas for prefix and font, building it on first use.
+
+    EN: Requires a GL context, so call it only after the window exists.
+    RU: Возвращает кэшированный атлас для префикса и шрифта, создавая его при
+    первом обращении. Требует GL-контекст, поэтому вызывать только после
+    создания окна.
+    """
+    key = (prefix, float(font_size), font_name)
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = _atlases[key] = GlyphAtlas(prefix, font_name, font_size)
+    return atlas
@@ -6,6 +6,7 @@ EN: Thin adapter for score display updates.
 RU: Тонкий адаптер для обновления отображения счёта.
 """
 
+from engine.core.game_state import SCORE_CHANGED, GameState
 from manager.score.score_widget import ScoreLabel
 
 
@@ -13,8 +14,10 @@ class ScoreManager:
     """
     Manage score updates for the HUD.
 
-    EN: Delegates score changes to the label.
-    RU: Делегирует изменения счёта в лейбл.
+    EN: Delegates score changes to the label; when attached to a GameState
+    it follows SCORE_CHANGED notifications.
+    RU: Делегирует изменения счёта в лейбл; после attach() к GameState
+    следует уведомлениям SCORE_CHANGED.
     """
 
     def __init__(self, label: ScoreLabel) -> None:
@@ -25,6 +28,34 @@ class ScoreManager:
         RU: Хранит экземпляр лейбла для последующих обновлений.
         """
         self._label = label
+        self._state = None
+
+    def attach(self, state: GameState) -> None:
+        """
+        Follow score changes of state and show its current score.
+
+        RU: Следит за изменениями счёта в state и показывает текущий счёт.
+        """
+        if self._state is state:
+            return
+        self.detach()
+        self._state = state
+        state.add_listener(self._on_state_event)
+        self.set_score(state.current_y_loop)
+
+    def detach(self) -> None:
+        """
+        Stop following the attached state.
+
+        RU: Прекращает следить за подключённым состоянием.
+        """
+        if self._state is not None:
+            self._state.remove_listener(self._on_state_event)
+            self._state = None
+
+    def _on_state_event(self, event: str, value: int) -> None:
+        if event == SCORE_CHANGED:
+            self.set_score(value)
 
     def set_score(self, score: int) -> None:
         """
@@ -39,7 +70,7 @@ class ScoreManager:
         """
         Reset score to zero.
 
-        EN: Forces the label to show SCORE: 0.
-        RU: Принудительно показывает SCORE: 0.
+        EN: Forces the label to show a zero score.
+        RU: Принудительно показывает нулевой счёт.
         """
         self.set_score(0)
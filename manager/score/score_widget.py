@@ -1,61 +1,185 @@
 # -*- coding: utf-8 -*-
 """
-Score label widget for displaying the current score value.
+Score widget for displaying the current score value.
 
-EN: Lightweight label that formats the score as plain text.
-RU: Лёгкий лейбл, который форматирует счёт как обычный текст.
+EN: Draws the localized prefix and the score digits as textured quads of a
+single Mesh backed by a pre-rasterized glyph atlas. A score change only
+rewrites the vertex buffer (positions and UVs of a few quads); no text is
+re-rendered and no texture is uploaded.
+RU: Виджет счёта рисует локализованный префикс и цифры счёта
+текстурированными квадами одного Mesh на основе заранее растеризованного
+атласа глифов. Изменение счёта лишь переписывает буфер вершин (позиции и UV
+нескольких квадов); текст не перерисовывается, текстура не загружается.
 """
 
+from __future__ import annotations
+
+from kivy.app import App
+from kivy.graphics.context_instructions import Color
+from kivy.graphics.vertex_instructions import Mesh
+from kivy.metrics import sp
 from kivy.properties import NumericProperty, StringProperty
-from kivymd.uix.label import MDLabel
+from kivy.uix.widget import Widget
+
+from manager.score.glyph_atlas import get_glyph_atlas
+
+# EN: Theme font style and role the score is drawn with (MDLabel defaults).
+# RU: Стиль и роль шрифта темы для счёта (значения MDLabel по умолчанию).
+SCORE_FONT_STYLE = "Body"
+SCORE_FONT_ROLE = "large"
+
+# EN: Fallbacks when the app has no KivyMD theme.
+# RU: Значения на случай, если у приложения нет темы KivyMD.
+SCORE_FALLBACK_FONT = "Roboto"
+SCORE_FALLBACK_SIZE_SP = 16
+SCORE_FALLBACK_COLOR = (1, 1, 1, 1)
+
+# EN: Floats per vertex in the default Mesh format (x, y, u, v).
+# RU: Число float на вершину в формате Mesh по умолчанию (x, y, u, v).
+VERTEX_STRIDE = 4
+
+
+def _theme_font() -> tuple[str, float, tuple]:
+    """
+    Return (font_name, font_size, color) of the score font style.
+
+    RU: Возвращает (font_name, font_size, color) стиля шрифта счёта.
+    """
+    theme = getattr(App.get_running_app(), "theme_cls", None)
+    styles = getattr(theme, "font_styles", {}) or {}
+    style = styles.get(SCORE_FONT_STYLE, {}).get(SCORE_FONT_ROLE, {})
+    font_name = style.get("font-name", SCORE_FALLBACK_FONT)
+    font_size = style.get("font-size", sp(SCORE_FALLBACK_SIZE_SP))
+    color = tuple(getattr(theme, "onSurfaceColor", SCORE_FALLBACK_COLOR))
+    return font_name, font_size, color
 
 
-class ScoreLabel(MDLabel):
+class ScoreLabel(Widget):
     """
-    Display-only score label with centered vertical alignment.
+    Display-only score widget sized to its content.
 
-    EN: Updates its text when the score changes.
-    RU: Обновляет текст при изменении счёта.
+    EN: Call set_score() to update the number; set prefix to switch the
+    localized caption. Width follows the drawn text, height the font.
+    RU: Виджет только для отображения счёта, по размеру содержимого.
+    set_score() обновляет число; prefix переключает локализованную подпись.
+    Ширина следует за текстом, высота — за шрифтом.
     """
 
     score_value = NumericProperty(0)
-    score_text = StringProperty("SCORE: 0")
+    prefix = StringProperty("SCORE:")
+
+    def __init__(self, **kwargs) -> None:
+        """
+        Create the color and the empty mesh; the atlas loads in on_kv_post.
+
+        RU: Создаёт цвет и пустой Mesh; атлас загружается в on_kv_post.
+        """
+        self._atlas = None
+        self._quads = 0
+        self._vertices: list[float] = []
+        # EN: Widget.__init__ dispatches on_kv_post, which loads the atlas into
+        # the mesh, so the instructions must exist before super().__init__().
+        # RU: Widget.__init__ вызывает on_kv_post, который загружает атлас в
+        # Mesh, поэтому инструкции создаются до super().__init__().
+        self._color = Color(*SCORE_FALLBACK_COLOR)
+        self._mesh = Mesh(mode="triangles")
+        super().__init__(**kwargs)
+        self.canvas.add(self._color)
+        self.canvas.add(self._mesh)
+        self.bind(pos=self._layout)
 
     def on_kv_post(self, *_args) -> None:
         """
-        Initialize label alignment and text sizing.
+        Load the glyph atlas once the widget tree and window are ready.
+
+        RU: Загружает атлас глифов, когда дерево виджетов и окно готовы.
+        """
+        self._load_atlas()
 
-        EN: Ensures valign works by syncing text_size with widget size.
-        RU: Обеспечивает работу valign синхронизацией text_size с размером виджета.
+    def on_prefix(self, *_args) -> None:
         """
-        self.size_hint = (None, None)
-        self.halign = "left"
-        self.valign = "middle"
-        self.max_lines = 1
-        self.shorten = True
-        self.shorten_from = "right"
-        self.text_size = (None, self.height)
-        self.bind(height=self._sync_text_size)
-        self.text = self.score_text
-        self._sync_text_size()
+        Switch to the atlas of the new prefix.
 
-    def _sync_text_size(self, *_args) -> None:
+        RU: Переключается на атлас нового префикса.
         """
-        Sync text_size to enable vertical alignment.
+        if self._atlas is not None:
+            self._load_atlas()
 
-        EN: Keeps text_size equal to widget size.
-        RU: Держит text_size равным размеру виджета.
+    def on_score_value(self, *_args) -> None:
         """
-        self.text_size = (None, self.height)
+        Redraw the digits when the score changes.
+
+        RU: Перерисовывает цифры при изменении счёта.
+        """
+        self._layout()
 
     def set_score(self, value: int) -> None:
         """
-        Update score value and label text.
+        Update the displayed score value.
 
-        EN: Formats score as 'SCORE: N'.
-        RU: Форматирует счёт как 'SCORE: N'.
+        EN: Shows the score as '<prefix> N'.
+        RU: Показывает счёт как '<prefix> N'.
         """
         self.score_value = int(value)
-        self.score_text = f"SCORE: {self.score_value}"
-        self.text = self.score_text
-        self._sync_text_size()
+
+    def _load_atlas(self) -> None:
+        """
+        Fetch the atlas for the current prefix and theme font and redraw.
+
+        RU: Получает атлас для текущего префикса и шрифта темы и перерисовывает.
+        """
+        font_name, font_size, color = _theme_font()
+        self._atlas = get_glyph_atlas(self.prefix, font_name, font_size)
+        self._mesh.texture = self._atlas.texture
+        self._color.rgba = color
+        self.height = self._atlas.height
+        self._layout()
+
+    def _set_quad_count(self, count: int) -> None:
+        """
+        Resize the vertex buffer and rebuild indices for count quads.
+
+        RU: Меняет размер буфера вершин и перестраивает индексы под count квадов.
+        """
+        indices = []
+        for i in range(count):
+            base = i * 4
+            indices += (base, base + 1, base + 2, base + 2, base + 3, base)
+        self._vertices = [0.0] * (count * 4 * VERTEX_STRIDE)
+        self._mesh.indices = indices
+        self._quads = count
+
+    def _layout(self, *_args) -> None:
+        """
+        Write one quad per prefix and digit into the vertex buffer.
+
+        RU: Записывает по одному кваду на префикс и каждую цифру в буфер вершин.
+        """
+        atlas = self._atlas
+        if atlas is None:
+            return
+        digits = str(int(self.score_value))
+        chunks = [atlas.prefix, *digits] if atlas.prefix else list(digits)
+        if len(chunks) != self._quads:
+            self._set_quad_count(len(chunks))
+
+        vertices = self._vertices
+        regions = atlas.regions
+        height = atlas.height
+        x0 = x = self.x
+        y = self.y
+        top = y + height
+        offset = 0
+        for index, chunk in enumerate(chunks):
+            width, (u0, v0, u1, v1, u2, v2, u3, v3) = regions[chunk]
+            right = x + width
+            vertices[offset:offset + 16] = (
+                x, y, u0, v0,
+                right, y, u1, v1,
+                right, top, u2, v2,
+                x, top, u3, v3,
+            )
+            offset += 16
+            x = right + atlas.gap if index == 0 and atlas.prefix else right
+        self._mesh.vertices = vertices
+        self.width = x - x0
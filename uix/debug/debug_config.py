@@ -3,3 +3,6 @@ RU: Флаги конфигурации отладки.
 """
 
 DEBUG_UI_BORDERS = True
+DEBUG_FRAME_PROFILER = False
+DEBUG_INPUT_LATENCY = False
+DEBUG_STARTUP_TRACE = False
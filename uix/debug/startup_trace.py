@@ -0,0 +1,189 @@
+"""EN: Opt-in startup tracer for import and phase timings.
+RU: Опциональный трассировщик старта: время импортов и фаз.
+
+EN: When enabled (DEBUG_STARTUP_TRACE or COSMIC_STARTUP_TRACE=1) it wraps
+builtins.__import__ to record inclusive and self time of every first-time
+module import, times named phases, and writes a JSON report to
+`<user_data_dir>/debug/startup_trace.json` when startup finishes. Must not
+import Kivy at module level: main.py starts it before any Kivy import.
+RU: При включении (DEBUG_STARTUP_TRACE или COSMIC_STARTUP_TRACE=1)
+оборачивает builtins.__import__ и записывает полное и собственное время
+каждого первого импорта модуля, замеряет именованные фазы и пишет JSON-отчёт
+в `<user_data_dir>/debug/startup_trace.json` по окончании старта. Не должен
+импортировать Kivy на уровне модуля: main.py запускает его до импортов Kivy.
+"""
+
+from __future__ import annotations
+
+import builtins
+import importlib.util
+import json
+import os
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from time import perf_counter
+
+from uix.debug.debug_config import DEBUG_STARTUP_TRACE
+
+ENV_FLAG = "COSMIC_STARTUP_TRACE"
+
+# EN: Number of slowest modules printed to the log.
+# RU: Число самых медленных модулей, выводимых в лог.
+SUMMARY_TOP = 15
+
+
+class StartupTrace:
+    """EN: Collect import and phase timings for one application start.
+    RU: Собирает время импортов и фаз для одного запуска приложения.
+    """
+
+    def __init__(self) -> None:
+        """EN: Create an inactive tracer.
+        RU: Создать неактивный трассировщик.
+        """
+        self.enabled = False
+        self._t0 = 0.0
+        self._orig_import = None
+        self._stack: list[list] = []
+        self._imports: dict[str, dict] = {}
+        self._phases: dict[str, float] = {}
+        self._marks: dict[str, float] = {}
+
+    def start_if_requested(self) -> None:
+        """EN: Start tracing if the debug flag or environment variable is set.
+        RU: Запустить трассировку, если задан флаг отладки или переменная окружения.
+        """
+        if DEBUG_STARTUP_TRACE or os.environ.get(ENV_FLAG) == "1":
+            self.start()
+
+    def start(self) -> None:
+        """EN: Install the import hook and start the clock.
+        RU: Установить хук импорта и запустить отсчёт.
+        """
+        if self.enabled:
+            return
+        self.enabled = True
+        self._t0 = perf_counter()
+        self._orig_import = builtins.__import__
+        builtins.__import__ = self._traced_import
+
+    def stop(self) -> None:
+        """EN: Remove the import hook; collected data is kept.
+        RU: Снять хук импорта; собранные данные сохраняются.
+        """
+        if self._orig_import is not None:
+            builtins.__import__ = self._orig_import
+            self._orig_import = None
+
+    @contextmanager
+    def phase(self, name: str):
+        """EN: Time a named phase; a no-op when tracing is disabled.
+        RU: Замерить именованную фазу; ничего не делает без трассировки.
+        """
+        if not self.enabled:
+            yield
+            return
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            self._phases[name] = perf_counter() - started
+
+    def mark(self, name: str) -> None:
+        """EN: Record the time since start for a named milestone.
+        RU: Записать время от старта для именованной отметки.
+        """
+        if self.enabled and name not in self._marks:
+            self._marks[name] = perf_counter() - self._t0
+
+    def report(self) -> dict:
+        """EN: Return a JSON-serializable report, slowest imports first.
+        RU: Вернуть JSON-сериализуемый отчёт, самые медленные импорты первыми.
+        """
+        imports = sorted(self._imports.items(), key=lambda item: item[1]["self"], reverse=True)
+        return {
+            "marks_ms": {name: round(sec * 1000, 2) for name, sec in self._marks.items()},
+            "phases_ms": {name: round(sec * 1000, 2) for name, sec in self._phases.items()},
+            "imports_ms": [
+                {
+                    "module": name,
+                    "self": round(data["self"] * 1000, 2),
+                    "total": round(data["total"] * 1000, 2),
+                }
+                for name, data in imports
+            ],
+        }
+
+    def finish(self) -> None:
+        """EN: Stop tracing, write the report, and print a short summary.
+        RU: Остановить трассировку, записать отчёт и вывести краткую сводку.
+        """
+        if not self.enabled:
+            return
+        self.stop()
+        self.enabled = False
+        report = self.report()
+        path = self._report_path()
+        try:
+            self._dump_json(path, report)
+            print(f"[Startup] {path}", flush=True)
+        except OSError as exc:
+            print(f"[Startup] dump failed: {exc}", flush=True)
+        for name, ms in report["marks_ms"].items():
+            print(f"[Startup] {name}: {ms} ms", flush=True)
+        for name, ms in report["phases_ms"].items():
+            print(f"[Startup] phase {name}: {ms} ms", flush=True)
+        for row in report["imports_ms"][:SUMMARY_TOP]:
+            print(f"[Startup] import {row['module']}: self={row['self']} total={row['total']} ms", flush=True)
+
+    def _traced_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        """EN: Time first-time imports; cached imports pass straight through.
+        RU: Замерять первые импорты; кэшированные проходят напрямую.
+        """
+        key = name
+        if level:
+            package = (globals or {}).get("__package__") or ""
+            try:
+                key = importlib.util.resolve_name("." * level + name, package)
+            except (ImportError, ValueError):
+                key = name
+        if key in sys.modules:
+            return self._orig_import(name, globals, locals, fromlist, level)
+        frame = [key, 0.0]
+        self._stack.append(frame)
+        started = perf_counter()
+        try:
+            return self._orig_import(name, globals, locals, fromlist, level)
+        finally:
+            total = perf_counter() - started
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1][1] += total
+            if key not in self._imports:
+                self._imports[key] = {"self": total - frame[1], "total": total}
+
+    @staticmethod
+    def _report_path() -> Path:
+        """EN: Return `<user_data_dir>/debug/startup_trace.json`.
+        RU: Вернуть `<user_data_dir>/debug/startup_trace.json`.
+        """
+        from kivy.app import App
+
+        app = App.get_running_app()
+        user_dir = Path(getattr(app, "user_data_dir", ".")) if app else Path(".")
+        return user_dir / "debug" / "startup_trace.json"
+
+    @staticmethod
+    def _dump_json(path: Path, report: dict) -> None:
+        """EN: Write the report to path atomically via a temp file.
+        RU: Атомарно записать отчёт в path через временный файл.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = path.with_suffix(".tmp")
+        with tmp_file.open("w", encoding="utf-8") as fh:
+            json.dump(report, fh, ensure_ascii=False, indent=2)
+        os.replace(tmp_file, path)
+
+
+startup_trace = StartupTrace()
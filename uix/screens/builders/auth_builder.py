@@ -1,41 +1,45 @@
 """EN: Builder for the authentication flow screens.
 RU: Сборщик экранов потока аутентификации.
+
+EN: Screens are registered lazily: each builder imports its view module
+(parsing its KV) and constructs the screen the first time its route is
+opened or pre-warmed. Only the initial screen is built by the preloader.
+RU: Экраны регистрируются лениво: каждый сборщик импортирует модуль
+представления (разбирая его KV) и создаёт экран при первом открытии
+маршрута или прогреве. Загрузчик строит только начальный экран.
 """
 
+from pathlib import Path
+
+from kivy.lang import Builder
+from kivymd.uix.screen import MDScreen
+
+from data.lang.lang_reader import load_lang_dict
 from manager.lang.lang_manager import t
 from uix.screens import routes
-from uix.screens.auth.login.login_controller import LoginController
-from uix.screens.auth.login.login_vm import LoginVM
-from uix.screens.auth.login.login_view import LoginScreenView
-from uix.screens.auth.register.register_controller import RegisterController
-from uix.screens.auth.register.register_vm import RegisterVM
-from uix.screens.auth.register.register_view import RegisterScreenView
-from uix.screens.game.game_controller import GameScreenController
-from uix.screens.game.game_vm import GameScreenVM
-from uix.screens.game.game_view import GameScreenView
-from uix.screens.profile.profile_controller import ProfileScreenController
-from uix.screens.profile.profile_vm import ProfileScreenVM
-from uix.screens.profile.profile_view import ProfileScreenView
-from uix.screens.profile_change.profile_change_controller import ProfileChangeController
-from uix.screens.profile_change.profile_change_vm import ProfileChangeVM
-from uix.screens.profile_change.profile_change_view import ProfileChangeView
-from uix.screens.load_app.load_app_view import LoadAppScreenView
+from uix.screens.load_app.constants import BACKGROUND_GIF
+from uix.screens.load_app.load_app_view import LoadAppScreenView, initial_route
+from uix.screens.load_app.preloader import Preloader
 from uix.screens.routes import GAME, LOAD_APP, LOGIN, PROFILE, PROFILE_CHANGE, REGISTER, SETTINGS, START
 from uix.screens.screen_manager import AppScreenManager
-from uix.screens.settings.settings_controller import SettingsScreenController
-from uix.screens.settings.settings_vm import SettingsScreenVM
-from uix.screens.settings.settings_view import SettingsScreenView
-from uix.screens.start.start_controller import StartScreenController
-from uix.screens.start.start_vm import StartScreenVM
-from uix.screens.start.start_view import StartScreenView
 
+ROOT = Path(__file__).resolve().parents[3]
 
-def build_auth_flow(manager: AppScreenManager) -> None:
-    """EN: Build login/register screens and wire navigation callbacks.
-    RU: Построить экраны входа/регистрации и связать навигацию.
+
+def _load_banner_kv() -> None:
+    """EN: Load shared banner rules used by several screens.
+    RU: Загрузить общие правила баннера, используемые несколькими экранами.
     """
-    load_view = LoadAppScreenView(manager, name=LOAD_APP)
-    manager.register(load_view)
+    Builder.load_file(str(ROOT / "ads" / "banner" / "banner_slot.kv"))
+
+
+def _build_start(manager: AppScreenManager) -> MDScreen:
+    """EN: Build the start screen.
+    RU: Построить стартовый экран.
+    """
+    from uix.screens.start.start_controller import StartScreenController
+    from uix.screens.start.start_view import StartScreenView
+    from uix.screens.start.start_vm import StartScreenVM
 
     start_vm = StartScreenVM(
         title=t("app.title"),
@@ -50,44 +54,16 @@ def build_auth_flow(manager: AppScreenManager) -> None:
     )
     start_view = StartScreenView(name=START)
     start_view.configure(start_vm, start_controller)
+    return start_view
 
-    profile_vm = ProfileScreenVM(
-        title=t("profile.title"),
-        back_text=t("common.back"),
-        payout_text=t("profile.btn_payout"),
-        login_text=t("profile.btn_edit"),
-    )
-    profile_controller = ProfileScreenController(on_back=lambda: manager.go(START))
-    profile_view = ProfileScreenView(name=PROFILE)
-    profile_view.configure(profile_vm, profile_controller)
 
-    profile_change_vm = ProfileChangeVM()
-    profile_change_vm.title = t("profile_change.title")
-    profile_change_vm.field_login = t("profile_change.field.login")
-    profile_change_vm.field_email = t("profile_change.field.email")
-    profile_change_vm.field_phone = t("profile_change.field.phone")
-    profile_change_vm.field_tg = t("profile_change.field.tg")
-    profile_change_vm.field_password = t("profile_change.field.password")
-    profile_change_vm.btn_ok = t("profile_change.btn_ok")
-    profile_change_vm.btn_delete = t("profile_change.btn_delete")
-    profile_change_vm.btn_back = t("profile_change.btn_back")
-    profile_change_controller = ProfileChangeController()
-    profile_change_view = ProfileChangeView(name=PROFILE_CHANGE)
-    profile_change_view.configure(profile_change_vm, profile_change_controller)
-
-    settings_vm = SettingsScreenVM(
-        title=t("settings.title"),
-        back_text=t("common.back"),
-        login_text=t("settings.btn_logout"),
-        action_text=t("settings.btn_action"),
-    )
-    settings_controller = SettingsScreenController(
-        on_back=manager.back,
-        on_payout=lambda: None,
-        on_logout=lambda: manager.go(LOGIN),
-    )
-    settings_view = SettingsScreenView(name=SETTINGS)
-    settings_view.configure(settings_vm, settings_controller)
+def _build_login(manager: AppScreenManager) -> MDScreen:
+    """EN: Build the login screen.
+    RU: Построить экран входа.
+    """
+    from uix.screens.auth.login.login_controller import LoginController
+    from uix.screens.auth.login.login_view import LoginScreenView
+    from uix.screens.auth.login.login_vm import LoginVM
 
     login_vm = LoginVM(
         title=t("login.title"),
@@ -104,6 +80,16 @@ def build_auth_flow(manager: AppScreenManager) -> None:
     )
     login_view = LoginScreenView(name=LOGIN)
     login_view.configure(login_vm, login_controller)
+    return login_view
+
+
+def _build_register(manager: AppScreenManager) -> MDScreen:
+    """EN: Build the registration screen.
+    RU: Построить экран регистрации.
+    """
+    from uix.screens.auth.register.register_controller import RegisterController
+    from uix.screens.auth.register.register_view import RegisterScreenView
+    from uix.screens.auth.register.register_vm import RegisterVM
 
     register_vm = RegisterVM(
         title_text=t("register.title"),
@@ -119,6 +105,84 @@ def build_auth_flow(manager: AppScreenManager) -> None:
     )
     register_view = RegisterScreenView(name=REGISTER)
     register_view.configure(register_vm, register_controller)
+    return register_view
+
+
+def _build_settings(manager: AppScreenManager) -> MDScreen:
+    """EN: Build the settings screen.
+    RU: Построить экран настроек.
+    """
+    from uix.screens.settings.settings_controller import SettingsScreenController
+    from uix.screens.settings.settings_view import SettingsScreenView
+    from uix.screens.settings.settings_vm import SettingsScreenVM
+
+    settings_vm = SettingsScreenVM(
+        title=t("settings.title"),
+        back_text=t("common.back"),
+        login_text=t("settings.btn_logout"),
+        action_text=t("settings.btn_action"),
+    )
+    settings_controller = SettingsScreenController(
+        on_back=manager.back,
+        on_payout=lambda: None,
+        on_logout=lambda: manager.go(LOGIN),
+    )
+    settings_view = SettingsScreenView(name=SETTINGS)
+    settings_view.configure(settings_vm, settings_controller)
+    return settings_view
+
+
+def _build_profile(manager: AppScreenManager) -> MDScreen:
+    """EN: Build the profile screen.
+    RU: Построить экран профиля.
+    """
+    from uix.screens.profile.profile_controller import ProfileScreenController
+    from uix.screens.profile.profile_view import ProfileScreenView
+    from uix.screens.profile.profile_vm import ProfileScreenVM
+
+    profile_vm = ProfileScreenVM(
+        title=t("profile.title"),
+        back_text=t("common.back"),
+        payout_text=t("profile.btn_payout"),
+        login_text=t("profile.btn_edit"),
+    )
+    profile_controller = ProfileScreenController(on_back=lambda: manager.go(START))
+    profile_view = ProfileScreenView(name=PROFILE)
+    profile_view.configure(profile_vm, profile_controller)
+    return profile_view
+
+
+def _build_profile_change(manager: AppScreenManager) -> MDScreen:
+    """EN: Build the profile editing screen.
+    RU: Построить экран редактирования профиля.
+    """
+    from uix.screens.profile_change.profile_change_controller import ProfileChangeController
+    from uix.screens.profile_change.profile_change_view import ProfileChangeView
+    from uix.screens.profile_change.profile_change_vm import ProfileChangeVM
+
+    profile_change_vm = ProfileChangeVM()
+    profile_change_vm.title = t("profile_change.title")
+    profile_change_vm.field_login = t("profile_change.field.login")
+    profile_change_vm.field_email = t("profile_change.field.email")
+    profile_change_vm.field_phone = t("profile_change.field.phone")
+    profile_change_vm.field_tg = t("profile_change.field.tg")
+    profile_change_vm.field_password = t("profile_change.field.password")
+    profile_change_vm.btn_ok = t("profile_change.btn_ok")
+    profile_change_vm.btn_delete = t("profile_change.btn_delete")
+    profile_change_vm.btn_back = t("profile_change.btn_back")
+    profile_change_controller = ProfileChangeController()
+    profile_change_view = ProfileChangeView(name=PROFILE_CHANGE)
+    profile_change_view.configure(profile_change_vm, profile_change_controller)
+    return profile_change_view
+
+
+def _build_game(manager: AppScreenManager) -> MDScreen:
+    """EN: Build the game screen.
+    RU: Построить игровой экран.
+    """
+    from uix.screens.game.game_controller import GameScreenController
+    from uix.screens.game.game_view import GameScreenView
+    from uix.screens.game.game_vm import GameScreenVM
 
     game_vm = GameScreenVM(
         title=t("game.title"),
@@ -132,10 +196,67 @@ def build_auth_flow(manager: AppScreenManager) -> None:
     )
     game_view = GameScreenView(name=GAME)
     game_view.configure(game_vm, game_controller)
-    manager.register(start_view)
-    manager.register(login_view)
-    manager.register(register_view)
-    manager.register(settings_view)
-    manager.register(profile_view)
-    manager.register(profile_change_view)
-    manager.register(game_view)
+    return game_view
+
+
+SCREEN_BUILDERS = (
+    (START, _build_start),
+    (LOGIN, _build_login),
+    (REGISTER, _build_register),
+    (SETTINGS, _build_settings),
+    (PROFILE, _build_profile),
+    (PROFILE_CHANGE, _build_profile_change),
+    (GAME, _build_game),
+)
+
+# EN: Likely next routes built in idle time after a route is shown.
+# RU: Вероятные следующие маршруты, строящиеся в простое после показа маршрута.
+PREWARM = {
+    START: (GAME,),
+    LOGIN: (START, REGISTER),
+    REGISTER: (LOGIN,),
+    PROFILE: (PROFILE_CHANGE,),
+}
+
+
+def _warm_lang_dicts() -> None:
+    """EN: Read every language JSON into the reader cache.
+    RU: Прочитать все языковые JSON в кэш загрузчика.
+    """
+    for path in sorted((ROOT / "data" / "lang").glob("*.json")):
+        load_lang_dict(path.stem)
+
+
+def _warm_background_gif() -> None:
+    """EN: Bake the game background atlas if it is not cached yet.
+    RU: Запечь атлас фона игры, если его ещё нет в кэше.
+    """
+    from uix.widgets.gif_background import prepare_gif_atlas
+
+    prepare_gif_atlas(BACKGROUND_GIF)
+
+
+def build_preloader(manager: AppScreenManager) -> Preloader:
+    """EN: Create the startup preloader with file tasks and the initial screen.
+    RU: Создать стартовый загрузчик с файловыми задачами и начальным экраном.
+    """
+    preloader = Preloader()
+    preloader.add("lang", _warm_lang_dicts, threaded=True)
+    preloader.add("background_gif", _warm_background_gif, threaded=True)
+    preloader.add("banner_kv", _load_banner_kv)
+    preloader.add("initial_screen", lambda: manager.ensure(initial_route()))
+    return preloader
+
+
+def build_auth_flow(manager: AppScreenManager) -> None:
+    """EN: Register the loading screen and lazy factories for the others.
+    RU: Зарегистрировать экран загрузки и ленивые фабрики остальных экранов.
+    """
+    load_view = LoadAppScreenView(manager, build_preloader(manager), name=LOAD_APP)
+    manager.register(load_view)
+    for route, builder in SCREEN_BUILDERS:
+        manager.register_lazy(
+            route,
+            lambda builder=builder: builder(manager),
+            prewarm=PREWARM.get(route, ()),
+        )
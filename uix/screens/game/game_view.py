@@ -5,12 +5,15 @@ RU: Представление экрана игры.
 from pathlib import Path
 import time
 
+from kivy.app import App
 from kivy.clock import Clock
 from kivy.lang import Builder
 from kivy.metrics import dp
 from kivy.uix.anchorlayout import AnchorLayout
 from kivymd.uix.screen import MDScreen
 
+from android_tools.display import display_refresh_rate
+from engine.core.game_loop import fps_for_refresh_rate
 from engine.runtime.gameplay_runtime import GameplayRuntime
 from engine.widgets.gameplay_surface import GameplaySurface
 from manager.life.attempts_session import GameSessionManager
@@ -26,9 +29,11 @@ from data.gameplay.rating_storage import RatingStorage
 from data.gameplay.record_store import RecordStore
 from ads.payment.balance_store import BalanceStore
 from ads.payment.payment_math import calc_balance
+from data.journal.session_journal import BACK, GAME_OVER, LOSS, REWARD_CLICK, START, session_journal
 from manager.gameover.gameover_counters import counters
 from manager.lang.lang_manager import t
 from uix.debug.debug_borders import apply_debug_borders_to_ids
+from uix.debug.debug_config import DEBUG_FRAME_PROFILER, DEBUG_INPUT_LATENCY
 from uix.screens.common.button_text_style import apply_button_text_style, caps
 from ads.rewarded.rewarded_modal import RewardedAdModal
 
@@ -72,9 +77,13 @@ class GameScreenView(MDScreen):
             host = self.ids.gameplay_layout
             surface = GameplaySurface(size_hint=(1, 1))
             host.add_widget(surface)
-            runtime = GameplayRuntime(surface)
+            runtime = GameplayRuntime(surface, fps=fps_for_refresh_rate(display_refresh_rate()))
             runtime.on_game_over = self._show_hud_after_loss
             runtime.on_loss = self._on_runtime_loss
+            if DEBUG_FRAME_PROFILER:
+                runtime.enable_profiler()
+            if DEBUG_INPUT_LATENCY:
+                runtime.enable_latency_tracker()
             Clock.schedule_once(lambda *_: runtime.prepare_scene(), 0)
             surface.bind(size=lambda *_: runtime.request_redraw())
             self._gameplay_surface = surface
@@ -82,11 +91,13 @@ class GameScreenView(MDScreen):
             self._state = runtime._state
             self._runtime_session = runtime._session
             if hasattr(self, "_life"):
-                self._life._session = runtime._session
-                self._life.sync()
+                self._life.bind_session(runtime._session)
+            if hasattr(self, "_score"):
+                self._score.attach(runtime._state)
+            if hasattr(self, "_rating_session"):
+                runtime._state.add_listener(self._rating_session.on_state_event)
             self._game_control = GameControlManager(runtime)
             self._game_control.attach(surface)
-            self._start_hud_sync()
     def configure(self, vm: GameScreenVM, controller: GameScreenController) -> None:
         """EN: Configure texts and bind callbacks.
         RU: Настроить тексты и привязать колбэки.
@@ -102,7 +113,12 @@ class GameScreenView(MDScreen):
         RU: Повторно подключить управление при входе на экран.
         """
         self._reset_to_first_start_state()
+        state = getattr(self, "_state", None)
+        if hasattr(self, "_rating_session") and state is not None:
+            state.remove_listener(self._rating_session.on_state_event)
         self._rating_session = RatingSession()
+        if state is not None:
+            state.add_listener(self._rating_session.on_state_event)
         self.touch_controls_hide()
         if hasattr(self, "_game_control") and hasattr(self, "_gameplay_surface"):
             self._game_control.attach(self._gameplay_surface)
@@ -113,7 +129,6 @@ class GameScreenView(MDScreen):
         """
         if hasattr(self, "_gameplay_runtime"):
             self._gameplay_runtime.stop()
-        self._stop_hud_sync()
         if hasattr(self, "_game_control") and hasattr(self, "_gameplay_surface"):
             self._game_control.detach(self._gameplay_surface)
 
@@ -121,7 +136,7 @@ class GameScreenView(MDScreen):
         """EN: Inject score and lives widgets into the top bar.
         RU: 124142303238424c 3238343635424b 4147514230 38 3638373d3539 32 323540453d4e4e 3f303d353b4c.
         """
-        self._score_label = ScoreLabel()
+        self._score_label = ScoreLabel(prefix=t("game.score_prefix"))
         self._score_label.size_hint = (None, None)
         if hasattr(self._score_label, "adaptive_size"):
             self._score_label.adaptive_size = True
@@ -129,6 +144,9 @@ class GameScreenView(MDScreen):
         left_host.add_widget(self._score_label)
         self.ids.lefttopbar.add_widget(left_host)
         self._score = ScoreManager(self._score_label)
+        state = getattr(self, "_state", None)
+        if state is not None:
+            self._score.attach(state)
 
         self._lives_indicator = LivesIndicator()
         self._lives_indicator.size_hint = (None, None)
@@ -142,7 +160,6 @@ class GameScreenView(MDScreen):
         if session is None:
             session = GameSessionManager(max_attempts=3)
         self._life = LifeManager(session, self._lives_indicator)
-        self._life.sync()
 
     def on_screen_control(self, action: str, pressed: bool) -> None:
         """EN: Dispatch on-screen control events to game control manager.
@@ -182,51 +199,17 @@ class GameScreenView(MDScreen):
         """
         self._touch_controls_set_visible(False)
 
-    def _start_hud_sync(self) -> None:
-        """EN: Start periodic HUD synchronization.
-        RU: 17303f43414238424c 3f3540383e34384735413a434e 41383d45403e3d38373046384e HUD.
-        """
-        if getattr(self, "_hud_ev", None):
-            return
-        self._last_score = None
-        self._hud_ev = Clock.schedule_interval(self._sync_hud, 0)
-
-    def _stop_hud_sync(self) -> None:
-        """EN: Stop periodic HUD synchronization.
-        RU: 1e4142303d3e3238424c 3f3540383e34384735413a434e 41383d45403e3d38373046384e HUD.
-        """
-        ev = getattr(self, "_hud_ev", None)
-        if ev:
-            ev.cancel()
-        self._hud_ev = None
-
-    def _sync_hud(self, _dt) -> None:
-        """EN: Sync score and lives from the current runtime state.
-        RU: 21383d45403e3d383738403e3230424c 41475142 38 3638373d38 3837 42353a434935333e 413e41423e4f3d384f runtime.
-        """
-        state = getattr(self, "_state", None)
-        if state:
-            score = int(getattr(state, "current_y_loop", 0))
-            if score != self._last_score:
-                self._score.set_score(score)
-                if hasattr(self, "_rating_session"):
-                    self._rating_session.on_score_changed(score)
-                self._last_score = score
-        if hasattr(self, "_life"):
-            self._life.sync()
-
     def _on_runtime_loss(self) -> None:
         """EN: Update lives when the runtime registers a loss.
         RU: 1e313d3e3238424c 3638373d38 3f4038 4035333841424030463838 3f3e42354038 32 runtime.
         """
         self._time_manager.time_gameplay(stop=True)
+        session_journal.log(LOSS)
         if hasattr(self, "_rating_session"):
             self._rating_session.on_life_lost()
         if not hasattr(self, "_life"):
             return
-        if getattr(self, "_runtime_session", None) is getattr(self._life, "_session", None):
-            self._life.sync()
-        else:
+        if getattr(self, "_runtime_session", None) is not getattr(self._life, "_session", None):
             self._life.register_loss()
 
     def _hide_hud_for_play(self) -> None:
@@ -241,8 +224,8 @@ class GameScreenView(MDScreen):
         RU: Показать все HUD-бары после проигрыша.
         """
         counters.inc_gameover()
-        if hasattr(self, "_rating_session"):
-            self._rating_session.on_game_over(time.time())
+        current_score = int(getattr(getattr(self, "_state", None), "current_y_loop", 0))
+        session_journal.log(GAME_OVER, score=current_score)
         if hasattr(self, "_game_control"):
             self._game_control.hud_reset()
         self.touch_controls_hide()
@@ -257,6 +240,7 @@ class GameScreenView(MDScreen):
         RU: Открыть rewarded-модалку и продолжить игру после закрытия.
         """
         counters.inc_receive_click()
+        session_journal.log(REWARD_CLICK)
         modal = RewardedAdModal(on_close=self._resume_after_reward)
         self._rewarded_modal = modal
         modal.open()
@@ -282,7 +266,6 @@ class GameScreenView(MDScreen):
         - никакой рекламы/оверлея
         - тач-кнопки скрыты
         - runtime остановлен
-        - HUD синхронизация остановлена
         - подготовить сцену (без запуска)
         """
         reward_modal = getattr(self, "_reward_modal", None)
@@ -304,6 +287,8 @@ class GameScreenView(MDScreen):
         self.ids.game_btn_text.text = caps(t("game.btn_start"))
         self.ids.game_btn.on_release = self._on_start_pressed
         self.ids.title_lbl.text = t("game.title")
+        if hasattr(self, "_score_label"):
+            self._score_label.prefix = t("game.score_prefix")
 
         set_hud_visible(self, top=True, content=True, bottom=True)
         self.touch_controls_hide()
@@ -314,9 +299,6 @@ class GameScreenView(MDScreen):
 
         if hasattr(self, "_gameplay_runtime"):
             self._gameplay_runtime.stop()
-        if hasattr(self, "_stop_hud_sync"):
-            self._stop_hud_sync()
-
         self._reset_hud_state()
         if hasattr(self, "_gameplay_runtime"):
             Clock.schedule_once(lambda *_: self._gameplay_runtime.prepare_scene(), 0)
@@ -331,12 +313,12 @@ class GameScreenView(MDScreen):
             self._score.reset()
         if hasattr(self, "_life"):
             self._life.reset_to_full()
-        self._last_score = None
 
     def _on_back_pressed(self) -> None:
         """EN: Stop runtime, reset HUD, and navigate back.
         RU: Остановить runtime, сбросить HUD и вернуться назад.
         """
+        event = {}
         if hasattr(self, "_rating_session"):
             self._rating_session.on_exit_back(time.time())
             gameplay_sec = self._rating_session.gameplay_duration_sec or None
@@ -347,16 +329,15 @@ class GameScreenView(MDScreen):
                 gameplay_sec,
             )
             RatingStorage().save_points(rating_points)
-            print(
-                "[Rating] "
-                f"points={rating_points} "
-                f"best_life={self._rating_session.best_life_score} "
-                f"best_game={self._rating_session.best_game_score} "
-                f"valid_starts={self._rating_session.valid_starts} "
-                f"gameplay_sec={self._rating_session.gameplay_duration_sec}",
-                flush=True,
+            event.update(
+                rating_points=rating_points,
+                best_life=self._rating_session.best_life_score,
+                best_game=self._rating_session.best_game_score,
+                valid_starts=self._rating_session.valid_starts,
+                rating_gameplay_sec=self._rating_session.gameplay_duration_sec,
             )
         session_sec = self._time_manager.time_game_session(stop=True)
+        event["session_started"] = self._session_started
         if self._session_started:
             time_sec = float(session_sec or 0.0)
             receive_click_delta = counters.receive_click_count - int(self._receive_click_start)
@@ -365,30 +346,40 @@ class GameScreenView(MDScreen):
 
             delta = calc_balance(time_sec, receive_click_delta)
             self._balance_store.add(delta)
+            event["balance_delta"] = delta
 
             # чтобы не было двойного начисления при повторном back
             self._session_started = False
         gameplay_sec = self._time_manager.time_gameplay()
         if gameplay_sec is None:
             gameplay_sec = 0.0
-        print(
-            f"[Time] game_session_sec={session_sec or 0.0:.2f} gameplay_sec={gameplay_sec:.2f}",
-            flush=True,
-        )
+        event["session_sec"] = round(float(session_sec or 0.0), 2)
+        event["gameplay_sec"] = round(float(gameplay_sec), 2)
         if self._game_over_flag:
             current_score = int(getattr(getattr(self, "_state", None), "current_y_loop", 0))
-            best_score = self._record_store.commit_if_higher(current_score)
-            print(f"[Record] best_score={best_score}", flush=True)
+            event["best_score"] = self._record_store.commit_if_higher(current_score)
             self._game_over_flag = False
+        app = App.get_running_app()
+        user_dir = Path(getattr(app, "user_data_dir", ".")) if app else Path(".")
+        if hasattr(self, "_gameplay_runtime"):
+            self._gameplay_runtime.dump_recording(user_dir / "debug" / "last_run.json")
+        if hasattr(self, "_gameplay_runtime") and self._gameplay_runtime.profiler is not None:
+            profile_file = user_dir / "debug" / "frame_profile.json"
+            self._gameplay_runtime.dump_profile(profile_file)
+            print(f"[Profile] {profile_file}", flush=True)
+        if hasattr(self, "_gameplay_runtime") and self._gameplay_runtime.latency is not None:
+            latency_file = user_dir / "debug" / "input_latency.json"
+            self._gameplay_runtime.dump_latency(latency_file)
+            print(f"[Latency] {latency_file}", flush=True)
         if hasattr(self, "_gameplay_runtime"):
             self._gameplay_runtime.stop()
         if hasattr(self, "_game_control") and hasattr(self, "_gameplay_surface"):
             self._game_control.detach(self._gameplay_surface)
         self.touch_controls_hide()
         self._reset_hud_state()
-        if hasattr(self, "_stop_hud_sync"):
-            self._stop_hud_sync()
-        counters.dump_to_print()
+        event["gameover_count"] = counters.gameover_count
+        event["receive_click_count"] = counters.receive_click_count
+        session_journal.log(BACK, **event)
         self._reset_to_first_start_state()
         if self.manager:
             self.manager.back()
@@ -400,6 +391,7 @@ class GameScreenView(MDScreen):
         if hasattr(self, "_rating_session"):
             current_score = int(getattr(getattr(self, "_state", None), "current_y_loop", 0))
             self._rating_session.on_press_start(time.time(), current_score)
+        session_journal.log(START)
         self._time_manager.time_game_session(reset=True)
         self._time_manager.time_gameplay(reset=True)
         self._time_manager.time_game_session(start=True)
@@ -410,8 +402,6 @@ class GameScreenView(MDScreen):
             self._game_control.attach(self._gameplay_surface)
         self._game_over_flag = False
         self._reset_hud_state()
-        if hasattr(self, "_start_hud_sync"):
-            self._start_hud_sync()
         self._hide_hud_for_play()
         self.touch_controls_show()
         if hasattr(self, "_gameplay_runtime"):
@@ -2,4 +2,12 @@
 RU: Константы экрана загрузки приложения.
 """
 
-LOAD_DURATION_SEC: float = 5.0
+SLICE_BUDGET_SEC: float = 0.008
+"""EN: Main-thread time per frame the preloader may spend on UI tasks.
+RU: Время главного потока за кадр, которое загрузчик тратит на UI-задачи.
+"""
+
+BACKGROUND_GIF: str = "assets/img/outerspace-55.gif"
+"""EN: Game background GIF whose atlas is prepared during loading.
+RU: GIF фона игры, атлас которого готовится во время загрузки.
+"""
@@ -4,64 +4,63 @@ RU: Представление стартового экрана загрузк
 
 from pathlib import Path
 
-from kivy.clock import Clock
 from kivy.lang import Builder
 from kivymd.uix.screen import MDScreen
 
 from data.user_cache.user_session import UserSession
-from uix.screens.load_app.constants import LOAD_DURATION_SEC
+from uix.debug.startup_trace import startup_trace
+from uix.screens.load_app.preloader import Preloader
 from uix.screens.routes import LOGIN, START
 
 KV_PATH = Path(__file__).with_name("load_app.kv")
 Builder.load_file(str(KV_PATH))
 
 
+def initial_route() -> str:
+    """EN: Route shown after loading: START when logged in, else LOGIN.
+    RU: Маршрут после загрузки: START при входе в аккаунт, иначе LOGIN.
+    """
+    return START if UserSession().is_logged_in() else LOGIN
+
+
 class LoadAppScreenView(MDScreen):
-    """EN: Simple timed loading screen with progress bar.
-    RU: Простой экран загрузки с таймером и индикатором прогресса.
+    """EN: Loading screen whose progress bar follows the real preloader.
+    RU: Экран загрузки, индикатор которого следует за реальным загрузчиком.
     """
 
-    def __init__(self, manager, **kwargs):
-        """EN: Store manager and initialize timer state.
-        RU: Сохранить менеджер и инициализировать состояние таймера.
+    def __init__(self, manager, preloader: Preloader = None, **kwargs):
+        """EN: Store manager and the preloader to run on enter.
+        RU: Сохранить менеджер и загрузчик, запускаемый при входе.
         """
         super().__init__(**kwargs)
         self._manager = manager
-        self._ev = None
-        self._t = 0.0
+        self._preloader = preloader or Preloader()
 
     def on_enter(self, *args):
-        """EN: Start progress ticking when screen is shown.
-        RU: Запустить обновление прогресса при входе на экран.
+        """EN: Start preloading when the screen is shown.
+        RU: Запустить предзагрузку при входе на экран.
         """
-        self._t = 0.0
+        if self._preloader.is_started():
+            return
         self.ids.pb.value = 0
-        if self._ev:
-            self._ev.cancel()
-        self._ev = Clock.schedule_interval(self._tick, 1 / 30)
+        self._preloader.start(self._on_progress, self._on_loaded)
 
     def on_leave(self, *args):
-        """EN: Stop ticking when leaving the loading screen.
-        RU: Остановить таймер при уходе с экрана загрузки.
+        """EN: Stop preloading if the screen is left early.
+        RU: Остановить предзагрузку при досрочном уходе с экрана.
         """
-        if self._ev:
-            self._ev.cancel()
-            self._ev = None
+        self._preloader.cancel()
 
-    def _tick(self, dt):
-        """EN: Advance progress and navigate after timeout.
-        RU: Обновить прогресс и перейти после завершения таймера.
+    def _on_progress(self, progress: float) -> None:
+        """EN: Mirror preloader progress on the bar.
+        RU: Отобразить прогресс загрузчика на индикаторе.
         """
-        self._t += dt
-        p = min(self._t / LOAD_DURATION_SEC, 1.0)
-        self.ids.pb.value = p * 100.0
+        self.ids.pb.value = progress * 100.0
 
-        if p >= 1.0:
-            if self._ev:
-                self._ev.cancel()
-                self._ev = None
-
-            initial = START if UserSession().is_logged_in() else LOGIN
-            self._manager.go(initial, push_history=False)
-            return False
-        return True
+    def _on_loaded(self) -> None:
+        """EN: Navigate to START or LOGIN once everything is loaded.
+        RU: Перейти на START или LOGIN после завершения загрузки.
+        """
+        self._manager.go(initial_route(), push_history=False)
+        startup_trace.mark("preload_done")
+        startup_trace.finish()
@@ -0,0 +1,154 @@
+"""EN: Staged startup preloader that reports real progress.
+RU: Поэтапный загрузчик при старте, сообщающий реальный прогресс.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from time import perf_counter
+from typing import Callable, Deque, List, Optional, Tuple
+
+from kivy.clock import Clock
+from kivy.logger import Logger
+
+from uix.screens.load_app.constants import SLICE_BUDGET_SEC
+
+Task = Tuple[str, Callable[[], None]]
+
+
+class Preloader:
+    """EN: Run UI tasks in Clock slices and file tasks on a worker thread.
+    RU: Выполняет UI-задачи кусками по Clock, а файловые задачи в рабочем потоке.
+
+    EN: UI tasks (widget construction, KV parsing) run in order on the main
+    thread, as many per frame as fit SLICE_BUDGET_SEC. Threaded tasks must
+    not touch widgets or graphics. A failing task is logged and counted as
+    done so startup never blocks.
+    RU: UI-задачи (создание виджетов, разбор KV) идут по порядку в главном
+    потоке, сколько помещается в SLICE_BUDGET_SEC за кадр. Потоковые задачи
+    не должны трогать виджеты и графику. Упавшая задача логируется и
+    считается выполненной, чтобы старт не блокировался.
+    """
+
+    def __init__(self) -> None:
+        """EN: Create empty task queues.
+        RU: Создать пустые очереди задач.
+        """
+        self._ui_tasks: Deque[Task] = deque()
+        self._thread_tasks: List[Task] = []
+        self._total = 0
+        self._done = 0
+        self._ev = None
+        self._started = False
+        self._cancelled = False
+        self._on_progress: Optional[Callable[[float], None]] = None
+        self._on_done: Optional[Callable[[], None]] = None
+
+    @property
+    def progress(self) -> float:
+        """EN: Fraction of finished tasks in 0..1.
+        RU: Доля завершённых задач в диапазоне 0..1.
+        """
+        return self._done / self._total if self._total else 1.0
+
+    def is_started(self) -> bool:
+        """EN: Return True once start() was called.
+        RU: Вернуть True после вызова start().
+        """
+        return self._started
+
+    def add(self, name: str, fn: Callable[[], None], *, threaded: bool = False) -> None:
+        """EN: Queue a task; threaded tasks run off the main thread.
+        RU: Добавить задачу; потоковые задачи выполняются вне главного потока.
+        """
+        if threaded:
+            self._thread_tasks.append((name, fn))
+        else:
+            self._ui_tasks.append((name, fn))
+        self._total += 1
+
+    def start(self, on_progress: Callable[[float], None], on_done: Callable[[], None]) -> None:
+        """EN: Start running tasks; callbacks are invoked on the main thread.
+        RU: Запустить выполнение задач; колбэки вызываются в главном потоке.
+        """
+        if self._started:
+            return
+        self._started = True
+        self._on_progress = on_progress
+        self._on_done = on_done
+        if self._thread_tasks:
+            threading.Thread(target=self._run_threaded, name="Preloader", daemon=True).start()
+        self._ev = Clock.schedule_once(self._run_slice, 0)
+
+    def cancel(self) -> None:
+        """EN: Stop scheduling further slices and ignore pending results.
+        RU: Прекратить планирование кусков и игнорировать оставшиеся результаты.
+        """
+        self._cancelled = True
+        if self._ev is not None:
+            self._ev.cancel()
+            self._ev = None
+
+    def _run_slice(self, _dt) -> None:
+        """EN: Run UI tasks until the slice budget is spent.
+        RU: Выполнять UI-задачи, пока не исчерпан бюджет куска.
+        """
+        self._ev = None
+        if self._cancelled:
+            return
+        started = perf_counter()
+        while self._ui_tasks:
+            name, fn = self._ui_tasks.popleft()
+            self._run_task(name, fn)
+            self._task_done()
+            if perf_counter() - started >= SLICE_BUDGET_SEC:
+                break
+        if self._ui_tasks:
+            self._ev = Clock.schedule_once(self._run_slice, 0)
+        elif not self._total:
+            self._finish()
+
+    def _run_threaded(self) -> None:
+        """EN: Worker loop; each completion is posted back to the main thread.
+        RU: Цикл рабочего потока; каждое завершение передаётся в главный поток.
+        """
+        for name, fn in self._thread_tasks:
+            if self._cancelled:
+                return
+            self._run_task(name, fn)
+            Clock.schedule_once(lambda _dt: self._task_done(), 0)
+
+    @staticmethod
+    def _run_task(name: str, fn: Callable[[], None]) -> None:
+        """EN: Run one task, logging its time or its failure without raising.
+        RU: Выполнить одну задачу, записав в лог её время или ошибку без исключения.
+        """
+        started = perf_counter()
+        try:
+            fn()
+        except Exception as exc:
+            Logger.exception("Preloader: task %s failed: %s", name, exc)
+            return
+        Logger.debug("Preloader: %s %.1f ms", name, (perf_counter() - started) * 1000.0)
+
+    def _task_done(self) -> None:
+        """EN: Count a finished task on the main thread and report progress.
+        RU: Учесть завершённую задачу в главном потоке и сообщить прогресс.
+        """
+        if self._cancelled:
+            return
+        self._done += 1
+        if self._on_progress is not None:
+            self._on_progress(self.progress)
+        if self._done >= self._total:
+            self._finish()
+
+    def _finish(self) -> None:
+        """EN: Call the done callback once, after every task has finished.
+        RU: Вызвать колбэк завершения один раз, после окончания всех задач.
+        """
+        if self._on_done is not None:
+            on_done = self._on_done
+            self._on_done = None
+            on_done()
@@ -5,13 +5,9 @@ RU: РљРѕРЅС‚СЂРѕР»Р»РµСЂ РґР»СЏ РґРµР№СЃС
 from dataclasses import dataclass, field
 from typing import Callable
 
-from ads.payment.balance_store import BalanceStore
 from ads.payment.payment_math import format_balance
-from data.gameplay.rating_storage import RatingStorage
-from data.gameplay.record_store import RecordStore
 from data.format.phone import format_phone, normalize_phone
-from data.user_cache.user_cache_reader import get_user_cache
-from data.user_cache.user_session import UserSession
+from data.store.profile_snapshot import get_profile_snapshot
 from kivymd.app import MDApp
 from manager.lang.lang_manager import t
 from uix.screens.routes import PROFILE_CHANGE
@@ -58,19 +54,17 @@ class ProfileScreenController:
         """EN: Fill profile top bar and card texts on refresh.
         RU: Р—Р°РїРѕР»РЅРёС‚СЊ РІРµСЂС…РЅСЋСЋ РїР°РЅРµР»СЊ Рё С‚РµРєСЃС‚С‹ РєР°СЂС‚РѕС‡РµРє РїСЂРѕС„РёР»СЏ РїСЂРё РѕР±РЅРѕРІР»РµРЅРёРё.
         """
-        best = RecordStore().get_best_score()
+        snapshot = get_profile_snapshot()
+        best = snapshot.best_score
         no_data = t("common.no_data")
 
         if hasattr(self._app, "is_logged_in"):
-            self._app.is_logged_in = UserSession().is_logged_in()
+            self._app.is_logged_in = snapshot.is_logged_in
         if getattr(self._app, "is_logged_in", False):
-            cache = get_user_cache() or {}
-            login_raw = cache.get("login") or ""
-            login_val = login_raw.strip() or no_data
-            phone_val = cache.get("phone") or no_data
-            tg_val = cache.get("tg") or no_data
-            email = UserSession().get_email()
-            val_email = email if email else no_data
+            login_val = snapshot.login or no_data
+            phone_val = snapshot.phone or no_data
+            tg_val = snapshot.tg or no_data
+            val_email = snapshot.email if snapshot.email else no_data
             view.ids.profile_top_right_login.text = login_val
         else:
             login_val = no_data
@@ -87,10 +81,8 @@ class ProfileScreenController:
         view.ids.lbl_tg_title.text = t("profile.card.tg")
 
         view.ids.val_record.text = str(best)
-        points = RatingStorage().load_points()
-        view.rating_text = str(points)
-        balance = BalanceStore().get_balance()
-        view.ids.val_balance.text = format_balance(balance)
+        view.rating_text = str(snapshot.rating_points)
+        view.ids.val_balance.text = format_balance(snapshot.balance)
         view.ids.val_email.text = val_email
         if phone_val == no_data:
             view.ids.val_phone.text = no_data
@@ -4,7 +4,7 @@ RU: Представление экрана профиля.
 
 from pathlib import Path
 
-from data.gameplay.record_storage import RecordStorage
+from data.store.profile_snapshot import get_profile_snapshot
 from kivy.lang import Builder
 from kivy.properties import StringProperty
 from kivymd.uix.screen import MDScreen
@@ -69,4 +69,4 @@ class ProfileScreenView(MDScreen):
         self.ids.back_btn.on_release = controller.back
         self.ids.payout_btn.on_release = controller.payout
         self.ids.login_btn.on_release = controller.login
-        self.best_score_text = str(RecordStorage().get_best_score())
+        self.best_score_text = str(get_profile_snapshot().best_score)
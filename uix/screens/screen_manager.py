@@ -2,20 +2,32 @@
 RU: Менеджер экранов для регистрации и навигации.
 """
 
+from typing import Callable, Dict, Tuple
+
+from kivy.clock import Clock
 from kivymd.uix.screenmanager import MDScreenManager
 
+PREWARM_DELAY_SEC: float = 0.5
+"""EN: Idle delay before each pre-warmed screen is built after navigation.
+RU: Пауза простоя перед построением каждого прогреваемого экрана после перехода.
+"""
+
 
 class AppScreenManager(MDScreenManager):
-    """EN: Minimal screen manager with register and go methods.
-    RU: Минимальный менеджер экранов с методами register и go.
+    """EN: Screen manager with register/go and a lazy screen registry.
+    RU: Менеджер экранов с register/go и ленивым реестром экранов.
     """
 
     def __init__(self, **kwargs) -> None:
-        """EN: Initialize manager with navigation history.
-        RU: Инициализировать менеджер с историей навигации.
+        """EN: Initialize manager with navigation history and lazy factories.
+        RU: Инициализировать менеджер с историей навигации и ленивыми фабриками.
         """
         super().__init__(**kwargs)
         self._history: list[str] = []
+        self._factories: Dict[str, Callable[[], object]] = {}
+        self._prewarm: Dict[str, Tuple[str, ...]] = {}
+        self._prewarm_queue: list[str] = []
+        self._prewarm_ev = None
 
     def register(self, screen) -> None:
         """EN: Register a screen instance.
@@ -23,13 +35,40 @@ class AppScreenManager(MDScreenManager):
         """
         self.add_widget(screen)
 
+    def register_lazy(self, name: str, factory: Callable[[], object], *, prewarm: Tuple[str, ...] = ()) -> None:
+        """EN: Register a factory that builds the screen on first navigation.
+        RU: Зарегистрировать фабрику, строящую экран при первом переходе.
+
+        EN: Routes in prewarm are built one by one in idle time after this
+        screen is shown.
+        RU: Маршруты из prewarm строятся по одному в простое после показа
+        этого экрана.
+        """
+        self._factories[name] = factory
+        self._prewarm[name] = tuple(prewarm)
+
+    def ensure(self, name: str) -> bool:
+        """EN: Build a lazily registered screen if needed; True if it exists.
+        RU: Построить лениво зарегистрированный экран при необходимости;
+        True, если экран существует.
+        """
+        if self.has_screen(name):
+            return True
+        factory = self._factories.pop(name, None)
+        if factory is None:
+            return False
+        self.add_widget(factory())
+        return True
+
     def go(self, name: str, *, push_history: bool = True) -> None:
-        """EN: Switch to the screen by name.
-        RU: Переключиться на экран по имени.
+        """EN: Switch to the screen by name, building it on first use.
+        RU: Переключиться на экран по имени, построив его при первом обращении.
         """
+        self.ensure(name)
         if push_history and self.current:
             self._history.append(self.current)
         self.current = name
+        self._schedule_prewarm(name)
 
     def back(self) -> None:
         """EN: Navigate to the previous screen if available.
@@ -39,3 +78,25 @@ class AppScreenManager(MDScreenManager):
             return
         prev = self._history.pop()
         self.go(prev, push_history=False)
+
+    def _schedule_prewarm(self, name: str) -> None:
+        """EN: Queue likely next screens of the route for idle building.
+        RU: Поставить вероятные следующие экраны маршрута в очередь прогрева.
+        """
+        if self._prewarm_ev is not None:
+            self._prewarm_ev.cancel()
+            self._prewarm_ev = None
+        self._prewarm_queue = [route for route in self._prewarm.get(name, ()) if route in self._factories]
+        if self._prewarm_queue:
+            self._prewarm_ev = Clock.schedule_once(self._prewarm_next, PREWARM_DELAY_SEC)
+
+    def _prewarm_next(self, _dt) -> None:
+        """EN: Build one queued screen and reschedule for the rest.
+        RU: Построить один экран из очереди и запланировать остальные.
+        """
+        self._prewarm_ev = None
+        if not self._prewarm_queue:
+            return
+        self.ensure(self._prewarm_queue.pop(0))
+        if self._prewarm_queue:
+            self._prewarm_ev = Clock.schedule_once(self._prewarm_next, PREWARM_DELAY_SEC)
@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""
+On-disk sprite-sheet atlas cache for animated GIFs.
+
+EN: Bakes every GIF frame into one packed RGBA sprite sheet stored as a raw
+blob plus a JSON manifest, keyed by the GIF path, size and mtime. Later
+launches memory-map the blob and upload it as a single texture, skipping
+Pillow decoding and palette conversion entirely. The sheet is kept within
+ATLAS_MAX_BYTES by downscaling frames; a GIF that would have to shrink below
+ATLAS_MIN_SCALE is not baked and keeps streaming through the bounded
+texture ring. Kivy-free, so baking can run on a worker thread.
+RU: Запекает все кадры GIF в один упакованный RGBA-спрайтшит, который
+хранится как сырой blob и JSON-манифест с ключом по пути, размеру и mtime
+GIF. Следующие запуски отображают blob в память и загружают его одной
+текстурой, полностью пропуская декодирование Pillow и конвертацию палитры.
+Спрайтшит укладывается в ATLAS_MAX_BYTES за счёт уменьшения кадров; GIF,
+который пришлось бы уменьшить сильнее ATLAS_MIN_SCALE, не запекается и
+продолжает проигрываться потоком через ограниченное кольцо текстур. Без
+Kivy, поэтому запекание может идти в рабочем потоке.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+from uix.widgets.gif_stream import frame_duration
+
+# EN: Bumped when the blob layout changes, so stale caches are ignored.
+# RU: Увеличивается при смене формата blob, чтобы старый кэш игнорировался.
+ATLAS_VERSION = 2
+
+# EN: Largest atlas side in pixels; 4096 is safe on most mobile GPUs.
+# Frames are downscaled when the grid would not fit.
+# RU: Максимальная сторона атласа в пикселях; 4096 безопасно для
+# большинства мобильных GPU. Кадры уменьшаются, если сетка не помещается.
+ATLAS_MAX_SIZE = 4096
+
+# EN: Upper bound of the RGBA sheet in bytes, i.e. of the texture memory the
+# atlas holds for the whole session (and of its blob on disk).
+# RU: Верхняя граница RGBA-спрайтшита в байтах, т.е. памяти текстуры,
+# которую атлас держит всю сессию (и размера blob на диске).
+ATLAS_MAX_BYTES = 16 * 1024 * 1024
+
+# EN: Smallest frame scale worth baking; below it the GIF keeps streaming.
+# RU: Наименьший масштаб кадра, при котором атлас имеет смысл; ниже GIF
+# продолжает проигрываться потоком.
+ATLAS_MIN_SCALE = 0.5
+
+_bake_lock = threading.Lock()
+
+
+def cache_key(path: Path) -> str:
+    """
+    Return a cache key from the file path, size and mtime and the atlas format.
+
+    EN: Only stats the file, so it is cheap enough for the UI thread.
+    RU: Возвращает ключ кэша по пути, размеру и mtime файла и формату
+    атласа. Только читает stat файла, поэтому достаточно дёшев для UI-потока.
+    """
+    st = path.stat()
+    key = (
+        f"v{ATLAS_VERSION}:{ATLAS_MAX_SIZE}:{ATLAS_MAX_BYTES}:{ATLAS_MIN_SCALE}:"
+        f"{path.resolve()}:{st.st_size}:{st.st_mtime_ns}"
+    )
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def _grid(frame_count: int, frame_w: int, frame_h: int):
+    """
+    Return (columns, rows, frame_w, frame_h) fitting the atlas limits, or None.
+
+    EN: Picks the smallest column count that keeps the largest frame scale
+    within ATLAS_MAX_SIZE and ATLAS_MAX_BYTES. Returns None when frames would
+    have to shrink below ATLAS_MIN_SCALE.
+    RU: Возвращает (колонки, ряды, ширина кадра, высота кадра) в пределах
+    лимитов атласа или None. Выбирает наименьшее число колонок с наибольшим
+    масштабом кадра в пределах ATLAS_MAX_SIZE и ATLAS_MAX_BYTES. Возвращает
+    None, если кадры пришлось бы уменьшить сильнее ATLAS_MIN_SCALE.
+    """
+    best = None
+    for columns in range(1, frame_count + 1):
+        rows = -(-frame_count // columns)
+        scale = min(
+            1.0,
+            ATLAS_MAX_SIZE / (columns * frame_w),
+            ATLAS_MAX_SIZE / (rows * frame_h),
+            (ATLAS_MAX_BYTES / (columns * rows * frame_w * frame_h * 4)) ** 0.5,
+        )
+        if best is None or scale > best[0] + 1e-9:
+            best = (scale, columns, rows)
+    scale, columns, rows = best
+    if scale < ATLAS_MIN_SCALE:
+        return None
+    return columns, rows, max(1, int(frame_w * scale)), max(1, int(frame_h * scale))
+
+
+class GifAtlas:
+    """
+    Baked atlas manifest plus lazily mapped pixel data.
+
+    EN: Frame i sits at column i % columns and row i // columns counted from
+    the top; the blob is stored bottom-up so it uploads without flipping.
+    RU: Манифест запечённого атласа и лениво отображаемые пиксели. Кадр i
+    лежит в колонке i % columns и ряду i // columns сверху; blob хранится
+    снизу вверх, поэтому загружается без переворота.
+    """
+
+    def __init__(self, blob_path: Path, meta: dict) -> None:
+        """
+        Keep the manifest fields; the blob is not opened yet.
+
+        RU: Сохраняет поля манифеста; blob пока не открывается.
+        """
+        self.blob_path = blob_path
+        self.width = int(meta["width"])
+        self.height = int(meta["height"])
+        self.frame_width = int(meta["frame_width"])
+        self.frame_height = int(meta["frame_height"])
+        self.columns = int(meta["columns"])
+        self.frame_count = int(meta["frame_count"])
+        self.durations = [float(d) for d in meta["durations"]]
+
+    def frame_rect(self, index: int):
+        """
+        Return (x, y, w, h) of a frame in texture space with y from the bottom.
+
+        RU: Возвращает (x, y, w, h) кадра в координатах текстуры, y снизу.
+        """
+        column = index % self.columns
+        row = index // self.columns
+        x = column * self.frame_width
+        y = self.height - (row + 1) * self.frame_height
+        return x, y, self.frame_width, self.frame_height
+
+    def read_pixels(self, consume) -> None:
+        """
+        Memory-map the blob and pass a read-only buffer to consume().
+
+        EN: The mapping is closed as soon as consume() returns, so callers
+        must copy or upload the data inside the callback.
+        RU: Отображает blob в память и передаёт буфер только для чтения в
+        consume(). Отображение закрывается сразу после возврата consume(),
+        поэтому данные нужно скопировать или загрузить внутри колбэка.
+        """
+        with self.blob_path.open("rb") as fh:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    consume(view)
+                finally:
+                    view.release()
+
+
+def _paths(cache_dir: Path, digest: str):
+    return cache_dir / f"{digest}.rgba", cache_dir / f"{digest}.json"
+
+
+def load_atlas(src: Path, cache_dir: Path) -> Optional[GifAtlas]:
+    """
+    Return the cached atlas for src, or None if it was not baked yet.
+
+    EN: The manifest is written last during baking, so its presence means
+    the blob is complete; a size mismatch is treated as a miss.
+    RU: Возвращает атлас из кэша для src или None, если он ещё не запечён.
+    Манифест пишется последним, поэтому его наличие означает, что blob
+    записан полностью; несовпадение размера считается промахом.
+    """
+    blob_path, meta_path = _paths(cache_dir, cache_key(src))
+    if not meta_path.exists() or not blob_path.exists():
+        return None
+    try:
+        with meta_path.open("r", encoding="utf-8") as fh:
+            atlas = GifAtlas(blob_path, json.load(fh))
+    except (OSError, ValueError, KeyError):
+        return None
+    if blob_path.stat().st_size != atlas.width * atlas.height * 4:
+        return None
+    return atlas
+
+
+def bake_atlas(src: Path, cache_dir: Path) -> Optional[GifAtlas]:
+    """
+    Decode every frame of src into a sprite sheet and store it in cache_dir.
+
+    EN: Writes the blob and manifest through temp files and os.replace, and
+    removes atlases of older GIF contents from the same directory. Bakes are
+    serialized, and an atlas baked meanwhile by another thread is reused.
+    Returns None without writing anything when the GIF does not fit the
+    atlas limits (see _grid).
+    RU: Декодирует все кадры src в спрайтшит и сохраняет его в cache_dir.
+    Пишет blob и манифест через временные файлы и os.replace и удаляет из
+    той же папки атласы старых версий GIF. Запекания идут по очереди, и
+    атлас, запечённый тем временем другим потоком, переиспользуется.
+    Возвращает None и ничего не пишет, если GIF не укладывается в лимиты
+    атласа (см. _grid).
+    """
+    with _bake_lock:
+        atlas = load_atlas(src, cache_dir)
+        if atlas is not None:
+            return atlas
+        return _bake(src, cache_dir)
+
+
+def _bake(src: Path, cache_dir: Path) -> Optional[GifAtlas]:
+    from PIL import Image
+
+    digest = cache_key(src)
+    blob_path, meta_path = _paths(cache_dir, digest)
+
+    with Image.open(str(src)) as im:
+        frame_count = int(getattr(im, "n_frames", 1))
+        grid = _grid(frame_count, im.width, im.height)
+        if grid is None:
+            return None
+        columns, rows, frame_w, frame_h = grid
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        sheet = Image.new("RGBA", (columns * frame_w, rows * frame_h))
+        durations = []
+        for index in range(frame_count):
+            im.seek(index)
+            frame = im.convert("RGBA")
+            if frame.size != (frame_w, frame_h):
+                frame = frame.resize((frame_w, frame_h), Image.BILINEAR)
+            sheet.paste(frame, ((index % columns) * frame_w, (index // columns) * frame_h))
+            durations.append(frame_duration(im))
+
+    tmp_blob = blob_path.with_suffix(".rgba.tmp")
+    with tmp_blob.open("wb") as fh:
+        fh.write(sheet.transpose(Image.FLIP_TOP_BOTTOM).tobytes())
+    os.replace(tmp_blob, blob_path)
+
+    meta = {
+        "source": src.name,
+        "width": sheet.width,
+        "height": sheet.height,
+        "frame_width": frame_w,
+        "frame_height": frame_h,
+        "columns": columns,
+        "frame_count": frame_count,
+        "durations": durations,
+    }
+    tmp_meta = meta_path.with_suffix(".json.tmp")
+    with tmp_meta.open("w", encoding="utf-8") as fh:
+        json.dump(meta, fh, ensure_ascii=False, indent=2)
+    os.replace(tmp_meta, meta_path)
+
+    for stale in cache_dir.iterdir():
+        if stale.stem.split(".")[0] != digest and stale.suffix in (".rgba", ".json", ".tmp"):
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+    return GifAtlas(blob_path, meta)
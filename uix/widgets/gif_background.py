@@ -2,25 +2,58 @@
 """
 GIF background widget for the Game screen.
 
-EN: Plays an animated GIF stretched to the full screen.
-RU: Проигрывает анимированный GIF, растянутый на весь экран.
+EN: Plays an animated GIF stretched to the full screen. When a baked atlas
+is cached under user_data_dir, frames are regions of one texture (at most
+ATLAS_MAX_BYTES) and no decoding happens. Otherwise, and for GIFs too large
+for the atlas limits, in streaming mode frames are decoded on a worker
+thread and shown through a small ring of reused textures, while the atlas
+is baked in the background for the next launch.
+RU: Проигрывает анимированный GIF, растянутый на весь экран. Если в
+user_data_dir есть запечённый атлас, кадры являются регионами одной
+текстуры (не больше ATLAS_MAX_BYTES) и декодирования нет. Иначе, а также
+для GIF, не укладывающихся в лимиты атласа, в потоковом режиме кадры
+декодируются в рабочем потоке и показываются через небольшое кольцо
+переиспользуемых текстур, а атлас запекается в фоне для следующего запуска.
 """
 
 from __future__ import annotations
 
 import os
+import threading
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional
 
+from kivy.app import App
 from kivy.clock import Clock
 from kivy.graphics import Color, Rectangle
 from kivy.graphics.texture import Texture
 from kivy.logger import Logger
-from kivy.properties import BooleanProperty, StringProperty
+from kivy.properties import BooleanProperty, NumericProperty, StringProperty
 from kivy.resources import resource_add_path, resource_find
 from kivy.uix.widget import Widget
 
-from PIL import Image
+from uix.widgets.gif_atlas import bake_atlas, load_atlas
+from uix.widgets.gif_stream import GifFrameStream, frame_duration
+
+# EN: Delay before polling the decoder again when it is behind playback.
+# RU: Задержка перед повторным опросом декодера, если он отстаёт.
+STREAM_RETRY_SEC = 0.005
+
+
+def prepare_gif_atlas(source: str) -> None:
+    """
+    Bake the atlas for a GIF source ahead of time, if it is not cached yet.
+
+    EN: Safe to call from a worker thread; used by the startup preloader.
+    RU: Заранее запекает атлас для GIF, если его ещё нет в кэше. Можно
+    вызывать из рабочего потока; используется стартовым загрузчиком.
+    """
+    p = GifBackground._resolve_path(source)
+    if p is None:
+        return
+    cache_dir = GifBackground._atlas_cache_dir(p)
+    if cache_dir is not None:
+        bake_atlas(p, cache_dir)
 
 
 class GifBackground(Widget):
@@ -34,26 +67,41 @@ class GifBackground(Widget):
     source = StringProperty("")
     loop = BooleanProperty(True)
     reverse = BooleanProperty(False)
+    streaming = BooleanProperty(True)
+    atlas = BooleanProperty(True)
+    cache_frames = NumericProperty(8)
 
     def __init__(self, **kwargs):
         """
         Initialize widget and its canvas rectangle.
 
-        EN: Binds size/pos and source loading.
-        RU: Привязывает размер/позицию и загрузку по source.
+        EN: Binds size/pos and source loading. Loading is deferred to the
+        next frame, so properties set together in kv (source, then reverse)
+        start playback once with their final values.
+        RU: Привязывает размер/позицию и загрузку по source. Загрузка
+        откладывается до следующего кадра, поэтому свойства, заданные вместе
+        в kv (source, затем reverse), запускают воспроизведение один раз с
+        итоговыми значениями.
         """
         super().__init__(**kwargs)
         self._frames: List[Texture] = []
         self._durations: List[float] = []
         self._idx: int = 0
         self._ev = None
+        self._path: Optional[Path] = None
+        self._stream: Optional[GifFrameStream] = None
+        self._ring: List[Texture] = []
+        self._ring_pos: int = 0
+        self._cached: Dict[int, Texture] = {}
+        self._cached_durations: Dict[int, float] = {}
+        self._trigger_load = Clock.create_trigger(self._on_source)
 
         with self.canvas.before:
             self._color = Color(1, 1, 1, 1)
             self._rect = Rectangle(pos=self.pos, size=self.size)
 
         self.bind(pos=self._sync_rect, size=self._sync_rect)
-        self.bind(source=self._on_source)
+        self.bind(source=self._trigger_load)
 
     def _sync_rect(self, *_):
         self._rect.pos = self.pos
@@ -63,6 +111,9 @@ class GifBackground(Widget):
         if self._ev is not None:
             self._ev.cancel()
             self._ev = None
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream = None
 
     def on_parent(self, *_):
         """
@@ -78,6 +129,11 @@ class GifBackground(Widget):
         self._load_gif(self.source)
 
     def on_reverse(self, *_args) -> None:
+        if self._trigger_load.is_triggered:
+            return
+        if self._stream is not None or (self._path is not None and not self._frames):
+            self._start_stream(self._path)
+            return
         if not self._frames:
             return
         self._cancel()
@@ -87,16 +143,8 @@ class GifBackground(Widget):
         self._rect.texture = self._frames[0]
         self._schedule_next()
 
-    def _load_gif(self, src: str) -> None:
-        self._cancel()
-        self._frames.clear()
-        self._durations.clear()
-        self._idx = 0
-
-        if not src:
-            self._rect.texture = None
-            return
-
+    @staticmethod
+    def _resolve_path(src: str) -> Optional[Path]:
         root = Path(__file__).resolve().parents[2]
         resource_add_path(str(root))
         resource_add_path(str(root / "assets"))
@@ -116,15 +164,106 @@ class GifBackground(Widget):
 
         if not resolved:
             Logger.warning("GifBackground: file not found: %s", src)
-            self._rect.texture = None
-            return
+            return None
 
         p = Path(resolved)
         if not p.is_file():
             Logger.warning("GifBackground: file not found: %s", p)
+            return None
+        return p
+
+    def _load_gif(self, src: str) -> None:
+        self._cancel()
+        self._frames.clear()
+        self._durations.clear()
+        self._idx = 0
+        self._path = None
+
+        if not src:
             self._rect.texture = None
             return
 
+        p = self._resolve_path(src)
+        if p is None:
+            self._rect.texture = None
+            return
+
+        self._path = p
+        cache_dir = self._atlas_cache_dir(p) if self.atlas else None
+        if cache_dir is not None and self._load_atlas(p, cache_dir):
+            return
+        if self.streaming:
+            self._start_stream(p)
+        else:
+            self._load_all_frames(p)
+        if cache_dir is not None:
+            self._bake_atlas_async(p, cache_dir)
+
+    @staticmethod
+    def _atlas_cache_dir(p: Path) -> Optional[Path]:
+        """
+        Return `<user_data_dir>/cache/gif_atlas/<gif name>` or None without an app.
+
+        RU: Возвращает `<user_data_dir>/cache/gif_atlas/<имя gif>` или None без приложения.
+        """
+        app = App.get_running_app()
+        if app is None:
+            return None
+        return Path(getattr(app, "user_data_dir", ".")) / "cache" / "gif_atlas" / p.stem
+
+    def _load_atlas(self, p: Path, cache_dir: Path) -> bool:
+        """
+        Play from a baked atlas if one is cached for the current GIF content.
+
+        EN: The blob is memory-mapped and uploaded once; every frame is a
+        region of that texture, so playback only switches UVs.
+        RU: Проигрывает из запечённого атласа, если он есть в кэше для
+        текущего содержимого GIF. Blob отображается в память и загружается
+        один раз; каждый кадр — регион этой текстуры, поэтому при
+        воспроизведении меняются только UV.
+        """
+        try:
+            atlas = load_atlas(p, cache_dir)
+            if atlas is None:
+                return False
+            tex = Texture.create(size=(atlas.width, atlas.height), colorfmt="rgba")
+            atlas.read_pixels(lambda buf: tex.blit_buffer(buf, colorfmt="rgba", bufferfmt="ubyte"))
+        except Exception as exc:
+            Logger.warning("GifBackground: atlas load failed: %s", exc)
+            return False
+
+        self._frames = [tex.get_region(*atlas.frame_rect(i)) for i in range(atlas.frame_count)]
+        self._durations = list(atlas.durations)
+        if self.reverse:
+            self._frames.reverse()
+            self._durations.reverse()
+        Logger.info("GifBackground: loaded %s frames from atlas %s", atlas.frame_count, atlas.blob_path.name)
+        self._rect.texture = self._frames[0]
+        self._schedule_next()
+        return True
+
+    @staticmethod
+    def _bake_atlas_async(p: Path, cache_dir: Path) -> None:
+        """
+        Bake the atlas on a daemon thread for the next launch.
+
+        RU: Запекает атлас в фоновом потоке для следующего запуска.
+        """
+        def bake() -> None:
+            try:
+                atlas = bake_atlas(p, cache_dir)
+                if atlas is None:
+                    Logger.info("GifBackground: %s exceeds atlas limits, keeps streaming", p.name)
+                    return
+                Logger.info("GifBackground: baked atlas %s", atlas.blob_path.name)
+            except Exception as exc:
+                Logger.warning("GifBackground: atlas bake failed: %s", exc)
+
+        threading.Thread(target=bake, name="GifAtlasBake", daemon=True).start()
+
+    def _load_all_frames(self, p: Path) -> None:
+        from PIL import Image
+
         try:
             im = Image.open(str(p))
         except Exception as exc:
@@ -143,8 +282,7 @@ class GifBackground(Widget):
 
                 self._frames.append(tex)
 
-                dur_ms = int(im.info.get("duration", 50))
-                self._durations.append(max(0.01, dur_ms / 1000.0))
+                self._durations.append(frame_duration(im))
 
                 im.seek(im.tell() + 1)
         except EOFError:
@@ -158,6 +296,9 @@ class GifBackground(Widget):
             Logger.warning("GifBackground: no frames decoded")
             self._rect.texture = None
             return
+        if self.reverse:
+            self._frames.reverse()
+            self._durations.reverse()
 
         Logger.info("GifBackground: loaded %s frames from %s", len(self._frames), p.name)
         self._rect.texture = self._frames[0]
@@ -182,3 +323,114 @@ class GifBackground(Widget):
 
         self._rect.texture = self._frames[self._idx]
         self._schedule_next()
+
+    def _start_stream(self, p: Path) -> None:
+        """
+        Show the first frame synchronously and stream the rest.
+
+        EN: Frame 0 is decoded on the UI thread so the background appears
+        immediately; the worker then feeds frames in playback order.
+        RU: Показывает первый кадр синхронно и подгружает остальные потоком.
+        Кадр 0 декодируется в UI-потоке, чтобы фон появился сразу; затем
+        рабочий поток подаёт кадры в порядке воспроизведения.
+        """
+        from PIL import Image
+
+        self._cancel()
+        self._ring = []
+        self._ring_pos = 0
+        self._cached = {}
+        self._cached_durations = {}
+        try:
+            with Image.open(str(p)) as im:
+                frame_count = int(getattr(im, "n_frames", 1))
+                first = im.convert("RGBA")
+                first_data = first.tobytes()
+                first_size = first.size
+                first_duration = frame_duration(im)
+        except Exception as exc:
+            Logger.exception("GifBackground: open failed: %s", exc)
+            self._rect.texture = None
+            return
+
+        self._show_stream_frame(0, first_data, first_size, first_duration, frame_count)
+        self._stream = GifFrameStream(
+            str(p),
+            frame_count,
+            reverse=self.reverse,
+            loop=self.loop,
+            window=self._window(),
+            skip_first=not self.reverse,
+        )
+        self._stream.start()
+        Logger.info("GifBackground: streaming %s frames from %s", frame_count, p.name)
+        self._ev = Clock.schedule_once(self._next_stream_frame, first_duration)
+
+    def _window(self) -> int:
+        return max(2, int(self.cache_frames))
+
+    def _show_stream_frame(self, index: int, data: bytes, size, duration: float, frame_count: int) -> None:
+        """
+        Blit a decoded frame into a reused texture and display it.
+
+        EN: If the whole GIF fits in cache_frames, textures are kept per
+        frame index so later loops replay them without decoding; otherwise
+        frames rotate through a fixed ring of textures.
+        RU: Копирует декодированный кадр в переиспользуемую текстуру и
+        показывает её. Если весь GIF помещается в cache_frames, текстуры
+        хранятся по индексу кадра и следующие циклы идут без декодирования;
+        иначе кадры ходят по фиксированному кольцу текстур.
+        """
+        if frame_count <= self._window():
+            tex = self._cached.get(index)
+            if tex is None:
+                tex = self._create_texture(size)
+                self._cached[index] = tex
+            self._cached_durations[index] = duration
+        else:
+            if len(self._ring) < self._window():
+                self._ring.append(self._create_texture(size))
+            tex = self._ring[self._ring_pos]
+            self._ring_pos = (self._ring_pos + 1) % len(self._ring)
+        tex.blit_buffer(data, colorfmt="rgba", bufferfmt="ubyte")
+        self._rect.texture = tex
+
+    @staticmethod
+    def _create_texture(size) -> Texture:
+        tex = Texture.create(size=size, colorfmt="rgba")
+        tex.flip_vertical()
+        return tex
+
+    def _next_stream_frame(self, _dt) -> None:
+        stream = self._stream
+        if stream is None:
+            return
+        item = stream.poll()
+        if item is False:
+            self._ev = Clock.schedule_once(self._next_stream_frame, STREAM_RETRY_SEC)
+            return
+        if item is None:
+            self._stream = None
+            stream.stop()
+            return
+
+        index, data, size, duration = item
+        self._show_stream_frame(index, data, size, duration, stream.frame_count)
+        if self.loop and len(self._cached_durations) == stream.frame_count:
+            self._play_from_cache(index)
+            return
+        self._ev = Clock.schedule_once(self._next_stream_frame, duration)
+
+    def _play_from_cache(self, current: int) -> None:
+        """
+        Stop the decoder and keep looping over the cached textures.
+
+        RU: Останавливает декодер и продолжает цикл по кэшированным текстурам.
+        """
+        self._stream.stop()
+        self._stream = None
+        order = sorted(self._cached, reverse=self.reverse)
+        self._frames = [self._cached[index] for index in order]
+        self._durations = [self._cached_durations[index] for index in order]
+        self._idx = order.index(current)
+        self._schedule_next()
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""
+Background GIF frame decoder for streaming playback.
+
+EN: Decodes GIF frames on a worker thread in playback order into a bounded
+queue of raw RGBA buffers. Textures are still created on the UI thread by
+the consumer, so memory is bounded by the queue size, not the frame count.
+RU: Декодирует кадры GIF в рабочем потоке в порядке воспроизведения в
+ограниченную очередь сырых RGBA-буферов. Текстуры создаёт потребитель в
+UI-потоке, поэтому память ограничена размером очереди, а не числом кадров.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Iterator, Optional, Tuple
+
+from kivy.logger import Logger
+
+# EN: Seconds the worker waits on a full queue before re-checking stop.
+# RU: Сколько секунд поток ждёт на полной очереди до проверки остановки.
+PUT_TIMEOUT_SEC = 0.25
+
+# EN: Decoded RGBA bytes reverse playback may keep at once. Pillow can only
+# seek GIFs forward, so every reverse block re-decodes from frame 0; bigger
+# blocks mean fewer blocks and far fewer decodes per pass. When the whole
+# GIF fits, it is decoded once and later passes replay it from memory.
+# RU: Сколько декодированных RGBA-байт может держать обратное
+# воспроизведение. Pillow перематывает GIF только вперёд, поэтому каждый
+# обратный блок декодируется заново с кадра 0; крупные блоки означают
+# меньше блоков и намного меньше декодирований за проход. Если весь GIF
+# помещается, он декодируется один раз, а следующие проходы идут из памяти.
+REVERSE_BUFFER_MAX_BYTES = 32 * 1024 * 1024
+
+Frame = Tuple[int, bytes, Tuple[int, int], float]
+
+
+def frame_duration(im) -> float:
+    """
+    Return the current frame duration in seconds with a 10 ms floor.
+
+    RU: Возвращает длительность текущего кадра в секундах, не меньше 10 мс.
+    """
+    dur_ms = int(im.info.get("duration", 50))
+    return max(0.01, dur_ms / 1000.0)
+
+
+class GifFrameStream:
+    """
+    Worker-thread GIF decoder feeding a bounded frame queue.
+
+    EN: Reverse playback decodes forward blocks sized to
+    REVERSE_BUFFER_MAX_BYTES (at least `window` frames) and emits each block
+    backwards, so it never holds more than one block in memory. A GIF that
+    fits in one block is decoded once and replayed from the kept frames.
+    RU: Декодер GIF в рабочем потоке, наполняющий ограниченную очередь.
+    Обратное воспроизведение декодирует блоки размером в
+    REVERSE_BUFFER_MAX_BYTES (не меньше `window` кадров) вперёд и выдаёт
+    каждый блок задом наперёд, не держа в памяти больше одного блока. GIF,
+    помещающийся в один блок, декодируется один раз и проигрывается из
+    сохранённых кадров.
+    """
+
+    def __init__(self, path: str, frame_count: int, reverse: bool, loop: bool, window: int, skip_first: bool) -> None:
+        """
+        Prepare the queue and worker thread without starting it.
+
+        EN: skip_first drops the first playback frame of the first pass when
+        the caller already displayed it synchronously.
+        RU: Готовит очередь и рабочий поток, не запуская его. skip_first
+        пропускает первый кадр первого прохода, если вызывающий код уже
+        показал его синхронно.
+        """
+        self.frame_count = frame_count
+        self._path = path
+        self._reverse = reverse
+        self._loop = loop
+        self._window = max(2, int(window))
+        self._skip_first = skip_first
+        self._reversed: Optional[list] = None
+        self._queue: "queue.Queue[Optional[Frame]]" = queue.Queue(maxsize=self._window)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="GifFrameStream", daemon=True)
+
+    def start(self) -> None:
+        """
+        Start the worker thread.
+
+        RU: Запускает рабочий поток.
+        """
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Ask the worker to exit; it stops at its next queue operation.
+
+        RU: Просит поток завершиться; он остановится на следующей операции
+        с очередью.
+        """
+        self._stop.set()
+
+    def poll(self):
+        """
+        Return the next decoded frame, None at end of stream, or False if not ready.
+
+        RU: Возвращает следующий декодированный кадр, None в конце потока или
+        False, если кадр ещё не готов.
+        """
+        try:
+            return self._queue.get_nowait()
+        except queue.Empty:
+            return False
+
+    def _run(self) -> None:
+        """
+        Decode frames until stopped, the stream ends, or decoding fails.
+
+        RU: Декодирует кадры до остановки, конца потока или ошибки.
+        """
+        from PIL import Image
+
+        try:
+            with Image.open(self._path) as im:
+                first_pass = True
+                while not self._stop.is_set():
+                    frames = self._iter_playback(im)
+                    if first_pass and self._skip_first:
+                        next(frames, None)
+                    for frame in frames:
+                        if not self._put(frame):
+                            return
+                    first_pass = False
+                    if not self._loop:
+                        break
+        except Exception as exc:
+            Logger.exception("GifFrameStream: decode failed: %s", exc)
+        self._put(None)
+
+    def _put(self, item) -> bool:
+        """
+        Put an item into the queue, returning False once stopped.
+
+        RU: Кладёт элемент в очередь; возвращает False после остановки.
+        """
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=PUT_TIMEOUT_SEC)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _iter_playback(self, im) -> Iterator[Frame]:
+        """
+        Yield one pass of frames in playback order.
+
+        RU: Выдаёт один проход кадров в порядке воспроизведения.
+        """
+        if not self._reverse:
+            for index in range(self.frame_count):
+                yield self._decode(im, index)
+            return
+        if self._reversed is not None:
+            yield from self._reversed
+            return
+        frame_bytes = max(1, im.width * im.height * 4)
+        block_size = max(self._window, REVERSE_BUFFER_MAX_BYTES // frame_bytes)
+        if block_size >= self.frame_count and self._loop:
+            self._reversed = [self._decode(im, index) for index in range(self.frame_count)]
+            self._reversed.reverse()
+            yield from self._reversed
+            return
+        end = self.frame_count
+        while end > 0:
+            start = max(0, end - block_size)
+            block = [self._decode(im, index) for index in range(start, end)]
+            yield from reversed(block)
+            end = start
+
+    def _decode(self, im, index: int) -> Frame:
+        """
+        Seek to a frame and return it as raw RGBA bytes.
+
+        RU: Переходит к кадру и возвращает его как сырые RGBA-байты.
+        """
+        im.seek(index)
+        frame = im.convert("RGBA")
+        return index, frame.tobytes(), frame.size, frame_duration(im)